@@ -0,0 +1,93 @@
+-- MariaDB 10.5+ 스키마
+-- UUID 는 BINARY(16) 으로 저장 (models/column_types.py GUID 타입과 동일)
+-- 기본값(UUID / UNIX timestamp)은 애플리케이션에서 채움
+
+-- 사용자 정보 테이블
+CREATE TABLE users (
+    id BINARY(16) NOT NULL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    role_id BIGINT NULL,
+    nickname VARCHAR(50) NULL,
+    bio TEXT NULL,
+    birth DATE NULL,
+    gender VARCHAR(10) NULL,
+    login_type VARCHAR(20) NULL,
+    login_yn BOOLEAN NULL DEFAULT true,
+    created_at_unix BIGINT NULL,
+    created_at DATETIME NULL DEFAULT CURRENT_TIMESTAMP,
+    user_ip_id BIGINT NULL,
+    user_agent_id BIGINT NULL,
+    updated_at DATETIME NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    user_image_id BIGINT NULL,
+    user_setting_id BIGINT NULL,
+    INDEX ix_users_user_setting_id (user_setting_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자 로그인 로그 테이블
+CREATE TABLE user_login_log (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    user_id BINARY(16) NOT NULL,
+    event_type VARCHAR(20) DEFAULT 'LOGIN',
+    event_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    event_at_unix BIGINT NOT NULL DEFAULT (UNIX_TIMESTAMP()),
+    ip_id BIGINT NOT NULL,
+    user_agent_id BIGINT NOT NULL,
+    INDEX ix_user_login_log_user_id (user_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자 IP 테이블
+CREATE TABLE user_ip (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    ip_str VARCHAR(255) NOT NULL,
+    INDEX ix_user_ip_ip_str (ip_str)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자 에이전트 테이블
+CREATE TABLE user_agent (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    user_agent_str VARCHAR(255) NOT NULL,
+    INDEX ix_user_agent_user_agent_str (user_agent_str)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자 인증 테이블
+CREATE TABLE user_certification (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    user_uuid BINARY(16) NULL,
+    code VARCHAR(10) NOT NULL,
+    recipient VARCHAR(255) NOT NULL,
+    use_yn BOOLEAN NULL DEFAULT false,
+    created_at DATETIME NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at_unix BIGINT NULL DEFAULT (UNIX_TIMESTAMP()),
+    expires_at DATETIME NOT NULL,
+    expires_at_unix BIGINT NULL DEFAULT (UNIX_TIMESTAMP()),
+    INDEX ix_user_certification_recipient_created_at (recipient, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자 이미지 테이블
+CREATE TABLE user_image (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    uuid BINARY(16) NOT NULL,
+    size BIGINT NULL,
+    path VARCHAR(255) NULL,
+    name VARCHAR(255) NULL,
+    extension VARCHAR(50) NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자 설정 테이블
+CREATE TABLE user_setting (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    dark_mode VARCHAR(1) NULL DEFAULT 'N',
+    editor_mode VARCHAR(50) NULL,
+    lang_cd VARCHAR(255) NULL DEFAULT 'ko'
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 사용자 이벤트 로그 테이블
+CREATE TABLE user_event_log (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    user_uuid BINARY(16) NOT NULL,
+    event_type VARCHAR(255) NOT NULL,
+    event_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    event_at_unix BIGINT NULL,
+    INDEX ix_user_event_log_user_uuid (user_uuid)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
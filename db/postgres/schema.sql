@@ -80,4 +80,12 @@ CREATE TABLE user_event_log (
 	event_type VARCHAR(255)	NOT NULL,
 	event_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
 	event_at_unix BIGINT NULL
-);
\ No newline at end of file
+);
+
+-- 조회용 인덱스 (기존 DB 는 `flask db upgrade` 로 CONCURRENTLY 생성)
+CREATE INDEX ix_users_user_setting_id ON users (user_setting_id);
+CREATE INDEX ix_user_login_log_user_id ON user_login_log (user_id);
+CREATE INDEX ix_user_ip_ip_str ON user_ip (ip_str);
+CREATE INDEX ix_user_agent_user_agent_str ON user_agent (user_agent_str);
+CREATE INDEX ix_user_certification_recipient_created_at ON user_certification (recipient, created_at);
+CREATE INDEX ix_user_event_log_user_uuid ON user_event_log (user_uuid);
@@ -1,43 +1,30 @@
+from typing import Optional
 from flask import Flask, make_response, request
-from extensions import init_extensions, tunnel_manager
+from extensions import db, init_extensions, tunnel_manager, warm_up_pool
 import config
 import settings
 from swagger_config import api
+from utils.db_router import is_replica_bind
+from utils.index_checker import index_checker
 
-def create_app() -> Flask:
+def create_app(config_name: Optional[str] = None) -> Flask:
+    """애플리케이션 팩토리 (SSH 터널 / DB 연결은 첫 사용 시점에 생성)"""
     
     app = Flask(__name__)
     
-    should_use_tunnel = config.Config.should_use_tunnel()
-
-    if should_use_tunnel:
-        try:
-            # 기본 터널 생성
-            tunnel = tunnel_manager.get_or_create_tunnel("default")
-            if tunnel:
-                # 터널링을 통해 데이터베이스 설정 업데이트
-                config.update_database_config_with_tunnel(tunnel.local_port)
-                
-                # Flask 앱 설정
-                app.config.from_object(config.config['default'])
-                init_extensions(app)
-                
-                print(f"SSH 터널링을 통해 데이터베이스에 연결됨: localhost:{tunnel.local_port}")
-                
-            else:
-                raise Exception("SSH 터널링 생성 실패")
-                
-        except Exception as e:
-            print(f"SSH 터널링 설정 실패: {str(e)}")
-            print("기본 데이터베이스 연결을 사용합니다.")
-            # SSH 터널링 실패 시 기본 설정 사용
-            app.config.from_object(config.config['default'])
-            init_extensions(app)
-    else:
-        # 기본 설정 사용 (SSH 터널링 비활성화 시)
-        print("SSH 터널링 비활성화 시 기본 설정 사용")
-        app.config.from_object(config.config['default'])
-        init_extensions(app)
+    config_class = config.config[config_name or 'default']
+    app.config.from_object(config_class)
+    config_class.init_app(app)
+    init_extensions(app)
+    
+    if config_class.should_use_tunnel():
+        # 엔진은 연결 없이 생성되므로 터널은 첫 DB 연결 시점에 생성
+        with app.app_context():
+            for bind_key, engine in db.engines.items():
+                # 읽기 복제본은 터널 없이 직접 연결
+                if is_replica_bind(bind_key):
+                    continue
+                tunnel_manager.attach_to_engine(engine, "default")
     
     # @app.before_request
     # def handle_options_request():
@@ -58,9 +45,11 @@ def create_app() -> Flask:
     register_blueprints(app)
     return app
 
-app = create_app()
-
 if __name__ == '__main__':
+    app = create_app()
+    warm_up_pool(app)
+    index_checker.check(app)
+    
     print(" ### CloakBox API 서버를 시작합니다. ###")
     print(" ### 서버 주소: http://0.0.0.0:" + str(settings.DEV_PORT) + " ###")
     print(" ### Swagger 문서: http://0.0.0.0:" + str(settings.DEV_PORT) + "/api/docs ###")
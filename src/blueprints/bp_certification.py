@@ -21,6 +21,7 @@ from service.certification_logic.certification_service import (
     cleanup_expired_codes
 )
 from service.user_logic.user_service import create_user_token
+from service.query_logic.cached_queries import find_login_log, find_user_by_email
 from datetime import datetime
 import time
 from utils import func
@@ -29,7 +30,7 @@ certification_bp = Blueprint("certification", __name__, url_prefix=f'/{settings.
 
 def create_user_login_log(user_id: int, user_ip_id: int, user_agent_id: int) -> None:
     """사용자 로그인 로그 생성 또는 업데이트"""
-    existing_log = UserLoginLog.query.filter_by(user_id=user_id).first()
+    existing_log = find_login_log(user_id)
     
     if existing_log:
         existing_log.event_at = datetime.now()
@@ -181,7 +182,7 @@ class VerifyCertificationCode(Resource):
                 )
             
             # 사용자 조회
-            user = User.query.filter_by(email=verification_data.email).first()
+            user = find_user_by_email(verification_data.email)
             
             # 응답 데이터 구조
             response_data: Dict[str, Any] = {
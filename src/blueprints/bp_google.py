@@ -3,7 +3,6 @@ from flask_restx import Resource
 from extensions import db, app_logger
 from models.user_model.user import User
 from models.user_model.user_login_log import UserLoginLog
-from models.user_model.user_setting import UserSetting
 import settings
 from swagger_config import google_ns
 from models.google_model.google_schemas import (
@@ -19,7 +18,10 @@ from models.google_model.google_schemas import (
     google_debug_success_model
 )
 from utils.google_manager import GoogleManager
-from service.user_logic.user_service import create_user_token
+from utils.oauth_state_manager import oauth_state_manager
+from utils.circuit_breaker import ProviderUnavailableError
+from service.user_logic.user_service import create_user_token, upsert_social_user
+from service.query_logic.cached_queries import find_login_log
 from datetime import datetime
 import time
 from utils import func
@@ -28,7 +30,7 @@ google_bp = Blueprint('google', __name__, url_prefix=f'/{settings.API_PREFIX}')
 
 def create_user_login_log(user_id, user_ip_id, user_agent_id):
     """사용자 로그인 로그 생성 또는 업데이트"""
-    existing_log = UserLoginLog.query.filter_by(user_id=user_id).first()
+    existing_log = find_login_log(user_id)
     
     if existing_log:
         existing_log.event_at = datetime.now()
@@ -47,49 +49,22 @@ def create_or_update_user_google(google_user_info, user_ip_id, user_agent_id):
     """구글 사용자 생성 또는 업데이트"""
     email = google_user_info['email'].lower()
     name = google_user_info.get('name', '')
-    picture = google_user_info.get('picture', '')
     
-    user = User.query.filter_by(email=email).first()
-    is_need_info = False
-    
-    if not user:
-        # 새 사용자 생성
-        is_need_info = True
-        
-        new_user_setting = UserSetting(
-            dark_mode='N',
-            editor_mode='light',
-            lang_cd='ko'
-        )
-        
-        db.session.add(new_user_setting)
-        db.session.flush()
-        
-        user = User(
-            name=name or email.split('@')[0],
-            email=email,
-            nickname=name or email.split('@')[0],
-            gender='',
-            bio='',
-            login_type='google',
-            user_ip_id=user_ip_id,
-            user_agent_id=user_agent_id,
-            user_setting_id=new_user_setting.id
-        )
-        db.session.add(user)
-        db.session.flush()
-    else:
-        # 기존 사용자 정보 업데이트
-        user.user_ip_id = user_ip_id
-        user.user_agent_id = user_agent_id
-        user.login_type = 'google'
-        if name and not user.name:
-            user.name = name
-    
-    return user, is_need_info
+    return upsert_social_user(
+        email=email,
+        name=name or email.split('@')[0],
+        nickname=name or email.split('@')[0],
+        login_type='google',
+        user_ip_id=user_ip_id,
+        user_agent_id=user_agent_id,
+        update_name=name
+    )
 
-def process_google_login(code, request_obj):
+def process_google_login(code, request_obj, state=None):
     """구글 로그인 공통 처리"""
+    # state 검증 및 PKCE verifier 조회 (1회용)
+    state_data = oauth_state_manager.validate_callback('google', state)
+    
     # 사용자 IP와 User-Agent 정보 저장
     user_ip_id = func.get_user_ip(request_obj, db)
     user_agent_id = func.get_user_agent(request_obj, db)
@@ -97,7 +72,7 @@ def process_google_login(code, request_obj):
     google_manager = GoogleManager()
     
     # 1. 토큰 교환
-    token_data = google_manager.exchange_code_for_token(code)
+    token_data = google_manager.exchange_code_for_token(code, state_data.get('code_verifier'))
     access_token = token_data.get('access_token')
     
     # 2. 구글 사용자 정보 조회
@@ -150,6 +125,7 @@ class GoogleLogin(Resource):
                 return error_response
             
             code = request.json.get('code')
+            state = request.json.get('state')
             
             # 필수 필드 검증
             is_valid, error_response = func.validate_required_fields(
@@ -159,7 +135,7 @@ class GoogleLogin(Resource):
                 return error_response
             
             # 구글 로그인 처리
-            result = process_google_login(code, request)
+            result = process_google_login(code, request, state)
             
             app_logger.info(f"구글 로그인 성공: {result['google_info']['email']}")
             return {
@@ -173,6 +149,9 @@ class GoogleLogin(Resource):
                 }
             }, 200
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"구글 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"구글 로그인 실패: {str(e)}")
             return func.create_error_response(str(e), "GOOGLE_LOGIN_FAILED", 401)
@@ -201,13 +180,14 @@ class GoogleAuth(Resource):
             prompt = request.json.get('prompt', 'consent select_account')
             
             google_manager = GoogleManager()
-            auth_url = google_manager.get_auth_url(scope=scope, prompt=prompt)
+            auth_url, state = google_manager.get_auth_url(scope=scope, prompt=prompt)
             
             return {
                 "status": "success",
                 "message": "구글 인증 URL이 생성되었습니다.",
                 "data": {
                     "auth_url": auth_url,
+                    "state": state,
                     "scope": scope,
                     "prompt": prompt
                 }
@@ -230,12 +210,13 @@ class GoogleCallback(Resource):
         """구글 인증 코드를 GET 방식으로 받아서 직접 토큰 처리"""
         try:
             code = request.args.get('code')
+            state = request.args.get('state')
             
             if not code:
                 return redirect(f"{settings.GOOGLE_FRONTEND_CALLBACK_URL}?error=authorization_code_required")
             
             # 구글 로그인 처리
-            result = process_google_login(code, request)
+            result = process_google_login(code, request, state)
             
             # 토큰을 쿠키에 설정하고 프론트엔드로 리디렉트
             response = make_response(redirect(settings.GOOGLE_FRONTEND_CALLBACK_URL))
@@ -280,6 +261,7 @@ class GoogleCallback(Resource):
                 return error_response
             
             code = request.json.get('code')
+            state = request.json.get('state')
             
             is_valid, error_response = func.validate_required_fields(
                 request.json, ['code']
@@ -288,7 +270,7 @@ class GoogleCallback(Resource):
                 return error_response
             
             # 구글 로그인 처리
-            result = process_google_login(code, request)
+            result = process_google_login(code, request, state)
             
             # 토큰을 헤더로 설정
             response = make_response({
@@ -305,6 +287,9 @@ class GoogleCallback(Resource):
             
             return response
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"구글 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"구글 토큰 교환 실패: {str(e)}")
             return func.create_error_response(str(e), "TOKEN_EXCHANGE_FAILED", 401)
@@ -353,6 +338,9 @@ class GoogleTokenRefresh(Resource):
                 }
             }, 200
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"구글 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"구글 토큰 갱신 실패: {str(e)}")
             return func.create_error_response(str(e), "TOKEN_REFRESH_FAILED", 401)
@@ -2,7 +2,6 @@ from flask import Blueprint, request, jsonify, make_response, redirect
 from flask_restx import Resource
 from extensions import db, app_logger
 from models.user_model.user import User
-from models.user_model.user_setting import UserSetting
 import settings
 from swagger_config import kakao_ns
 from models.kakao_model.kakao_schemas import (
@@ -16,11 +15,15 @@ from models.kakao_model.kakao_schemas import (
     kakao_user_info_success_model,
     kakao_send_message_model,
     kakao_send_message_success_model,
+    kakao_friends_model,
+    kakao_friends_success_model,
     kakao_debug_model,
     kakao_debug_success_model
 )
 from utils.kakao_manager import KaKaoManager
-from service.user_logic.user_service import create_user_token
+from utils.oauth_state_manager import oauth_state_manager
+from utils.circuit_breaker import ProviderUnavailableError
+from service.user_logic.user_service import create_user_token, upsert_social_user
 from datetime import datetime
 import time
 from utils import func
@@ -32,47 +35,21 @@ def create_or_update_user_kakao(kakao_account, user_ip_id, user_agent_id):
     email = kakao_account['email'].lower()
     nickname = kakao_account.get('profile', {}).get('nickname', '')
     
-    user = User.query.filter_by(email=email).first()
-    is_need_info = False
-    
-    if not user:
-        # 새 사용자 생성
-        is_need_info = True
-        
-        new_user_setting = UserSetting(
-            dark_mode='N',
-            editor_mode='light',
-            lang_cd='ko'
-        )
-        
-        db.session.add(new_user_setting)
-        db.session.flush()
-        
-        user = User(
-            name=nickname or email.split('@')[0],
-            email=email,
-            nickname=nickname or email.split('@')[0],
-            gender='',
-            bio='',
-            login_type='kakao',
-            user_ip_id=user_ip_id,
-            user_agent_id=user_agent_id,
-            user_setting_id=new_user_setting.id
-        )
-        db.session.add(user)
-        db.session.flush()
-    else:
-        # 기존 사용자 정보 업데이트
-        user.user_ip_id = user_ip_id
-        user.user_agent_id = user_agent_id
-        user.login_type = 'kakao'
-        if nickname and not user.nickname:
-            user.nickname = nickname
-    
-    return user, is_need_info
+    return upsert_social_user(
+        email=email,
+        name=nickname or email.split('@')[0],
+        nickname=nickname or email.split('@')[0],
+        login_type='kakao',
+        user_ip_id=user_ip_id,
+        user_agent_id=user_agent_id,
+        update_nickname=nickname
+    )
 
-def process_kakao_login(code, request_obj):
+def process_kakao_login(code, request_obj, state=None):
     """카카오 로그인 공통 처리"""
+    # state 검증 및 PKCE verifier 조회 (1회용)
+    state_data = oauth_state_manager.validate_callback('kakao', state)
+    
     # 사용자 IP와 User-Agent 정보 저장
     user_ip_id = func.get_user_ip(request_obj, db)
     user_agent_id = func.get_user_agent(request_obj, db)
@@ -80,7 +57,7 @@ def process_kakao_login(code, request_obj):
     kakao_manager = KaKaoManager()
     
     # 1. 토큰 교환
-    token_data = kakao_manager.exchange_code_for_token(code)
+    token_data = kakao_manager.exchange_code_for_token(code, state_data.get('code_verifier'))
     access_token = token_data.get('access_token')
     
     # 2. 카카오 사용자 정보 조회
@@ -132,6 +109,7 @@ class KakaoLogin(Resource):
                 return error_response
             
             code = request.json.get('code')
+            state = request.json.get('state')
             
             # 필수 필드 검증
             is_valid, error_response = func.validate_required_fields(
@@ -141,7 +119,7 @@ class KakaoLogin(Resource):
                 return error_response
             
             # 카카오 로그인 처리
-            result = process_kakao_login(code, request)
+            result = process_kakao_login(code, request, state)
             
             app_logger.info(f"카카오 로그인 성공: {result['kakao_info']['email']}")
             return {
@@ -155,6 +133,9 @@ class KakaoLogin(Resource):
                 }
             }, 200
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"카카오 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"카카오 로그인 실패: {str(e)}")
             return func.create_error_response(str(e), "KAKAO_LOGIN_FAILED", 401)
@@ -183,13 +164,14 @@ class KakaoAuth(Resource):
             prompt = request.json.get('prompt', 'login')
             
             kakao_manager = KaKaoManager()
-            auth_url = kakao_manager.get_auth_url(scope=scope, prompt=prompt)
+            auth_url, state = kakao_manager.get_auth_url(scope=scope, prompt=prompt)
             
             return {
                 "status": "success",
                 "message": "카카오 인증 URL이 생성되었습니다.",
                 "data": {
                     "auth_url": auth_url,
+                    "state": state,
                     "scope": scope,
                     "prompt": prompt
                 }
@@ -212,12 +194,13 @@ class KakaoCallback(Resource):
         """카카오 인증 코드를 GET 방식으로 받아서 직접 토큰 처리"""
         try:
             code = request.args.get('code')
+            state = request.args.get('state')
             
             if not code:
                 return redirect(f"{settings.KAKAO_FRONTEND_CALLBACK_URL}?error=authorization_code_required")
             
             # 카카오 로그인 처리
-            result = process_kakao_login(code, request)
+            result = process_kakao_login(code, request, state)
             
             # 토큰을 쿠키에 설정하고 프론트엔드로 리디렉트
             response = make_response(redirect(settings.KAKAO_FRONTEND_CALLBACK_URL))
@@ -262,6 +245,7 @@ class KakaoCallback(Resource):
                 return error_response
             
             code = request.json.get('code')
+            state = request.json.get('state')
             
             is_valid, error_response = func.validate_required_fields(
                 request.json, ['code']
@@ -270,7 +254,7 @@ class KakaoCallback(Resource):
                 return error_response
             
             # 카카오 로그인 처리
-            result = process_kakao_login(code, request)
+            result = process_kakao_login(code, request, state)
             
             # 토큰을 헤더로 설정
             response = make_response({
@@ -287,6 +271,9 @@ class KakaoCallback(Resource):
             
             return response
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"카카오 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"카카오 토큰 교환 실패: {str(e)}")
             return func.create_error_response(str(e), "TOKEN_EXCHANGE_FAILED", 401)
@@ -335,6 +322,9 @@ class KakaoTokenRefresh(Resource):
                 }
             }, 200
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"카카오 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"카카오 토큰 갱신 실패: {str(e)}")
             return func.create_error_response(str(e), "TOKEN_REFRESH_FAILED", 401)
@@ -415,6 +405,8 @@ class KakaoSendMessage(Resource):
             message = request.json.get('message')
             link_url = request.json.get('link_url')
             friend_uuid = request.json.get('friend_uuid')
+            friend_uuids = request.json.get('friend_uuids')
+            to_all_friends = request.json.get('to_all_friends', False)
             
             is_valid, error_response = func.validate_required_fields(
                 request.json, ['access_token', 'message']
@@ -422,20 +414,51 @@ class KakaoSendMessage(Resource):
             if not is_valid:
                 return error_response
             
+            # 문자열을 list() 로 변환하면 글자 단위로 분리되므로 형식을 먼저 검증
+            if friend_uuid is not None and not (isinstance(friend_uuid, str) and friend_uuid.strip()):
+                return func.create_error_response(
+                    "friend_uuid는 비어 있지 않은 문자열이어야 합니다.", "INVALID_FRIEND_UUID", 400
+                )
+            if friend_uuids is not None and not (
+                isinstance(friend_uuids, list) and all(isinstance(uuid, str) and uuid.strip() for uuid in friend_uuids)
+            ):
+                return func.create_error_response(
+                    "friend_uuids는 비어 있지 않은 문자열 목록이어야 합니다.", "INVALID_FRIEND_UUIDS", 400
+                )
+            # 친구 대상 전송 요청 여부 (수신자가 없을 때 나에게 보내지 않도록 구분)
+            to_friends = bool(friend_uuid or friend_uuids or to_all_friends)
+            friend_uuids = friend_uuids or []
+            
             kakao_manager = KaKaoManager()
             
-            # 토큰 유효성 검사
-            if not kakao_manager.validate_token(access_token):
+            # 토큰 유효성 검사 (회원번호는 친구 목록 캐시 키로 사용)
+            try:
+                token_info = kakao_manager.get_token_info(access_token)
+            except Exception as e:
+                app_logger.error(f"토큰 유효성 검사 실패: {str(e)}")
                 return func.create_error_response("유효하지 않은 토큰입니다.", "INVALID_TOKEN", 401)
             
             success = False
             result_message = ""
+            batch_result = {}
             
             if friend_uuid:
-                # 친구에게 메시지 전송
-                success = kakao_manager.send_message_to_friend(
-                    access_token, friend_uuid, message, link_url
+                friend_uuids = [friend_uuid] + friend_uuids
+            
+            if to_all_friends:
+                # 캐시된 친구 UUID 목록 사용 (만료 시 첫 페이지로 재검증)
+                friend_uuids = friend_uuids + kakao_manager.get_friend_uuids(access_token, user_id=token_info.get('id'))
+            
+            if to_friends and not friend_uuids:
+                # 전체 친구 전송인데 메시지를 받을 수 있는 친구가 없는 경우
+                return func.create_error_response("메시지를 받을 친구가 없습니다.", "NO_RECEIVERS", 400)
+            
+            if friend_uuids:
+                # 친구에게 메시지 일괄 전송 (요청당 최대 5명)
+                batch_result = kakao_manager.send_message_to_friends(
+                    access_token, friend_uuids, message, link_url
                 )
+                success = bool(batch_result['successful_receiver_uuids']) and not batch_result['failed_receivers']
                 result_message = "친구에게 메시지 전송" + (" 성공" if success else " 실패")
             else:
                 # 나에게 메시지 전송
@@ -451,7 +474,8 @@ class KakaoSendMessage(Resource):
                     "success": success,
                     "message_sent": message,
                     "link_url": link_url,
-                    "friend_uuid": friend_uuid
+                    "friend_uuid": friend_uuid,
+                    **batch_result
                 }
             }, 200 if success else 500
             
@@ -463,6 +487,51 @@ class KakaoSendMessage(Resource):
                 500
             )
 
+@kakao_ns.route('/friends')
+class KakaoFriends(Resource):
+    @kakao_ns.expect(kakao_friends_model)
+    @kakao_ns.response(200, 'Success', kakao_friends_success_model)
+    @kakao_ns.response(400, 'Bad Request')
+    @kakao_ns.response(503, 'Service Unavailable')
+    @kakao_ns.response(500, 'Internal Server Error')
+    def post(self):
+        """카카오 친구 목록 페이지 조회"""
+        try:
+            is_valid, error_response = func.validate_request_json()
+            if not is_valid:
+                return error_response
+            
+            access_token = request.json.get('access_token')
+            
+            is_valid, error_response = func.validate_required_fields(
+                request.json, ['access_token']
+            )
+            if not is_valid:
+                return error_response
+            
+            offset = request.json.get('offset') or 0
+            limit = min(request.json.get('limit') or 100, 100)
+            
+            kakao_manager = KaKaoManager()
+            friend_page = kakao_manager.get_friend_page(access_token, offset=offset, limit=limit)
+            
+            return {
+                "status": "success",
+                "message": "친구 목록이 조회되었습니다.",
+                "data": friend_page
+            }, 200
+            
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"카카오 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
+        except Exception as e:
+            app_logger.error(f"카카오 친구 목록 조회 중 오류: {str(e)}")
+            return func.create_error_response(
+                f"카카오 친구 목록 조회 중 오류가 발생했습니다: {str(e)}",
+                "INTERNAL_SERVER_ERROR",
+                500
+            )
+
 @kakao_ns.route('/debug')
 class KakaoDebug(Resource):
     @kakao_ns.expect(kakao_debug_model)
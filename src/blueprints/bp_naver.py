@@ -3,7 +3,6 @@ from flask_restx import Resource
 from extensions import db, app_logger
 from models.user_model.user import User
 from models.user_model.user_login_log import UserLoginLog
-from models.user_model.user_setting import UserSetting
 import settings
 from swagger_config import naver_ns
 from models.naver_model.naver_schemas import (
@@ -19,7 +18,10 @@ from models.naver_model.naver_schemas import (
     naver_debug_success_model
 )
 from utils.naver_manager import NaverManager
-from service.user_logic.user_service import create_user_token
+from utils.oauth_state_manager import oauth_state_manager
+from utils.circuit_breaker import ProviderUnavailableError
+from service.user_logic.user_service import create_user_token, upsert_social_user
+from service.query_logic.cached_queries import find_login_log
 from datetime import datetime
 import time
 from utils import func
@@ -28,7 +30,7 @@ naver_bp = Blueprint("naver", __name__, url_prefix=f'/{settings.API_PREFIX}')
 
 def create_user_login_log(user_id, user_ip_id, user_agent_id):
     """사용자 로그인 로그 생성 또는 업데이트"""
-    existing_log = UserLoginLog.query.filter_by(user_id=user_id).first()
+    existing_log = find_login_log(user_id)
     
     if existing_log:
         existing_log.event_at = datetime.now()
@@ -49,49 +51,22 @@ def create_or_update_user(naver_response, user_ip_id, user_agent_id):
     nickname = naver_response.get('nickname', '')
     name = naver_response.get('name', '')
     
-    user = User.query.filter_by(email=email).first()
-    is_need_info = False
-    
-    if not user:
-        # 새 사용자 생성
-        is_need_info = True
-        
-        new_user_setting = UserSetting(
-            dark_mode='N',
-            editor_mode='light',
-            lang_cd='ko'
-        )
-        
-        db.session.add(new_user_setting)
-        db.session.flush()
-        
-        user = User(
-            name=name or nickname or email.split('@')[0],
-            email=email,
-            nickname=nickname or name or email.split('@')[0],
-            gender='',
-            bio='',
-            login_type='naver',
-            user_ip_id=user_ip_id,
-            user_agent_id=user_agent_id,
-            user_setting_id=new_user_setting.id
-        )
-        db.session.add(user)
-        db.session.flush()
-    else:
-        # 기존 사용자 정보 업데이트
-        user.user_ip_id = user_ip_id
-        user.user_agent_id = user_agent_id
-        user.login_type = 'naver'
-        if name and not user.name:
-            user.name = name
-        if nickname and not user.nickname:
-            user.nickname = nickname
-    
-    return user, is_need_info
+    return upsert_social_user(
+        email=email,
+        name=name or nickname or email.split('@')[0],
+        nickname=nickname or name or email.split('@')[0],
+        login_type='naver',
+        user_ip_id=user_ip_id,
+        user_agent_id=user_agent_id,
+        update_name=name,
+        update_nickname=nickname
+    )
 
 def process_naver_login(code, state, request_obj):
     """네이버 로그인 공통 처리"""
+    # 발급한 state인지 검증 (1회용)
+    oauth_state_manager.validate_callback('naver', state, required=True)
+    
     # 사용자 IP와 User-Agent 정보 저장
     user_ip_id = func.get_user_ip(request_obj, db)
     user_agent_id = func.get_user_agent(request_obj, db)
@@ -176,6 +151,9 @@ class NaverLogin(Resource):
                 }
             }, 200
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"네이버 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"네이버 로그인 실패: {str(e)}")
             return func.create_error_response(str(e), "NAVER_LOGIN_FAILED", 401)
@@ -313,6 +291,9 @@ class NaverCallback(Resource):
             
             return response
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"네이버 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"네이버 토큰 교환 실패: {str(e)}")
             return func.create_error_response(str(e), "TOKEN_EXCHANGE_FAILED", 401)
@@ -360,6 +341,9 @@ class NaverTokenRefresh(Resource):
                 }
             }, 200
             
+        except ProviderUnavailableError as e:
+            app_logger.warning(f"네이버 서비스 호출 차단: {str(e)}")
+            return func.create_error_response(str(e), "PROVIDER_UNAVAILABLE", 503)
         except ValueError as e:
             app_logger.error(f"네이버 토큰 갱신 실패: {str(e)}")
             return func.create_error_response(str(e), "TOKEN_REFRESH_FAILED", 401)
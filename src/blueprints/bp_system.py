@@ -1,4 +1,4 @@
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from flask_restx import Resource
 import constants
 import settings
@@ -6,10 +6,27 @@ from swagger_config import system_ns
 from models.system_model.system_schemas import (
     system_version_model,
     system_health_model,
+    system_liveness_model,
+    system_readiness_model,
+    system_circuit_breaker_model,
+    system_log_sampling_model,
+    system_log_sampling_update_model,
+    system_slow_query_model,
+    system_profiling_model,
+    system_profiling_update_model,
+    system_runtime_model,
     success_response_model,
     error_response_model
 )
 from extensions import app_logger
+from utils.circuit_breaker import circuit_breaker_manager
+from utils.hot_path_logger import hot_path_logger
+from utils.metrics_manager import metrics_registry
+from utils.slow_query_logger import slow_query_logger
+from utils.request_profiler import request_profiler
+from utils.health_checker import health_checker
+from utils.runtime_registry import runtime_registry
+from utils.auth_decorator import require_admin
 
 system_bp = Blueprint("system", __name__, url_prefix=f'/{settings.API_PREFIX}')
 
@@ -32,17 +49,298 @@ class SystemVersion(Resource):
 
 @system_ns.route('/health')
 class SystemHealth(Resource):
-    @system_ns.response(200, 'Success')
+    @system_ns.response(200, 'Success', system_health_model)
     def get(self):
-        """시스템 상태 확인"""
+        """시스템 상태 확인 (캐시된 점검 결과 요약)"""
         try:
+            status = health_checker.get_report()['status']
+            messages = {
+                "healthy": "시스템이 정상적으로 작동 중입니다.",
+                "degraded": "일부 외부 서비스에 문제가 있습니다.",
+                "unhealthy": "시스템이 요청을 처리할 수 없는 상태입니다."
+            }
             return {
-                "status": "healthy",
-                "message": "시스템이 정상적으로 작동 중입니다."
+                "status": status,
+                "message": messages.get(status, status)
             }
         except Exception as e:
             app_logger.error(f"시스템 상태 확인 중 오류가 발생했습니다: {str(e)}")
             return {
                 "status": "error",
-                "message": f"시스템 상태 확인 중 오류가 발생했습니다: {str(e)}"
-            }, 500
\ No newline at end of file
+                "message": "시스템 상태 확인 중 오류가 발생했습니다."
+            }, 500
+
+@system_ns.route('/health/live')
+class SystemLiveness(Resource):
+    @system_ns.response(200, 'Success', system_liveness_model)
+    def get(self):
+        """생존 확인 (외부 의존성 점검 없음)"""
+        return health_checker.liveness()
+
+@system_ns.route('/health/ready')
+class SystemReadiness(Resource):
+    @system_ns.response(200, 'Ready', system_readiness_model)
+    @system_ns.response(503, 'Not Ready', system_readiness_model)
+    def get(self):
+        """준비 상태 확인 (DB / 커넥션 풀 / SSH 터널 / 이메일 / 외부 제공자, 캐시된 결과)"""
+        try:
+            report = health_checker.get_public_report()
+            return report, 200 if report['ready'] else 503
+        except Exception as e:
+            app_logger.error(f"준비 상태 확인 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": "준비 상태 확인 중 오류가 발생했습니다."
+            }, 500
+
+@system_ns.route('/circuit-breakers')
+class SystemCircuitBreakers(Resource):
+    @system_ns.response(200, 'Success', system_circuit_breaker_model)
+    def get(self):
+        """외부 제공자 서킷 브레이커 / 벌크헤드 상태 조회"""
+        try:
+            return {
+                "status": "success",
+                "message": "서킷 브레이커 상태 조회가 완료되었습니다.",
+                "data": circuit_breaker_manager.snapshot()
+            }
+        except Exception as e:
+            app_logger.error(f"서킷 브레이커 상태 조회 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"서킷 브레이커 상태 조회 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+@system_ns.route('/metrics')
+class SystemMetrics(Resource):
+    @system_ns.response(200, 'Success')
+    @system_ns.produces(['text/plain'])
+    def get(self):
+        """엔드포인트별 지연 히스토그램 / 제공자 상태 메트릭 조회 (Prometheus 텍스트 형식)"""
+        try:
+            return Response(
+                metrics_registry.render_prometheus(),
+                content_type='text/plain; version=0.0.4; charset=utf-8'
+            )
+        except Exception as e:
+            app_logger.error(f"메트릭 조회 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"메트릭 조회 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+@system_ns.route('/log-sampling')
+class SystemLogSampling(Resource):
+    @system_ns.response(200, 'Success', system_log_sampling_model)
+    def get(self):
+        """hot path 로그 샘플링 설정 및 통계 조회"""
+        try:
+            return {
+                "status": "success",
+                "message": "로그 샘플링 설정 조회가 완료되었습니다.",
+                "data": hot_path_logger.snapshot()
+            }
+        except Exception as e:
+            app_logger.error(f"로그 샘플링 설정 조회 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"로그 샘플링 설정 조회 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+    @system_ns.doc(security='Bearer')
+    @system_ns.expect(system_log_sampling_update_model)
+    @system_ns.response(200, 'Success', system_log_sampling_model)
+    @system_ns.response(400, 'Bad Request', error_response_model)
+    @system_ns.response(401, 'Unauthorized', error_response_model)
+    @system_ns.response(403, 'Forbidden', error_response_model)
+    @require_admin
+    def put(self):
+        """hot path 로그 샘플링 비율 변경 (관리자)"""
+        try:
+            data = request.get_json(silent=True) or {}
+            default_rate = data.get('default_rate')
+            rates = data.get('rates') or {}
+
+            if not isinstance(rates, dict):
+                return {
+                    "status": "error",
+                    "message": "rates는 호출 지점별 비율 객체여야 합니다."
+                }, 400
+
+            for rate in [default_rate, *rates.values()]:
+                if rate is not None and (
+                    isinstance(rate, bool) or not isinstance(rate, (int, float)) or not 0 <= rate <= 1
+                ):
+                    return {
+                        "status": "error",
+                        "message": "샘플링 비율은 0.0 ~ 1.0 사이의 숫자여야 합니다."
+                    }, 400
+
+            if default_rate is not None:
+                hot_path_logger.set_default_rate(default_rate)
+            for site, rate in rates.items():
+                if rate is None:
+                    hot_path_logger.reset_rate(site)
+                else:
+                    hot_path_logger.set_rate(site, rate)
+
+            app_logger.info(f"로그 샘플링 설정 변경: default_rate={default_rate}, rates={rates}")
+            return {
+                "status": "success",
+                "message": "로그 샘플링 설정이 변경되었습니다.",
+                "data": hot_path_logger.snapshot()
+            }
+        except Exception as e:
+            app_logger.error(f"로그 샘플링 설정 변경 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"로그 샘플링 설정 변경 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+@system_ns.route('/slow-queries')
+class SystemSlowQueries(Resource):
+    @system_ns.doc(security='Bearer')
+    @system_ns.response(200, 'Success', system_slow_query_model)
+    @system_ns.response(401, 'Unauthorized', error_response_model)
+    @system_ns.response(403, 'Forbidden', error_response_model)
+    @require_admin
+    def get(self):
+        """느린 쿼리 지문별 요약 조회 (관리자)"""
+        try:
+            return {
+                "status": "success",
+                "message": "느린 쿼리 조회가 완료되었습니다.",
+                "data": slow_query_logger.snapshot()
+            }
+        except Exception as e:
+            app_logger.error(f"느린 쿼리 조회 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"느린 쿼리 조회 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+@system_ns.route('/slow-queries/<string:fingerprint>')
+class SystemSlowQueryPlan(Resource):
+    @system_ns.doc(security='Bearer')
+    @system_ns.response(200, 'Success', system_slow_query_model)
+    @system_ns.response(404, 'Not Found', error_response_model)
+    @system_ns.response(401, 'Unauthorized', error_response_model)
+    @system_ns.response(403, 'Forbidden', error_response_model)
+    @require_admin
+    def get(self, fingerprint):
+        """느린 쿼리 실행 계획 조회 (관리자)"""
+        try:
+            entry = slow_query_logger.get_plan(fingerprint)
+            if entry is None:
+                return {
+                    "status": "error",
+                    "message": "해당 지문의 느린 쿼리가 없습니다."
+                }, 404
+            return {
+                "status": "success",
+                "message": "느린 쿼리 조회가 완료되었습니다.",
+                "data": {fingerprint: entry}
+            }
+        except Exception as e:
+            app_logger.error(f"느린 쿼리 조회 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"느린 쿼리 조회 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+@system_ns.route('/profiling')
+class SystemProfiling(Resource):
+    @staticmethod
+    def _profiling_status():
+        return {
+            "enabled": request_profiler.enabled,
+            "endpoints": sorted(request_profiler.endpoints),
+            "sample_rate": request_profiler.sample_rate,
+            "signed_header": bool(request_profiler.secret)
+        }
+
+    @system_ns.doc(security='Bearer')
+    @system_ns.response(200, 'Success', system_profiling_model)
+    @system_ns.response(401, 'Unauthorized', error_response_model)
+    @system_ns.response(403, 'Forbidden', error_response_model)
+    @require_admin
+    def get(self):
+        """요청 프로파일링 설정 조회 (관리자)"""
+        try:
+            return {
+                "status": "success",
+                "message": "프로파일링 설정 조회가 완료되었습니다.",
+                "data": self._profiling_status()
+            }
+        except Exception as e:
+            app_logger.error(f"프로파일링 설정 조회 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"프로파일링 설정 조회 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+    @system_ns.doc(security='Bearer')
+    @system_ns.expect(system_profiling_update_model)
+    @system_ns.response(200, 'Success', system_profiling_model)
+    @system_ns.response(400, 'Bad Request', error_response_model)
+    @system_ns.response(401, 'Unauthorized', error_response_model)
+    @system_ns.response(403, 'Forbidden', error_response_model)
+    @require_admin
+    def put(self):
+        """요청 프로파일링 대상 변경 (관리자)"""
+        try:
+            data = request.get_json(silent=True) or {}
+            endpoints = data.get('endpoints')
+            sample_rate = data.get('sample_rate')
+
+            if endpoints is not None and (
+                not isinstance(endpoints, list) or not all(isinstance(rule, str) for rule in endpoints)
+            ):
+                return {
+                    "status": "error",
+                    "message": "endpoints는 라우트 문자열 목록이어야 합니다."
+                }, 400
+
+            if sample_rate is not None and (
+                isinstance(sample_rate, bool) or not isinstance(sample_rate, (int, float)) or not 0 <= sample_rate <= 1
+            ):
+                return {
+                    "status": "error",
+                    "message": "sample_rate는 0.0 ~ 1.0 사이의 숫자여야 합니다."
+                }, 400
+
+            request_profiler.configure(endpoints=endpoints, sample_rate=sample_rate)
+            app_logger.info(f"프로파일링 설정 변경: endpoints={endpoints}, sample_rate={sample_rate}")
+            return {
+                "status": "success",
+                "message": "프로파일링 설정이 변경되었습니다.",
+                "data": self._profiling_status()
+            }
+        except Exception as e:
+            app_logger.error(f"프로파일링 설정 변경 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"프로파일링 설정 변경 중 오류가 발생했습니다: {str(e)}"
+            }, 500
+
+@system_ns.route('/runtime')
+class SystemRuntime(Resource):
+    @system_ns.doc(security='Bearer')
+    @system_ns.response(200, 'Success', system_runtime_model)
+    @system_ns.response(401, 'Unauthorized', error_response_model)
+    @system_ns.response(403, 'Forbidden', error_response_model)
+    @require_admin
+    def get(self):
+        """캐시 / 커넥션 풀 / 큐 / 스레드 / 메모리 런타임 상태 조회 (관리자)"""
+        try:
+            return {
+                "status": "success",
+                "message": "런타임 상태 조회가 완료되었습니다.",
+                "data": runtime_registry.collect()
+            }
+        except Exception as e:
+            app_logger.error(f"런타임 상태 조회 중 오류가 발생했습니다: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"런타임 상태 조회 중 오류가 발생했습니다: {str(e)}"
+            }, 500
@@ -11,6 +11,7 @@ from models.user_model.user_setting import UserSetting
 from models.user_model.user_register_dto import UserRegisterDTO
 from models.user_model.user_profile_update_dto import UserProfileUpdateDTO
 from service.user_logic import user_service
+from service.query_logic.cached_queries import find_login_log, find_user_by_email
 from swagger_config import user_ns
 from models.user_model.user_schemas import (
     user_register_model, 
@@ -69,7 +70,7 @@ def handle_database_operation(func, *args, **kwargs):
 
 def create_user_login_log(user_id, user_ip_id, user_agent_id, event_type='LOGIN'):
     """사용자 로그인 로그 생성 또는 업데이트"""
-    existing_log = UserLoginLog.query.filter_by(user_id=user_id).first()
+    existing_log = find_login_log(user_id)
     
     if existing_log:
         existing_log.event_at = datetime.now()
@@ -249,7 +250,7 @@ class UserLogout(Resource):
                 )
             
             # 사용자 조회
-            user = User.query.filter_by(email=user_info['email']).first()
+            user = find_user_by_email(user_info['email'])
             if not user:
                 app_logger.warning(f"로그아웃 요청: 사용자를 찾을 수 없음 - {user_info['email']}")
                 return create_error_response(
@@ -1,17 +1,35 @@
 # 서드파티 라이브러리 임포트
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
+import settings
 
 # 로컬 모듈 임포트
 from utils.tunnel_manager import tunnel_manager
-from utils.loging_manager import *
+from utils.loging_manager import (
+    setup_logging, get_app_logger, get_api_logger, get_error_logger, get_database_logger
+)
+from utils.jwt_manager import jwt_manager
+from utils.auth_decorator import require_auth
 from utils.transacation_manager import TransactionManager
 from utils.email_manager import EmailManager
+from utils.query_tracker import query_tracker
+from utils.request_profiler import setup_profiling
+from utils.tracing import setup_tracing
+from utils.health_checker import health_checker
+from utils.runtime_registry import runtime_registry
+from utils.metrics_manager import metrics_registry
+from utils.db_router import RoutingSession, is_replica_bind, replica_router
 
 # Flask 확장들
-db = SQLAlchemy()
-migrate = Migrate()
+# 읽기 전용 함수(@replica_router.read_only)의 읽기 쿼리는 복제본으로 라우팅
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+# 모델이 없는 테이블(user_event_log 등)은 SQL 스크립트로 관리하므로 autogenerate 에서 삭제 대상으로 잡지 않음
+migrate = Migrate(include_object=lambda object, name, type_, reflected, compare_to: not (
+    type_ == 'table' and reflected and compare_to is None
+))
 
 app_logger = None
 api_logger = None
@@ -20,6 +38,92 @@ database_logger = None
 transaction_manager = None
 email_manager = None
 
+def get_pool_stats(app):
+    """바인드별 커넥션 풀 상태 (워커 프로세스 단위, DB 접근 없음)"""
+    stats = {'pid': os.getpid()}
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            pool = engine.pool
+            if not hasattr(pool, 'checkedout'):
+                stats[bind_key or 'default'] = {'pool': type(pool).__name__}
+                continue
+            stats[bind_key or 'default'] = {
+                'size': pool.size(),
+                'max_overflow': getattr(pool, '_max_overflow', None),
+                'timeout': pool.timeout() if hasattr(pool, 'timeout') else None,
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': pool.overflow()
+            }
+    return stats
+
+def _collect_pool_metrics(app):
+    """커넥션 풀 게이지 수집 (워커별 값)"""
+    samples = {'checked_in': [], 'checked_out': [], 'overflow': []}
+    for bind, pool_stats in get_pool_stats(app).items():
+        if not isinstance(pool_stats, dict) or 'checked_out' not in pool_stats:
+            continue
+        labels = (('bind', bind),)
+        for name in samples:
+            samples[name].append((labels, pool_stats[name]))
+    return [
+        ('db_pool_checked_in', 'gauge', '풀에 대기 중인 DB 연결 수', samples['checked_in']),
+        ('db_pool_checked_out', 'gauge', '사용 중인 DB 연결 수', samples['checked_out']),
+        ('db_pool_overflow', 'gauge', '풀 크기 대비 초과 연결 수 (음수는 여유분)', samples['overflow'])
+    ]
+
+def _bind_in_use(bind_key):
+    """모델(__bind_key__)이 지정된 바인드인지 확인 - 기본 DB / 읽기 복제본(라우터가 사용)은 항상 사용"""
+    if bind_key is None or is_replica_bind(bind_key):
+        return True
+    metadata = db.metadatas.get(bind_key)
+    return metadata is not None and bool(metadata.tables)
+
+def warm_up_pool(app, count=None):
+    """커넥션 풀 미리 채우기 (배포 직후 첫 요청이 터널 / DB 연결 비용을 내지 않도록)"""
+    count = getattr(settings, 'DB_POOL_WARMUP_CONNECTIONS', 0) if count is None else count
+    warmed = {}
+    if count <= 0:
+        return warmed
+    
+    with app.app_context():
+        for bind_key, engine in db.engines.items():
+            if not _bind_in_use(bind_key):
+                continue
+            pool = engine.pool
+            target = min(count, pool.size()) if hasattr(pool, 'checkedout') else 1
+            connections = []
+            # 모두 체크아웃된 상태에서 반환해야 서로 다른 연결이 생성됨 (동시에 연결)
+            with ThreadPoolExecutor(max_workers=target, thread_name_prefix='db-warmup') as executor:
+                futures = [executor.submit(engine.raw_connection) for _ in range(target)]
+                for future in futures:
+                    try:
+                        connections.append(future.result())
+                    except Exception as e:
+                        if app_logger is not None:
+                            app_logger.error(f"커넥션 풀 워밍업 실패 ({bind_key or 'default'}): {str(e)}")
+            for connection in connections:
+                connection.close()
+            warmed[bind_key or 'default'] = len(connections)
+    
+    if app_logger is not None:
+        app_logger.info(f"커넥션 풀 워밍업 완료 (pid: {os.getpid()}): {warmed}")
+    return warmed
+
+def reset_after_fork(app):
+    """fork 된 워커 프로세스에서 부모와 공유하면 안 되는 자원 초기화"""
+    from utils.loging_manager import logger_manager
+    from utils.tracing import tracer
+    
+    # 부모의 DB 연결은 닫지 않고 버림 (close=False) - 워커는 자신의 연결을 새로 생성
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+    
+    tunnel_manager.reset_after_fork()
+    logger_manager.reset_after_fork()
+    tracer.exporter.reset_after_fork()
+
 def init_extensions(app):
     """어플리케이션에 확장들을 초기화"""
     global app_logger, api_logger, error_logger, database_logger
@@ -28,9 +132,28 @@ def init_extensions(app):
     db.init_app(app)
     migrate.init_app(app, db)
     
+    # 읽기 복제본 바인드 등록 (복제본 미설정 시 모든 쿼리는 기본 DB 사용)
+    replica_router.init_app(app, db)
+    
+    # 요청별 SQL 실행 통계 수집
+    query_tracker.install()
+    
+    # 준비 상태 점검 대상 앱 등록 (백그라운드 프로브는 첫 점검 요청 시 시작)
+    health_checker.init_app(app)
+    
+    # 런타임 상태 조회용 커넥션 풀 정보 등록
+    runtime_registry.register('db_pool', lambda: get_pool_stats(app))
+    metrics_registry.register_collector('db_pool', lambda: _collect_pool_metrics(app))
+    
     # 로깅 설정 추가
     setup_logging(app)
     
+    # 요청 ID 발급 및 추적 구간 (로깅 이후 등록 - after_request는 역순 실행)
+    setup_tracing(app)
+    
+    # 요청 프로파일링 훅 (설정된 경우에만 동작)
+    setup_profiling(app)
+    
     # 로거들 초기화
     try:
         app_logger = get_app_logger()
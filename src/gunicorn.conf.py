@@ -0,0 +1,103 @@
+"""
+gunicorn 운영 서버 설정
+
+실행 (src 디렉토리에서):
+    gunicorn wsgi:app
+
+- preload_app: 마스터에서 앱을 한 번 로드한 뒤 fork (copy-on-write 로 메모리 공유)
+- when_ready: fork 전 마스터에서 인덱스 점검 1회
+- post_fork: DB 커넥션 풀 / SSH 터널 / 로그·추적 스레드를 워커별로 다시 생성 후 커넥션 풀 워밍업
+- 워커 / 스레드 수는 CPU 수 기준으로 계산 (settings 로 고정 가능)
+- 워커가 2개 이상이면 OAuth state 저장소는 redis 여야 함 (memory 이면 기동 실패)
+"""
+import gc
+import multiprocessing
+import os
+import settings
+
+def _cpu_count() -> int:
+    # 컨테이너 / taskset 으로 제한된 경우 실제 사용 가능한 CPU 수 기준
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except (AttributeError, OSError):
+        return max(1, multiprocessing.cpu_count())
+
+_cpus = _cpu_count()
+
+worker_class = getattr(settings, 'SERVER_WORKER_CLASS', 'gthread')
+
+if worker_class == 'gevent':
+    # 앱을 preload 하기 전에 패치해야 마스터에서 만든 락 / 소켓도 협력형이 됨
+    from gevent import monkey
+    monkey.patch_all()
+    try:
+        # psycopg2 는 C 확장이므로 별도 대기 콜백 등록 필요 (pymysql 은 패치만으로 동작)
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+    except ImportError:
+        pass
+
+bind = getattr(settings, 'SERVER_BIND', f"0.0.0.0:{getattr(settings, 'PRD_PORT', 8000)}")
+preload_app = True
+
+if worker_class == 'gevent':
+    # 워커 하나가 여러 요청을 이벤트 루프로 처리하므로 CPU 당 1개
+    workers = getattr(settings, 'SERVER_WORKERS', None) or _cpus
+    worker_connections = getattr(settings, 'SERVER_WORKER_CONNECTIONS', 1000)
+else:
+    workers = getattr(settings, 'SERVER_WORKERS', None) or _cpus * 2 + 1
+    threads = getattr(settings, 'SERVER_THREADS', None) or 4
+
+workers = min(workers, getattr(settings, 'SERVER_MAX_WORKERS', 32))
+
+# 메모리 state 저장소는 워커별로 분리되어 다른 워커로 들어온 OAuth 콜백이 항상 실패하므로 기동 거부
+if workers > 1 and getattr(settings, 'OAUTH_STATE_BACKEND', 'memory').lower() == 'memory':
+    raise RuntimeError(
+        f"OAUTH_STATE_BACKEND = 'memory' 는 단일 워커에서만 사용할 수 있습니다 (workers={workers}). "
+        f"'redis' 로 설정하거나 SERVER_WORKERS = 1 로 실행하세요."
+    )
+
+timeout = getattr(settings, 'SERVER_TIMEOUT', 30)
+graceful_timeout = getattr(settings, 'SERVER_GRACEFUL_TIMEOUT', 30)
+keepalive = getattr(settings, 'SERVER_KEEPALIVE', 5)
+
+# 워커 메모리 증가 방지를 위한 주기적 재시작 (동시에 재시작되지 않도록 jitter)
+max_requests = getattr(settings, 'SERVER_MAX_REQUESTS', 10000)
+max_requests_jitter = getattr(settings, 'SERVER_MAX_REQUESTS_JITTER', 1000)
+
+# 접근 로그는 앱의 api.log 에서 기록
+accesslog = None
+errorlog = '-'
+loglevel = getattr(settings, 'LOG_LEVEL', 'INFO').lower()
+
+def when_ready(server):
+    from wsgi import app
+    from extensions import db
+    from utils.index_checker import index_checker
+    from utils.tunnel_manager import tunnel_manager
+
+    # 누락 인덱스 점검은 fork 전 마스터에서 1회만 (결과는 워커가 그대로 물려받아 readiness 점검 / 런타임 조회에 표시)
+    index_checker.check(app)
+    # 점검에 사용한 마스터의 DB 연결 / SSH 터널 / 터널 감시 스레드는 fork 전에 모두 정리
+    # (워커는 각자 터널을 새로 만들며, 스레드가 남은 상태로 fork 하지 않도록)
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose()
+    tunnel_manager.close_all_tunnels()
+
+    # preload 된 객체를 GC 추적 대상에서 제외 - 워커에서 GC 가 참조 카운트 페이지를 건드리지 않도록
+    gc.freeze()
+    server.log.info(
+        f"CloakBox API 서버 준비 완료: workers={server.cfg.workers}, "
+        f"worker_class={server.cfg.worker_class_str}, threads={server.cfg.threads}"
+    )
+
+def post_fork(server, worker):
+    # preload 된 모듈이므로 앱을 다시 만들지 않음
+    from wsgi import app
+    from extensions import reset_after_fork, warm_up_pool
+
+    reset_after_fork(app)
+    server.log.info(f"워커 자원 초기화 완료 (pid: {worker.pid})")
+    # 워커가 요청을 받기 전에 자신의 커넥션 풀을 채움
+    warm_up_pool(app)
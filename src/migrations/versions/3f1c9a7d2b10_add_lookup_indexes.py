@@ -0,0 +1,95 @@
+"""add lookup indexes
+
+로그인 / 인증 경로에서 PK 가 아닌 컬럼으로 조회하는 테이블에 보조 인덱스 추가
+
+- PostgreSQL: CREATE INDEX CONCURRENTLY (트랜잭션 밖에서 실행, 쓰기 잠금 없음)
+  이전 실행이 중단되어 남은 INVALID 인덱스는 삭제 후 다시 생성
+- MariaDB: ALGORITHM=INPLACE, LOCK=NONE 온라인 DDL
+
+Revision ID: 3f1c9a7d2b10
+Revises:
+Create Date: 2026-10-19 15:20:00.000000
+
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f1c9a7d2b10'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (인덱스 이름, 테이블, 컬럼)
+LOOKUP_INDEXES = (
+    ('ix_users_user_setting_id', 'users', ('user_setting_id',)),
+    ('ix_user_login_log_user_id', 'user_login_log', ('user_id',)),
+    ('ix_user_ip_ip_str', 'user_ip', ('ip_str',)),
+    ('ix_user_agent_user_agent_str', 'user_agent', ('user_agent_str',)),
+    ('ix_user_certification_recipient_created_at', 'user_certification', ('recipient', 'created_at')),
+    ('ix_user_event_log_user_uuid', 'user_event_log', ('user_uuid',)),
+)
+
+
+def _existing_tables():
+    # --sql(오프라인) 모드에서는 DB 를 조회할 수 없으므로 모든 테이블이 있다고 가정
+    if context.is_offline_mode():
+        return {table for _, table, _ in LOOKUP_INDEXES}
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _drop_invalid_postgresql_index(name):
+    if context.is_offline_mode():
+        return
+    # CONCURRENTLY 생성이 실패하면 INVALID 상태로 남아 IF NOT EXISTS 에 걸리므로 먼저 정리
+    invalid = op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name AND NOT i.indisvalid"
+    ), {'name': name}).first()
+    if invalid is not None:
+        op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    tables = _existing_tables()
+
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, columns in LOOKUP_INDEXES:
+                if table not in tables:
+                    continue
+                _drop_invalid_postgresql_index(name)
+                op.create_index(name, table, list(columns), postgresql_concurrently=True, if_not_exists=True)
+    elif dialect in ('mysql', 'mariadb'):
+        for name, table, columns in LOOKUP_INDEXES:
+            if table not in tables:
+                continue
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)}) "
+                f"ALGORITHM=INPLACE LOCK=NONE"
+            )
+    else:
+        for name, table, columns in LOOKUP_INDEXES:
+            if table in tables:
+                op.create_index(name, table, list(columns), if_not_exists=True)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    tables = _existing_tables()
+
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, _ in reversed(LOOKUP_INDEXES):
+                if table in tables:
+                    op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    elif dialect in ('mysql', 'mariadb'):
+        for name, table, _ in reversed(LOOKUP_INDEXES):
+            if table in tables:
+                op.execute(f"DROP INDEX IF EXISTS {name} ON {table}")
+    else:
+        for name, table, _ in reversed(LOOKUP_INDEXES):
+            if table in tables:
+                op.drop_index(name, table_name=table, if_exists=True)
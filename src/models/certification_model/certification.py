@@ -1,8 +1,8 @@
 from extensions import db
 from datetime import datetime, timedelta
 from typing import Optional, Union
-from sqlalchemy.dialects.postgresql import TIMESTAMP
-from sqlalchemy import func, text
+from sqlalchemy import func
+from models.column_types import BigIntegerPK, GUID, unix_timestamp
 import uuid
 import settings
 
@@ -10,16 +10,19 @@ class UserCertification(db.Model):
     """ 사용자 인증 모델 """
     
     __tablename__ = "user_certification"
+    __table_args__ = (
+        db.Index('ix_user_certification_recipient_created_at', 'recipient', 'created_at'),
+    )
     
-    id = db.Column(db.BigInteger, primary_key=True)
-    user_uuid = db.Column(db.UUID, nullable=True)
+    id = db.Column(BigIntegerPK, primary_key=True)
+    user_uuid = db.Column(GUID, nullable=True)
     code = db.Column(db.String(10), nullable=False)
     recipient = db.Column(db.String(255), nullable=False)
     use_yn = db.Column(db.Boolean, default=False, nullable=True)
-    created_at = db.Column(TIMESTAMP(timezone=True), default=func.now(), nullable=True)
-    created_at_unix = db.Column(db.BigInteger, default=text('EXTRACT(epoch FROM now())'), nullable=True)
-    expires_at = db.Column(TIMESTAMP(timezone=True), nullable=False)
-    expires_at_unix = db.Column(db.BigInteger, default=text('EXTRACT(epoch FROM now())'), nullable=False)
+    created_at = db.Column(db.DateTime(timezone=True), default=func.now(), nullable=True)
+    created_at_unix = db.Column(db.BigInteger, default=unix_timestamp, nullable=True)
+    expires_at = db.Column(db.DateTime(timezone=True), nullable=False)
+    expires_at_unix = db.Column(db.BigInteger, default=unix_timestamp, nullable=False)
     
     def __init__(self, recipient: str, code: str, user_uuid: Optional[Union[str, uuid.UUID]] = None):
         self.recipient = recipient.lower()
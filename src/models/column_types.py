@@ -0,0 +1,57 @@
+import time
+import uuid
+from typing import Any, Optional
+from sqlalchemy import BigInteger, Integer, Uuid
+from sqlalchemy.dialects import mysql, postgresql
+from sqlalchemy.types import TypeDecorator
+
+MYSQL_DIALECTS = ('mysql', 'mariadb')
+
+class GUID(TypeDecorator):
+    """ DB별 UUID 컬럼 타입
+
+    - PostgreSQL: 네이티브 UUID
+    - MariaDB / MySQL: BINARY(16) (문자열 CHAR(36) 대비 인덱스 크기가 절반 이하이고 바이트 단위 비교)
+    - 그 외: CHAR(32)
+
+    문자열 / uuid.UUID 모두 바인딩 가능하며 조회 결과는 항상 uuid.UUID
+    """
+
+    impl = Uuid
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(postgresql.UUID(as_uuid=True))
+        if dialect.name in MYSQL_DIALECTS:
+            return dialect.type_descriptor(mysql.BINARY(16))
+        return dialect.type_descriptor(Uuid(as_uuid=True))
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[Any]:
+        if value is None:
+            return None
+        if not isinstance(value, uuid.UUID):
+            value = uuid.UUID(str(value))
+        if dialect.name in MYSQL_DIALECTS:
+            return value.bytes
+        return value
+
+    def process_literal_param(self, value: Any, dialect) -> str:
+        value = self.process_bind_param(value, dialect)
+        if isinstance(value, bytes):
+            return f"X'{value.hex()}'"
+        return f"'{value}'"
+
+    def process_result_value(self, value: Any, dialect) -> Optional[uuid.UUID]:
+        if value is None or isinstance(value, uuid.UUID):
+            return value
+        if isinstance(value, (bytes, bytearray)):
+            return uuid.UUID(bytes=bytes(value))
+        return uuid.UUID(str(value))
+
+# BIGINT 자동 증가 PK (SQLite 는 INTEGER PRIMARY KEY 만 자동 증가하므로 INTEGER 사용)
+BigIntegerPK = BigInteger().with_variant(Integer(), 'sqlite')
+
+def unix_timestamp() -> int:
+    """ 현재 시각 UNIX timestamp (초) - DB 함수 대신 모든 DB 에서 동일하게 쓰는 기본값 """
+    return int(time.time())
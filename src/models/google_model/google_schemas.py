@@ -12,6 +12,7 @@ google_auth_success_model = api.model('GoogleAuthSuccess', {
     'message': fields.String(description='응답 메시지'),
     'data': fields.Nested(api.model('GoogleAuthData', {
         'auth_url': fields.String(description='구글 인증 URL'),
+        'state': fields.String(description='상태값 (콜백 시 전달)'),
         'scope': fields.String(description='권한 범위'),
         'prompt': fields.String(description='인증 프롬프트')
     }))
@@ -33,7 +34,8 @@ google_login_success_model = api.model('GoogleLoginSuccess', {
 })
 
 google_callback_model = api.model('GoogleCallback', {
-    'code': fields.String(required=True, description='구글 인증 코드', example='authorization_code_here')
+    'code': fields.String(required=True, description='구글 인증 코드', example='authorization_code_here'),
+    'state': fields.String(description='인증 URL 생성 시 발급된 상태값', example='state_here')
 })
 
 google_callback_success_model = api.model('GoogleCallbackSuccess', {
@@ -12,6 +12,7 @@ kakao_auth_success_model = api.model('KakaoAuthSuccess', {
     'message': fields.String(description='응답 메시지'),
     'data': fields.Nested(api.model('KakaoAuthData', {
         'auth_url': fields.String(description='카카오 인증 URL'),
+        'state': fields.String(description='상태값 (콜백 시 전달)'),
         'scope': fields.String(description='권한 범위'),
         'prompt': fields.String(description='인증 프롬프트')
     }))
@@ -32,7 +33,8 @@ kakao_login_success_model = api.model('KakaoLoginSuccess', {
 })
 
 kakao_callback_model = api.model('KakaoCallback', {
-    'code': fields.String(required=True, description='카카오 인증 코드', example='authorization_code_here')
+    'code': fields.String(required=True, description='카카오 인증 코드', example='authorization_code_here'),
+    'state': fields.String(description='인증 URL 생성 시 발급된 상태값', example='state_here')
 })
 
 kakao_callback_success_model = api.model('KakaoCallbackSuccess', {
@@ -76,7 +78,9 @@ kakao_send_message_model = api.model('KakaoSendMessage', {
     'access_token': fields.String(required=True, description='액세스 토큰'),
     'message': fields.String(required=True, description='전송할 메시지'),
     'link_url': fields.String(description='링크 URL'),
-    'friend_uuid': fields.String(description='친구 UUID (선택사항)')
+    'friend_uuid': fields.String(description='친구 UUID (선택사항)'),
+    'friend_uuids': fields.List(fields.String, description='친구 UUID 목록 (선택사항, 일괄 전송)'),
+    'to_all_friends': fields.Boolean(description='전체 친구에게 전송 여부 (선택사항)', example=False)
 })
 
 kakao_send_message_success_model = api.model('KakaoSendMessageSuccess', {
@@ -86,7 +90,26 @@ kakao_send_message_success_model = api.model('KakaoSendMessageSuccess', {
         'success': fields.Boolean(description='전송 성공 여부'),
         'message_sent': fields.String(description='전송된 메시지'),
         'link_url': fields.String(description='링크 URL'),
-        'friend_uuid': fields.String(description='친구 UUID')
+        'friend_uuid': fields.String(description='친구 UUID'),
+        'successful_receiver_uuids': fields.List(fields.String, description='전송 성공 친구 UUID 목록'),
+        'failed_receivers': fields.Raw(description='전송 실패 친구 UUID별 사유'),
+        'request_count': fields.Integer(description='카카오 API 요청 수')
+    }))
+})
+
+kakao_friends_model = api.model('KakaoFriends', {
+    'access_token': fields.String(required=True, description='액세스 토큰'),
+    'offset': fields.Integer(description='조회 시작 위치', example=0),
+    'limit': fields.Integer(description='페이지 크기 (최대 100)', example=100)
+})
+
+kakao_friends_success_model = api.model('KakaoFriendsSuccess', {
+    'status': fields.String(description='응답 상태', example='success'),
+    'message': fields.String(description='응답 메시지'),
+    'data': fields.Nested(api.model('KakaoFriendsData', {
+        'elements': fields.Raw(description='친구 목록'),
+        'total_count': fields.Integer(description='전체 친구 수'),
+        'next_offset': fields.Integer(description='다음 페이지 offset (없으면 마지막 페이지)')
     }))
 })
 
@@ -9,10 +9,32 @@ system_version_model = api.model('SystemVersion', {
 
 # 시스템 상태 응답 모델
 system_health_model = api.model('SystemHealth', {
-    'status': fields.String(required=True, description='시스템 상태', example='healthy'),
+    'status': fields.String(required=True, description='시스템 상태 (healthy / degraded / unhealthy)', example='healthy'),
     'message': fields.String(required=True, description='상태 메시지', example='시스템이 정상적으로 작동 중입니다.'),
 })
 
+# 생존(liveness) 응답 모델
+system_liveness_model = api.model('SystemLiveness', {
+    'status': fields.String(required=True, description='프로세스 상태', example='alive'),
+    'pid': fields.Integer(description='워커 프로세스 ID', example=12345),
+    'uptime_seconds': fields.Float(description='가동 시간(초)', example=3600.0),
+})
+
+# 준비(readiness) 응답 모델
+system_readiness_model = api.model('SystemReadiness', {
+    'status': fields.String(required=True, description='시스템 상태 (healthy / degraded / unhealthy)', example='healthy'),
+    'ready': fields.Boolean(required=True, description='트래픽 수신 가능 여부', example=True),
+    'stale': fields.Boolean(description='점검 결과가 오래되어 신뢰할 수 없는지 여부', example=False),
+    'checked_at': fields.Float(description='점검 시각 (epoch)', example=1735700000.0),
+    'checks': fields.Raw(description='항목별 점검 상태 (상세 결과는 관리자 런타임 조회의 health 항목)', example={
+        'database': {'status': 'ok'},
+        'pool': {'status': 'ok'},
+        'tunnel': {'status': 'skipped', 'reason': 'SSH 터널링 미사용'},
+        'email': {'status': 'ok'},
+        'providers': {'status': 'ok'}
+    }),
+})
+
 # 일반 성공 응답 모델
 success_response_model = api.model('SuccessResponse', {
     'status': fields.String(required=True, description='응답 상태', example='success'),
@@ -25,4 +47,84 @@ error_response_model = api.model('ErrorResponse', {
     'status': fields.String(required=True, description='에러 상태', example='error'),
     'message': fields.String(required=True, description='에러 메시지', example='요청 처리 중 오류가 발생했습니다.'),
     'error': fields.String(description='상세 에러 정보', example='Internal Server Error')
-})
\ No newline at end of file
+})
+
+# 외부 제공자 서킷 브레이커 상태 응답 모델
+system_circuit_breaker_model = api.model('SystemCircuitBreaker', {
+    'status': fields.String(required=True, description='응답 상태', example='success'),
+    'message': fields.String(required=True, description='응답 메시지', example='서킷 브레이커 상태 조회가 완료되었습니다.'),
+    'data': fields.Raw(description='제공자별 서킷/벌크헤드 상태', example={
+        'kakao': {
+            'circuit': {'state': 'closed', 'failure_rate': 0.0, 'rejected_calls': 0},
+            'bulkhead': {'max_concurrent': 8, 'in_flight': 0, 'rejected_calls': 0}
+        }
+    })
+})
+
+# hot path 로그 샘플링 상태 응답 모델
+system_log_sampling_model = api.model('SystemLogSampling', {
+    'status': fields.String(required=True, description='응답 상태', example='success'),
+    'message': fields.String(required=True, description='응답 메시지', example='로그 샘플링 설정 조회가 완료되었습니다.'),
+    'data': fields.Raw(description='기본 샘플링 비율 및 호출 지점별 비율/통계', example={
+        'default_rate': 0.01,
+        'sites': {
+            'jwt.verify_token': {'rate': 0.01, 'calls': 1200, 'logged': 11}
+        }
+    })
+})
+
+# hot path 로그 샘플링 변경 요청 모델
+system_log_sampling_update_model = api.model('SystemLogSamplingUpdate', {
+    'default_rate': fields.Float(description='기본 샘플링 비율 (0.0 ~ 1.0)', example=0.01),
+    'rates': fields.Raw(description='호출 지점별 샘플링 비율 (null 이면 기본값으로 복원)', example={
+        'jwt.verify_token': 1.0,
+        'db.safe_commit': None
+    })
+})
+
+# 느린 쿼리 조회 응답 모델
+system_slow_query_model = api.model('SystemSlowQuery', {
+    'status': fields.String(required=True, description='응답 상태', example='success'),
+    'message': fields.String(required=True, description='응답 메시지', example='느린 쿼리 조회가 완료되었습니다.'),
+    'data': fields.Raw(description='쿼리 지문별 느린 쿼리 정보 (단건 조회 시 실행 계획 포함)', example={
+        'a88978b9d18b3627': {
+            'statement': 'SELECT users.id FROM users WHERE users.email = %(email_1)s',
+            'count': 3,
+            'max_ms': 412.5,
+            'last_seen': '2025-01-01T12:00:00',
+            'has_plan': True
+        }
+    })
+})
+
+# 요청 프로파일링 설정 응답 모델
+system_profiling_model = api.model('SystemProfiling', {
+    'status': fields.String(required=True, description='응답 상태', example='success'),
+    'message': fields.String(required=True, description='응답 메시지', example='프로파일링 설정 조회가 완료되었습니다.'),
+    'data': fields.Raw(description='프로파일링 대상 설정', example={
+        'enabled': True,
+        'endpoints': ['/v1/kakao/login'],
+        'sample_rate': 0.0,
+        'signed_header': False
+    })
+})
+
+# 요청 프로파일링 설정 변경 요청 모델
+system_profiling_update_model = api.model('SystemProfilingUpdate', {
+    'endpoints': fields.List(fields.String, description='프로파일링할 라우트 목록', example=['/v1/kakao/login']),
+    'sample_rate': fields.Float(description='무작위 프로파일링 비율 (0.0 ~ 1.0)', example=0.01)
+})
+
+# 런타임 상태 응답 모델
+system_runtime_model = api.model('SystemRuntime', {
+    'status': fields.String(required=True, description='응답 상태', example='success'),
+    'message': fields.String(required=True, description='응답 메시지', example='런타임 상태 조회가 완료되었습니다.'),
+    'data': fields.Raw(description='서브시스템별 런타임 상태', example={
+        'process': {'pid': 12345, 'uptime_seconds': 3600.0, 'rss_bytes': 104857600},
+        'threads': {'active': 12, 'daemon': 8, 'by_name': {'MainThread': 1, 'health-probe': 1}},
+        'db_pool': {'pid': 12345, 'default': {'size': 5, 'max_overflow': 10, 'timeout': 30, 'checked_in': 3, 'checked_out': 2, 'overflow': -3}},
+        'ssh_tunnels': {'default': {'active': True, 'local_port': 50123}},
+        'log_queue': {'queue_size': 0, 'queue_maxsize': 10000, 'dropped': 0},
+        'jwt': {'revoked_tokens': 4}
+    })
+})
@@ -1,6 +1,7 @@
 from extensions import db
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import func, text
+from sqlalchemy import func
+from models.column_types import GUID, unix_timestamp
+import uuid
 import time
 
 class User(db.Model):
@@ -8,7 +9,7 @@ class User(db.Model):
     
     __tablename__ = "users"
     
-    id = db.Column(UUID(as_uuid=True), primary_key=True, default=text('gen_random_uuid()'))
+    id = db.Column(GUID, primary_key=True, default=uuid.uuid4)
     name = db.Column(db.String(255), nullable=False)
     email = db.Column(db.String(255), nullable=False, unique=True)
     role_id = db.Column(db.BigInteger, nullable=True)
@@ -18,13 +19,13 @@ class User(db.Model):
     gender = db.Column(db.String(10), nullable=True)
     login_type = db.Column(db.String(20), nullable=True)
     login_yn = db.Column(db.Boolean, nullable=True, default=True)
-    created_at_unix = db.Column(db.BigInteger, nullable=True)
+    created_at_unix = db.Column(db.BigInteger, nullable=True, default=unix_timestamp)
     created_at = db.Column(db.DateTime, default=func.current_timestamp(), nullable=True)
     user_ip_id = db.Column(db.BigInteger, nullable=True)
     user_agent_id = db.Column(db.BigInteger, nullable=True)
     updated_at = db.Column(db.DateTime, default=func.current_timestamp(), onupdate=func.current_timestamp(), nullable=True)
     user_image_id = db.Column(db.BigInteger, nullable=True)
-    user_setting_id = db.Column(db.BigInteger, nullable=True)
+    user_setting_id = db.Column(db.BigInteger, nullable=True, index=True)
     
     def __init__(self, name: str, email: str, nickname: str, gender: str, bio: str, user_setting_id: int, **kwargs):
         self.name = name
@@ -33,7 +34,7 @@ class User(db.Model):
         self.gender = gender
         self.bio = bio
         self.user_setting_id = user_setting_id
-        self.create_at_unix = int(time.time())
+        self.created_at_unix = int(time.time())
         
         # 추가 필드들 설정
         for key, value in kwargs.items():
@@ -1,11 +1,12 @@
 from extensions import db
+from models.column_types import BigIntegerPK
 from sqlalchemy import Column, Integer, String
 
 class UserAgent(db.Model):
     __tablename__ = 'user_agent'
 
-    id = db.Column(db.BigInteger, primary_key=True)
-    user_agent_str = db.Column(db.String(255), nullable=False)
+    id = db.Column(BigIntegerPK, primary_key=True)
+    user_agent_str = db.Column(db.String(255), nullable=False, index=True)
 
     def __init__(self, user_agent_str: str):
         self.user_agent_str = user_agent_str
\ No newline at end of file
@@ -1,11 +1,12 @@
 from extensions import db
+from models.column_types import BigIntegerPK
 from sqlalchemy import Column, Integer, String
 
 class UserIp(db.Model):
     __tablename__ = 'user_ip'
 
-    id = db.Column(db.BigInteger, primary_key=True)
-    ip_str = db.Column(db.String(255), nullable=False)
+    id = db.Column(BigIntegerPK, primary_key=True)
+    ip_str = db.Column(db.String(255), nullable=False, index=True)
 
     def __init__(self, ip_str: str):
         self.ip_str = ip_str
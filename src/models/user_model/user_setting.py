@@ -1,11 +1,12 @@
 from extensions import db
+from models.column_types import BigIntegerPK
 
 class UserSetting(db.Model):
     """ 사용자 설정 모델 """
     
     __tablename__ = "user_setting"
     
-    id = db.Column(db.BigInteger, primary_key=True)
+    id = db.Column(BigIntegerPK, primary_key=True)
     dark_mode = db.Column(db.String(1), nullable=True, default='N')
     editor_mode = db.Column(db.String(50), nullable=True)
     lang_cd = db.Column(db.String(255), nullable=True, default='ko')
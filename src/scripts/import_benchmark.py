@@ -0,0 +1,110 @@
+"""
+import 시간 측정 스크립트
+
+새 인터프리터에서 `python -X importtime` 으로 대상 모듈을 import 하고
+모듈별 누적 import 시간을 출력합니다. 기동 시간 회귀를 리뷰에서 확인하는 용도입니다.
+
+사용 예:
+    python scripts/import_benchmark.py
+    python scripts/import_benchmark.py utils.jwt_manager extensions --top 15
+    python scripts/import_benchmark.py app --budget-ms 800
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_TARGETS = ('utils', 'utils.jwt_manager', 'extensions', 'app')
+
+# "import time:       self [us] |    cumulative | imported package"
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+def measure(target: str, runs: int) -> Tuple[int, List[Tuple[str, int, int, int]]]:
+    """대상 모듈 import 시간 측정 (가장 빠른 실행 기준)
+
+    반환값: (전체 누적 시간 us, [(모듈, self us, cumulative us, 깊이)])
+    """
+    best_total = None
+    best_rows: List[Tuple[str, int, int, int]] = []
+
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {target}'],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+            env={**os.environ, 'PYTHONPATH': SRC_DIR}
+        )
+        if result.returncode != 0:
+            errors = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+            raise RuntimeError(f"{target} import 실패:\n" + '\n'.join(errors[-10:]))
+
+        rows = []
+        total = 0
+        for line in result.stderr.splitlines():
+            match = _IMPORTTIME_RE.match(line)
+            if match is None:
+                continue
+            self_us, cumulative_us = int(match.group(1)), int(match.group(2))
+            depth = len(match.group(3)) // 2
+            module = match.group(4)
+            rows.append((module, self_us, cumulative_us, depth))
+            if module == target:
+                total = cumulative_us
+
+        if best_total is None or total < best_total:
+            best_total = total
+            best_rows = rows
+
+    return best_total or 0, best_rows
+
+def summarize_packages(rows: List[Tuple[str, int, int, int]]) -> Dict[str, int]:
+    """최상위 패키지별 self 시간 합계"""
+    packages: Dict[str, int] = {}
+    for module, self_us, _, _ in rows:
+        package = module.split('.')[0]
+        packages[package] = packages.get(package, 0) + self_us
+    return packages
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='모듈별 import 시간 측정')
+    parser.add_argument('targets', nargs='*', default=list(DEFAULT_TARGETS), help='측정할 모듈')
+    parser.add_argument('--runs', type=int, default=3, help='반복 횟수 (가장 빠른 값 사용)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 상위 모듈 / 패키지 수')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='대상별 허용 import 시간 (초과 시 종료 코드 1)')
+    args = parser.parse_args()
+
+    over_budget = []
+    for target in args.targets:
+        try:
+            total_us, rows = measure(target, max(1, args.runs))
+        except RuntimeError as e:
+            print(str(e), file=sys.stderr)
+            return 2
+
+        print(f"\n=== {target}: {total_us / 1000:.1f} ms ({len(rows)} modules) ===")
+
+        print(f"  상위 패키지 (self 합계)")
+        packages = sorted(summarize_packages(rows).items(), key=lambda item: -item[1])
+        for package, self_us in packages[:args.top]:
+            print(f"    {self_us / 1000:8.1f} ms  {package}")
+
+        print(f"  상위 모듈 (cumulative)")
+        for module, _, cumulative_us, depth in sorted(rows, key=lambda row: -row[2])[:args.top]:
+            print(f"    {cumulative_us / 1000:8.1f} ms  {'  ' * min(depth, 8)}{module}")
+
+        if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+            over_budget.append(target)
+
+    if over_budget:
+        print(f"\n허용 시간({args.budget_ms} ms) 초과: {', '.join(over_budget)}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
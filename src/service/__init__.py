@@ -1,9 +1,11 @@
 from .user_logic import *
 from .certification_logic import *
 from .kakao_logic import *
+from .query_logic import *
 
 __all__ = [
     "user_logic",
     "certification_logic",
-    "kakao_logic"
+    "kakao_logic",
+    "query_logic"
 ]
\ No newline at end of file
@@ -2,10 +2,12 @@ import random
 import string
 from typing import Optional
 from datetime import datetime, timedelta
-from sqlalchemy import desc
 from models.certification_model.certification import UserCertification
 from utils.email_manager import EmailManager
 from extensions import db, app_logger
+from service.query_logic.cached_queries import (
+    find_latest_unused_certification, find_recent_unused_certification, find_unused_certifications
+)
 import settings
 
 def generate_certification_code(length: int = 6) -> str:
@@ -20,10 +22,7 @@ def create_certification_code(email: str, user_uuid: Optional[str] = None) -> Us
             raise Exception("1분 이내에 재생성할 수 없습니다.")
         
         # 기존 미사용 코드들을 사용 처리
-        existing_codes = UserCertification.query.filter_by(
-            recipient=email.lower(),
-            use_yn=False
-        ).all()
+        existing_codes = find_unused_certifications(email.lower())
 
         for code in existing_codes:
             code.mark_as_used()
@@ -74,11 +73,7 @@ CloakBox 팀.
 
 def verify_certification_code(email: str, code: str) -> Optional[UserCertification]:
     """ 인증번호 검증 """
-    certification_code = UserCertification.query.filter_by(
-        recipient=email.lower(),
-        code=code,
-        use_yn=False
-    ).order_by(desc(UserCertification.created_at)).first()
+    certification_code = find_latest_unused_certification(email.lower(), code)
 
     if not certification_code or not certification_code.is_valid():
         return None
@@ -104,11 +99,7 @@ def can_create_new_code(email: str) -> bool:
     """ 새로운 인증번호 생성 가능 여부 확인 """
     one_minute_ago = datetime.now() - timedelta(minutes=1)
     
-    recent_code = UserCertification.query.filter(
-        UserCertification.recipient == email.lower(),
-        UserCertification.use_yn == False,
-        UserCertification.created_at >= one_minute_ago
-    ).first()
+    recent_code = find_recent_unused_certification(email.lower(), one_minute_ago)
     
     return recent_code is None
 
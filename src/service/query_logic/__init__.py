@@ -0,0 +1,5 @@
+from .cached_queries import *
+
+__all__ = [
+    "cached_queries"
+]
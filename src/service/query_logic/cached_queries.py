@@ -0,0 +1,80 @@
+"""
+자주 호출되는 단건 조회 쿼리 모음
+
+legacy Query API(`Model.query.filter_by(...)`)는 호출마다 Query 객체 생성 → select 변환 →
+캐시 키 계산을 반복합니다. 여기의 구문은 모듈 로딩 시 한 번만 만들고 값은 bindparam 으로 전달하므로
+캐시 키가 구문 객체에 메모이즈되어 호출마다 바로 컴파일 캐시를 조회합니다.
+
+lambda_stmt 는 ORM 엔티티 조회에서 실행마다 구문을 다시 복제(replacement traverse)하므로
+이 용도에서는 legacy Query 보다 느렸습니다 (scripts/query_benchmark.py 참고).
+
+반환값은 기존 `Query.first()` / `Query.all()` 과 같습니다 (autoflush / identity map 동일).
+"""
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import bindparam, desc, select
+from extensions import db
+from models.user_model.user import User
+from models.user_model.user_ip import UserIp
+from models.user_model.user_agent import UserAgent
+from models.user_model.user_login_log import UserLoginLog
+from models.certification_model.certification import UserCertification
+
+_USER_BY_EMAIL = select(User).where(User.email == bindparam('email')).limit(1)
+
+_USER_BY_ID = select(User).where(User.id == bindparam('user_id')).limit(1)
+
+_USER_IP_BY_STR = select(UserIp).where(UserIp.ip_str == bindparam('ip_str')).limit(1)
+
+_USER_AGENT_BY_STR = select(UserAgent).where(UserAgent.user_agent_str == bindparam('user_agent_str')).limit(1)
+
+_LOGIN_LOG_BY_USER = select(UserLoginLog).where(UserLoginLog.user_id == bindparam('user_id')).limit(1)
+
+_UNUSED_CERTIFICATIONS = select(UserCertification).where(
+    UserCertification.recipient == bindparam('recipient'),
+    UserCertification.use_yn == False
+)
+
+_LATEST_UNUSED_CERTIFICATION = select(UserCertification).where(
+    UserCertification.recipient == bindparam('recipient'),
+    UserCertification.code == bindparam('code'),
+    UserCertification.use_yn == False
+).order_by(desc(UserCertification.created_at)).limit(1)
+
+_RECENT_UNUSED_CERTIFICATION = select(UserCertification).where(
+    UserCertification.recipient == bindparam('recipient'),
+    UserCertification.use_yn == False,
+    UserCertification.created_at >= bindparam('since')
+).limit(1)
+
+def find_user_by_email(email: str) -> Optional[User]:
+    """ 이메일로 사용자 조회 """
+    return db.session.scalars(_USER_BY_EMAIL, {'email': email}).first()
+
+def find_user_by_id(user_id) -> Optional[User]:
+    """ ID로 사용자 조회 """
+    return db.session.scalars(_USER_BY_ID, {'user_id': user_id}).first()
+
+def find_user_ip(ip_str: str) -> Optional[UserIp]:
+    """ IP 문자열로 IP 정보 조회 """
+    return db.session.scalars(_USER_IP_BY_STR, {'ip_str': ip_str}).first()
+
+def find_user_agent(user_agent_str: str) -> Optional[UserAgent]:
+    """ User-Agent 문자열로 User-Agent 정보 조회 """
+    return db.session.scalars(_USER_AGENT_BY_STR, {'user_agent_str': user_agent_str}).first()
+
+def find_login_log(user_id) -> Optional[UserLoginLog]:
+    """ 사용자 로그인 로그 조회 """
+    return db.session.scalars(_LOGIN_LOG_BY_USER, {'user_id': user_id}).first()
+
+def find_unused_certifications(recipient: str) -> List[UserCertification]:
+    """ 수신자의 미사용 인증번호 목록 조회 """
+    return list(db.session.scalars(_UNUSED_CERTIFICATIONS, {'recipient': recipient}))
+
+def find_latest_unused_certification(recipient: str, code: str) -> Optional[UserCertification]:
+    """ 수신자 / 인증번호가 일치하는 가장 최근 미사용 인증번호 조회 """
+    return db.session.scalars(_LATEST_UNUSED_CERTIFICATION, {'recipient': recipient, 'code': code}).first()
+
+def find_recent_unused_certification(recipient: str, since: datetime) -> Optional[UserCertification]:
+    """ 기준 시각 이후 생성된 미사용 인증번호 조회 """
+    return db.session.scalars(_RECENT_UNUSED_CERTIFICATION, {'recipient': recipient, 'since': since}).first()
@@ -1,8 +1,18 @@
 import bcrypt
+from functools import lru_cache
+import uuid
+from typing import Optional
+from sqlalchemy import Boolean, case, column, select, text, update
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from models.user_model.user import User
+from models.user_model.user_setting import UserSetting
+from models.column_types import MYSQL_DIALECTS, unix_timestamp
 from extensions import jwt_manager, app_logger
 from models.user_model.user_profile_update_dto import UserProfileUpdateDTO
 from extensions import db
+from utils.db_router import replica_router
+from service.query_logic.cached_queries import find_user_by_email
 
 def hash_password(password: str) -> str:
     """
@@ -72,6 +82,7 @@ def create_user_token(user: User) -> dict[str, str]:
     except Exception as e:
         raise Exception(f"사용자 토큰 생성 중 오류가 발생했습니다: {e}")
 
+@replica_router.read_only
 def get_user_profile_by_user_info(user_info: dict) -> dict:
     """
     토큰을 사용하여 사용자 프로필을 조회합니다.
@@ -82,7 +93,7 @@ def get_user_profile_by_user_info(user_info: dict) -> dict:
         if not user_email:
             raise Exception("토큰에서 이메일 정보를 찾을 수 없습니다.")
         
-        user = User.query.filter_by(email=user_email).first()
+        user = find_user_by_email(user_email)
         
         if not user:
             raise Exception("사용자를 찾을 수 없습니다.")
@@ -102,7 +113,7 @@ def update_user_profile_by_user_info(user_info: dict, user_profile_update_data:
         if not user_email:
             raise Exception("토큰에서 이메일 정보를 찾을 수 없습니다.")
         
-        user = User.query.filter_by(email=user_email).first()
+        user = find_user_by_email(user_email)
         
         if not user:
             raise Exception("사용자를 찾을 수 없습니다.")
@@ -116,4 +127,294 @@ def update_user_profile_by_user_info(user_info: dict, user_profile_update_data:
         return user.to_dict()
     
     except Exception as e:
-        raise Exception(f"사용자 프로필 수정 중 오류가 발생했습니다: {e}")
\ No newline at end of file
+        raise Exception(f"사용자 프로필 수정 중 오류가 발생했습니다: {e}")
+
+# 소셜 로그인 upsert 입력 컬럼 (VALUES 절 순서)
+SOCIAL_UPSERT_COLUMNS = (
+    ('email', 'VARCHAR'),
+    ('name', 'VARCHAR'),
+    ('nickname', 'VARCHAR'),
+    ('update_name', 'VARCHAR'),
+    ('update_nickname', 'VARCHAR'),
+    ('login_type', 'VARCHAR'),
+    ('user_ip_id', 'BIGINT'),
+    ('user_agent_id', 'BIGINT'),
+)
+
+@lru_cache(maxsize=32)
+def _build_social_upsert_sql(row_count: int) -> str:
+    """
+    소셜 사용자 upsert SQL을 생성합니다. (PostgreSQL 전용)
+    신규 사용자의 설정 생성, 사용자 생성/갱신을 하나의 CTE 구문으로 처리합니다.
+    설정 ID는 미리 발급만 하고, 사용자 행에 실제로 반영된 경우에만 설정을 생성합니다.
+    (동시 첫 로그인에서 충돌로 진 요청은 설정을 만들지 않으므로 고아 user_setting 이 남지 않음)
+    """
+    input_columns = ', '.join(name for name, _ in SOCIAL_UPSERT_COLUMNS)
+    values = ',\n        '.join(
+        '(' + ', '.join(f"CAST(:{name}_{i} AS {sql_type})" for name, sql_type in SOCIAL_UPSERT_COLUMNS) + ')'
+        for i in range(row_count)
+    )
+    returning = ', '.join(f"u.{c.name}" for c in User.__table__.columns)
+    
+    return f"""
+    WITH input_rows ({input_columns}) AS (
+        VALUES
+        {values}
+    ),
+    new_rows AS (
+        SELECT i.email, nextval(pg_get_serial_sequence('user_setting', 'id')) AS user_setting_id
+        FROM input_rows i
+        WHERE NOT EXISTS (SELECT 1 FROM users e WHERE e.email = i.email)
+    ),
+    upserted AS (
+        INSERT INTO users AS u (
+            name, email, nickname, gender, bio, login_type,
+            user_ip_id, user_agent_id, user_setting_id, created_at_unix
+        )
+        SELECT i.name, i.email, i.nickname, '', '', i.login_type,
+               i.user_ip_id, i.user_agent_id, n.user_setting_id, CAST(EXTRACT(epoch FROM now()) AS BIGINT)
+        FROM input_rows i
+        LEFT JOIN new_rows n ON n.email = i.email
+        ON CONFLICT (email) DO UPDATE SET
+            user_ip_id = EXCLUDED.user_ip_id,
+            user_agent_id = EXCLUDED.user_agent_id,
+            login_type = EXCLUDED.login_type,
+            user_setting_id = COALESCE(u.user_setting_id, EXCLUDED.user_setting_id),
+            name = COALESCE(
+                NULLIF(u.name, ''),
+                NULLIF((SELECT r.update_name FROM input_rows r WHERE r.email = EXCLUDED.email), ''),
+                u.name
+            ),
+            nickname = COALESCE(
+                NULLIF(u.nickname, ''),
+                NULLIF((SELECT r.update_nickname FROM input_rows r WHERE r.email = EXCLUDED.email), ''),
+                u.nickname
+            )
+        RETURNING {returning}, (u.xmax = 0) AS inserted
+    ),
+    new_settings AS (
+        INSERT INTO user_setting (id, dark_mode, editor_mode, lang_cd)
+        SELECT n.user_setting_id, 'N', 'light', 'ko'
+        FROM new_rows n
+        JOIN upserted u ON u.email = n.email AND u.user_setting_id = n.user_setting_id
+    )
+    SELECT * FROM upserted
+    """
+
+def _upsert_social_users_orm(rows: list[dict]) -> list[tuple[User, bool]]:
+    """
+    ORM 기반 소셜 사용자 upsert (PostgreSQL / MariaDB 이외의 DB용)
+    """
+    results = []
+    for row in rows:
+        user = find_user_by_email(row['email'])
+        is_need_info = False
+        
+        if not user:
+            is_need_info = True
+            
+            new_user_setting = UserSetting(
+                dark_mode='N',
+                editor_mode='light',
+                lang_cd='ko'
+            )
+            db.session.add(new_user_setting)
+            db.session.flush()
+            
+            user = User(
+                name=row['name'],
+                email=row['email'],
+                nickname=row['nickname'],
+                gender='',
+                bio='',
+                login_type=row['login_type'],
+                user_ip_id=row['user_ip_id'],
+                user_agent_id=row['user_agent_id'],
+                user_setting_id=new_user_setting.id
+            )
+            db.session.add(user)
+            db.session.flush()
+        else:
+            user.user_ip_id = row['user_ip_id']
+            user.user_agent_id = row['user_agent_id']
+            user.login_type = row['login_type']
+            if row.get('update_name') and not user.name:
+                user.name = row['update_name']
+            if row.get('update_nickname') and not user.nickname:
+                user.nickname = row['update_nickname']
+        
+        results.append((user, is_need_info))
+    return results
+
+def _upsert_social_users_postgresql(rows: list[dict]) -> list[tuple[User, bool]]:
+    """
+    PostgreSQL 소셜 사용자 upsert - 사용자 설정 생성과 사용자 upsert를 단일 구문(1회 왕복)으로 처리합니다.
+    """
+    params = {}
+    for i, row in enumerate(rows):
+        for name, _ in SOCIAL_UPSERT_COLUMNS:
+            params[f"{name}_{i}"] = row.get(name)
+    
+    statement = text(_build_social_upsert_sql(len(rows))).columns(
+        *User.__table__.columns,
+        column('inserted', Boolean)
+    )
+    result = db.session.execute(
+        select(User, statement.selected_columns.inserted)
+        .from_statement(statement)
+        .execution_options(populate_existing=True),
+        params
+    )
+    return [(user, bool(inserted)) for user, inserted in result]
+
+@lru_cache(maxsize=8)
+def _mysql_auto_increment_step(engine_url: str) -> int:
+    """
+    AUTO_INCREMENT 증가폭 (Galera 등에서 1이 아닐 수 있음, 프로세스당 1회 조회)
+    """
+    return int(db.session.execute(text('SELECT @@auto_increment_increment')).scalar() or 1)
+
+def _create_user_settings_mysql(users: list[User]) -> None:
+    """
+    MariaDB / MySQL 신규 사용자 설정 생성 후 연결 (사용자 수와 관계없이 INSERT 1회 + UPDATE 1회)
+    RETURNING 없이 다중 행 INSERT 의 LAST_INSERT_ID() (첫 행 ID) 와 증가폭으로 ID를 계산합니다.
+    (VALUES 다중 행 INSERT 는 InnoDB 의 모든 innodb_autoinc_lock_mode 에서 연속된 ID를 한 번에 할당)
+    """
+    step = _mysql_auto_increment_step(str(db.engine.url))
+    result = db.session.execute(
+        UserSetting.__table__.insert().values([
+            {'dark_mode': 'N', 'editor_mode': 'light', 'lang_cd': 'ko'} for _ in users
+        ])
+    )
+    setting_ids = [result.lastrowid + index * step for index in range(len(users))]
+    
+    users_table = User.__table__
+    db.session.execute(
+        update(users_table)
+        .where(users_table.c.id.in_([user.id for user in users]))
+        .values(user_setting_id=case(
+            *((users_table.c.id == user.id, setting_id) for user, setting_id in zip(users, setting_ids)),
+            else_=users_table.c.user_setting_id
+        ))
+    )
+    # 이미 DB에 반영된 값이므로 세션 객체에는 변경 없이 반영
+    for user, setting_id in zip(users, setting_ids):
+        set_committed_value(user, 'user_setting_id', setting_id)
+
+def _upsert_social_users_mysql(rows: list[dict]) -> list[tuple[User, bool]]:
+    """
+    MariaDB / MySQL 소셜 사용자 upsert
+    기존 사용자 일괄 조회 → INSERT ... ON DUPLICATE KEY UPDATE → 재조회 → 실제로 생성된 사용자만 설정 생성 / 연결 순으로
+    신규 사용자 수와 관계없이 고정된 횟수의 왕복으로 처리합니다.
+    (동시 첫 로그인에서 충돌로 진 요청은 설정을 만들지 않으므로 고아 user_setting 이 남지 않음)
+    """
+    emails = [row['email'] for row in rows]
+    existing = {
+        user.email: user
+        for user in db.session.scalars(select(User).where(User.email.in_(emails)))
+    }
+    
+    # 기존 사용자: 비어있는 이름 / 닉네임만 보완 (flush 시 일괄 UPDATE)
+    for row in rows:
+        user = existing.get(row['email'])
+        if user is None:
+            continue
+        user.user_ip_id = row['user_ip_id']
+        user.user_agent_id = row['user_agent_id']
+        user.login_type = row['login_type']
+        if row.get('update_name') and not user.name:
+            user.name = row['update_name']
+        if row.get('update_nickname') and not user.nickname:
+            user.nickname = row['update_nickname']
+    
+    new_rows = [row for row in rows if row['email'] not in existing]
+    new_ids = {}
+    if new_rows:
+        now_unix = unix_timestamp()
+        values = []
+        for row in new_rows:
+            new_ids[row['email']] = uuid.uuid4()
+            values.append({
+                'id': new_ids[row['email']],
+                'name': row['name'],
+                'email': row['email'],
+                'nickname': row['nickname'],
+                'gender': '',
+                'bio': '',
+                'login_type': row['login_type'],
+                'user_ip_id': row['user_ip_id'],
+                'user_agent_id': row['user_agent_id'],
+                'user_setting_id': None,
+                'created_at_unix': now_unix
+            })
+        
+        # 조회 이후 다른 요청이 먼저 생성한 경우에는 접속 정보만 갱신
+        statement = mysql_insert(User.__table__).values(values)
+        statement = statement.on_duplicate_key_update(
+            user_ip_id=statement.inserted.user_ip_id,
+            user_agent_id=statement.inserted.user_agent_id,
+            login_type=statement.inserted.login_type
+        )
+        db.session.execute(statement)
+        
+        for user in db.session.scalars(
+            select(User)
+            .where(User.email.in_(list(new_ids)))
+            .execution_options(populate_existing=True)
+        ):
+            existing[user.email] = user
+        
+        # 이 요청이 생성한 사용자에게만 설정 생성 후 연결
+        created = [existing[email] for email, user_id in new_ids.items() if existing[email].id == user_id]
+        if created:
+            _create_user_settings_mysql(created)
+    
+    return [
+        (existing[row['email']], existing[row['email']].id == new_ids.get(row['email']))
+        for row in rows
+    ]
+
+def upsert_social_users(rows: list[dict]) -> list[tuple[User, bool]]:
+    """
+    소셜 로그인 사용자들을 일괄 생성 또는 갱신합니다.
+    DB별 upsert 구문을 사용하며, 그 외 DB는 ORM으로 처리합니다.
+    
+    rows 항목: email, name, nickname, update_name, update_nickname, login_type, user_ip_id, user_agent_id
+    반환: 입력 순서대로 (사용자, 신규 생성 여부) 목록
+    """
+    if not rows:
+        return []
+    
+    # 같은 구문에서 동일 행을 두 번 갱신할 수 없으므로 이메일 기준 중복 제거 (마지막 값 우선)
+    unique_rows = list({row['email']: row for row in rows}.values())
+    
+    dialect_name = db.engine.dialect.name
+    if dialect_name == 'postgresql':
+        upserted_rows = _upsert_social_users_postgresql(unique_rows)
+    elif dialect_name in MYSQL_DIALECTS:
+        upserted_rows = _upsert_social_users_mysql(unique_rows)
+    else:
+        upserted_rows = _upsert_social_users_orm(unique_rows)
+    
+    upserted = {user.email: (user, is_need_info) for user, is_need_info in upserted_rows}
+    return [upserted[row['email']] for row in rows]
+
+def upsert_social_user(email: str, name: str, nickname: str, login_type: str,
+                       user_ip_id: int, user_agent_id: int,
+                       update_name: Optional[str] = None,
+                       update_nickname: Optional[str] = None) -> tuple[User, bool]:
+    """
+    소셜 로그인 사용자를 생성 또는 갱신합니다.
+    name, nickname은 신규 생성 시 사용되며, update_name, update_nickname은
+    기존 사용자의 값이 비어있을 때만 반영됩니다.
+    """
+    return upsert_social_users([{
+        'email': email,
+        'name': name,
+        'nickname': nickname,
+        'update_name': update_name,
+        'update_nickname': update_nickname,
+        'login_type': login_type,
+        'user_ip_id': user_ip_id,
+        'user_agent_id': user_agent_id
+    }])[0]
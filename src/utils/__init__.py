@@ -1,12 +1,139 @@
-from .func import *
-from .jwt_manager import *
-from .loging_manager import *
-from .transacation_manager import *
-from .email_manager import *
-from .tunnel_manager import *
-from .auth_decorator import *
-from .naver_manager import *
-from .kakao_manager import *
-from .google_manager import *
-
-__all__ = [function_name for function_name in dir() if not function_name.startswith('__')]
\ No newline at end of file
+import importlib
+from typing import Any, List
+
+# 공개 이름 -> 정의된 하위 모듈 (접근 시점에 해당 모듈만 import)
+# 하위 모듈과 이름이 같은 전역 인스턴스(jwt_manager, tunnel_manager 등)는
+# `from utils.jwt_manager import jwt_manager` 처럼 모듈에서 직접 가져와야 함
+_LAZY_ATTRS = {
+    # func
+    'create_error_response': 'func',
+    'validate_request_json': 'func',
+    'validate_required_fields': 'func',
+    'handle_database_operation': 'func',
+    'create_user_login_log': 'func',
+    'get_user_ip': 'func',
+    'get_user_agent': 'func',
+    # jwt_manager
+    'JWTManager': 'jwt_manager',
+    # loging_manager
+    'ACCESS_LOG_FIELDS': 'loging_manager',
+    'BoundedQueueHandler': 'loging_manager',
+    'LogDispatcher': 'loging_manager',
+    'AccessLogFormatter': 'loging_manager',
+    'LoggingManager': 'loging_manager',
+    'logger_manager': 'loging_manager',
+    'setup_logging': 'loging_manager',
+    'get_app_logger': 'loging_manager',
+    'get_api_logger': 'loging_manager',
+    'get_error_logger': 'loging_manager',
+    'get_database_logger': 'loging_manager',
+    'log_info': 'loging_manager',
+    'log_error': 'loging_manager',
+    'log_warning': 'loging_manager',
+    'log_debug': 'loging_manager',
+    # transacation_manager
+    'get_transaction_logger': 'transacation_manager',
+    'transaction_managed': 'transacation_manager',
+    'safe_commit': 'transacation_manager',
+    'safe_rollback': 'transacation_manager',
+    'TransactionManager': 'transacation_manager',
+    # email_manager
+    'EmailManager': 'email_manager',
+    # tunnel_manager
+    'SSHTunnel': 'tunnel_manager',
+    'TunnelManager': 'tunnel_manager',
+    # auth_decorator
+    'require_auth': 'auth_decorator',
+    'require_permission': 'auth_decorator',
+    'require_admin': 'auth_decorator',
+    # naver_manager / kakao_manager / google_manager
+    'NaverManager': 'naver_manager',
+    'RateLimiter': 'kakao_manager',
+    'FriendUuidCache': 'kakao_manager',
+    'KaKaoManager': 'kakao_manager',
+    'GoogleManager': 'google_manager',
+    # oauth_state_manager
+    'MemoryStateBackend': 'oauth_state_manager',
+    'RedisStateBackend': 'oauth_state_manager',
+    'OAuthStateManager': 'oauth_state_manager',
+    # circuit_breaker
+    'ProviderUnavailableError': 'circuit_breaker',
+    'CircuitOpenError': 'circuit_breaker',
+    'BulkheadFullError': 'circuit_breaker',
+    'CircuitBreaker': 'circuit_breaker',
+    'Bulkhead': 'circuit_breaker',
+    'ProviderGuard': 'circuit_breaker',
+    'CircuitBreakerManager': 'circuit_breaker',
+    'circuit_breaker_manager': 'circuit_breaker',
+    # hot_path_logger
+    'HotPathLogger': 'hot_path_logger',
+    # metrics_manager
+    'Labels': 'metrics_manager',
+    'CollectedMetric': 'metrics_manager',
+    'METRIC_PREFIX': 'metrics_manager',
+    'HistogramSpec': 'metrics_manager',
+    'MetricsRegistry': 'metrics_manager',
+    'metrics_registry': 'metrics_manager',
+    # slow_query_logger
+    'normalize_sql': 'slow_query_logger',
+    'sql_fingerprint': 'slow_query_logger',
+    'parameter_shape': 'slow_query_logger',
+    'SlowQueryLogger': 'slow_query_logger',
+    # query_tracker
+    'NPlusOneDetected': 'query_tracker',
+    'RequestQueryStats': 'query_tracker',
+    'QueryTracker': 'query_tracker',
+    # request_profiler
+    'StackSampler': 'request_profiler',
+    'RequestProfiler': 'request_profiler',
+    'setup_profiling': 'request_profiler',
+    # tracing
+    'Span': 'tracing',
+    'BatchSpanExporter': 'tracing',
+    'Tracer': 'tracing',
+    'tracer': 'tracing',
+    'setup_tracing': 'tracing',
+    # health_checker
+    'HEALTH_OK': 'health_checker',
+    'HEALTH_DEGRADED': 'health_checker',
+    'HEALTH_FAIL': 'health_checker',
+    'HEALTH_SKIPPED': 'health_checker',
+    'CheckResult': 'health_checker',
+    'HealthChecker': 'health_checker',
+    # runtime_registry
+    'RuntimeRegistry': 'runtime_registry',
+    # db_router
+    'REPLICA_BIND_PREFIX': 'db_router',
+    'is_replica_bind': 'db_router',
+    'ReplicaRouter': 'db_router',
+    'replica_router': 'db_router',
+    'RoutingSession': 'db_router',
+    # index_checker
+    'EXPECTED_INDEXES': 'index_checker',
+    'IndexChecker': 'index_checker',
+}
+
+_SUBMODULES = (
+    'func', 'jwt_manager', 'loging_manager', 'transacation_manager', 'email_manager',
+    'tunnel_manager', 'auth_decorator', 'naver_manager', 'kakao_manager', 'google_manager',
+    'oauth_state_manager', 'circuit_breaker', 'hot_path_logger', 'metrics_manager',
+    'slow_query_logger', 'query_tracker', 'request_profiler', 'tracing', 'health_checker',
+    'runtime_registry', 'db_router', 'index_checker'
+)
+
+def __getattr__(name: str) -> Any:
+    """하위 모듈 / 공개 이름 지연 로딩"""
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # 다음 접근부터는 __getattr__ 를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_SUBMODULES))
+
+__all__ = list(_LAZY_ATTRS)
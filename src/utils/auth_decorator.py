@@ -1,5 +1,7 @@
 from functools import wraps
 from flask import request
+import settings
+from .hot_path_logger import hot_path_logger
 
 def require_auth(f):
     """인증 데코레이터"""
@@ -50,11 +52,18 @@ def require_auth(f):
                 'message': '액세스 토큰이 필요합니다.'
             }, 401
         
-        app_logger.info(f"인증 성공: {payload.get('user_id', 'unknown')}")
+        hot_path_logger.info(app_logger, 'auth.require_auth', "인증 성공: %s", payload.get('user_id', 'unknown'))
         return f(*args, **kwargs)
     
     return decorated_function
 
+def has_permission(user, required_permission: list) -> bool:
+    """사용자 역할(users.role_id)이 요청한 권한을 모두 가지는지 확인 (PERMISSION_ROLE_IDS 기준)"""
+    if user.role_id is None:
+        return False
+    permission_roles = getattr(settings, 'PERMISSION_ROLE_IDS', {})
+    return all(user.role_id in permission_roles.get(permission, ()) for permission in required_permission)
+
 def require_permission(required_permission: list = None):
     """권한 검증 데코레이터"""
     def decorator(f):
@@ -62,7 +71,7 @@ def require_permission(required_permission: list = None):
         def decorated_function(*args, **kwargs):
             try:
                 from extensions import jwt_manager, app_logger, db
-                from models.user_model.user import User
+                from service.query_logic.cached_queries import find_user_by_id
             except ImportError:
                 from .jwt_manager import jwt_manager
                 import logging
@@ -88,6 +97,12 @@ def require_permission(required_permission: list = None):
                     'message': '유효하지 않은 토큰입니다.',
                 }, 401
             
+            if payload.get('type') != 'access':
+                return {
+                    'status': 'error',
+                    'message': '액세스 토큰이 필요합니다.',
+                }, 401
+            
             # 권한 검증
             user_id = payload.get('user_id')
             if not user_id:
@@ -98,7 +113,7 @@ def require_permission(required_permission: list = None):
             
             # 사용자 조회
             try:
-                user = User.query.filter_by(id=user_id).first()
+                user = find_user_by_id(user_id)
                 if not user:
                     app_logger.warning(f"권한 검증 실패: 사용자를 찾을 수 없음 - {user_id}")
                     return {
@@ -106,7 +121,8 @@ def require_permission(required_permission: list = None):
                         'message': '사용자를 찾을 수 없습니다.'
                     }, 404
                 
-                if not user.is_active:
+                # 로그인 차단(login_yn = False) 사용자
+                if user.login_yn is False:
                     app_logger.warning(f"권한 검증 실패: 비활성화된 사용자 - {user_id}")
                     return {
                         'status': 'error',
@@ -114,15 +130,12 @@ def require_permission(required_permission: list = None):
                     }, 403
                 
                 # 권한 검증
-                if required_permission and not user.has_permission(required_permission):
+                if required_permission and not has_permission(user, required_permission):
                     app_logger.warning(f"권한 검증 실패: 필요한 권한 없음 - {user_id} - {required_permission}")
                     return {
                         'status': 'error',
                         'message': '이 작업을 수행 할 권한이 없습니다.'
                     }, 403
-                
-                app_logger.info(f"권한 검증 성공: {user_id} - {required_permission}")
-                return f(*args, **kwargs)
             
             except Exception as e:
                 app_logger.error(f"권한 검증 중 오류: {str(e)}")
@@ -131,6 +144,9 @@ def require_permission(required_permission: list = None):
                     'message': '권한 검증 중 오류가 발생했습니다.'
                 }, 500
             
+            app_logger.info(f"권한 검증 성공: {user_id} - {required_permission}")
+            return f(*args, **kwargs)
+            
         return decorated_function
     return decorator
 
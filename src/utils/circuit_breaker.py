@@ -0,0 +1,272 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+import requests
+import settings
+from .tracing import tracer
+from .runtime_registry import runtime_registry
+
+class ProviderUnavailableError(Exception):
+    """외부 제공자 호출 불가 (빠른 실패)"""
+
+class CircuitOpenError(ProviderUnavailableError):
+    """서킷이 열려 있어 호출 거부"""
+
+class BulkheadFullError(ProviderUnavailableError):
+    """동시 호출 한도 초과로 호출 거부"""
+
+class CircuitBreaker:
+    """ 오류율/지연 기반 서킷 브레이커 """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_rate_threshold: float = 0.5,
+                 slow_call_seconds: float = 3.0, slow_call_rate_threshold: float = 0.8,
+                 window_size: int = 20, min_calls: int = 10,
+                 open_seconds: float = 30.0, half_open_max_calls: int = 1):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self.state = self.CLOSED
+        self._window: deque = deque(maxlen=window_size)
+        self._window_failures = 0
+        self._window_slow = 0
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._lock = threading.Lock()
+
+        self.total_calls = 0
+        self.total_failures = 0
+        self.total_slow_calls = 0
+        self.rejected_calls = 0
+        self.opened_count = 0
+
+    def _reset_window(self) -> None:
+        self._window.clear()
+        self._window_failures = 0
+        self._window_slow = 0
+
+    def _open(self, now: float) -> None:
+        self.state = self.OPEN
+        self._opened_at = now
+        self._half_open_in_flight = 0
+        self.opened_count += 1
+
+    def before_call(self) -> None:
+        """호출 허용 여부 확인 - 거부 시 CircuitOpenError"""
+        now = time.monotonic()
+        with self._lock:
+            if self.state == self.OPEN and now - self._opened_at >= self.open_seconds:
+                self.state = self.HALF_OPEN
+                self._half_open_in_flight = 0
+
+            if self.state == self.OPEN or (
+                self.state == self.HALF_OPEN and self._half_open_in_flight >= self.half_open_max_calls
+            ):
+                self.rejected_calls += 1
+                raise CircuitOpenError(f"{self.name} 서비스가 일시적으로 응답하지 않습니다. 잠시 후 다시 시도해주세요.")
+
+            if self.state == self.HALF_OPEN:
+                self._half_open_in_flight += 1
+
+    def release(self) -> None:
+        """결과 기록 없이 호출 허용 반환 (호출이 실행되지 않은 경우)"""
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def record(self, failed: bool, duration: float) -> None:
+        """호출 결과 기록"""
+        slow = duration >= self.slow_call_seconds
+        now = time.monotonic()
+        with self._lock:
+            self.total_calls += 1
+            self.total_failures += failed
+            self.total_slow_calls += slow
+
+            if self.state == self.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if failed or slow:
+                    self._open(now)
+                else:
+                    self.state = self.CLOSED
+                    self._reset_window()
+                return
+
+            if self.state == self.OPEN:
+                return
+
+            # 슬라이딩 윈도우 카운터를 O(1)로 갱신
+            if len(self._window) == self._window.maxlen:
+                old_failed, old_slow = self._window[0]
+                self._window_failures -= old_failed
+                self._window_slow -= old_slow
+            self._window.append((failed, slow))
+            self._window_failures += failed
+            self._window_slow += slow
+
+            calls = len(self._window)
+            if calls >= self.min_calls and (
+                self._window_failures / calls >= self.failure_rate_threshold
+                or self._window_slow / calls >= self.slow_call_rate_threshold
+            ):
+                self._open(now)
+                self._reset_window()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """상태 조회"""
+        with self._lock:
+            calls = len(self._window)
+            return {
+                'state': self.state,
+                'window_calls': calls,
+                'failure_rate': round(self._window_failures / calls, 3) if calls else 0.0,
+                'slow_call_rate': round(self._window_slow / calls, 3) if calls else 0.0,
+                'total_calls': self.total_calls,
+                'total_failures': self.total_failures,
+                'total_slow_calls': self.total_slow_calls,
+                'rejected_calls': self.rejected_calls,
+                'opened_count': self.opened_count
+            }
+
+class Bulkhead:
+    """ 동시 호출 수 제한 """
+
+    def __init__(self, name: str, max_concurrent: int = 8, max_wait_seconds: float = 0.5):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_wait_seconds = max_wait_seconds
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected_calls = 0
+
+    def acquire(self) -> None:
+        """슬롯 획득 - 실패 시 BulkheadFullError"""
+        if not self._semaphore.acquire(timeout=self.max_wait_seconds):
+            with self._lock:
+                self.rejected_calls += 1
+            raise BulkheadFullError(f"{self.name} 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.")
+        with self._lock:
+            self.in_flight += 1
+
+    def release(self) -> None:
+        """슬롯 반환"""
+        with self._lock:
+            self.in_flight -= 1
+        self._semaphore.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """상태 조회"""
+        with self._lock:
+            return {
+                'max_concurrent': self.max_concurrent,
+                'in_flight': self.in_flight,
+                'rejected_calls': self.rejected_calls
+            }
+
+class ProviderGuard:
+    """ 제공자별 서킷 브레이커 + 벌크헤드 """
+
+    def __init__(self, name: str, breaker: CircuitBreaker, bulkhead: Bulkhead, timeout: float = 5.0):
+        self.name = name
+        self.breaker = breaker
+        self.bulkhead = bulkhead
+        self.timeout = timeout
+
+    def call(self, fn: Callable[..., Any], *args,
+             is_failure: Optional[Callable[[Any], bool]] = None, **kwargs) -> Any:
+        """보호된 호출 수행"""
+        self.breaker.before_call()
+        try:
+            self.bulkhead.acquire()
+        except BulkheadFullError:
+            self.breaker.release()
+            raise
+
+        started = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.breaker.record(True, time.perf_counter() - started)
+            raise
+        else:
+            failed = bool(is_failure and is_failure(result))
+            self.breaker.record(failed, time.perf_counter() - started)
+            return result
+        finally:
+            self.bulkhead.release()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """HTTP 요청 (연결 오류, 타임아웃, 5xx 응답을 실패로 기록)"""
+        kwargs.setdefault('timeout', self.timeout)
+        with tracer.span(f"{self.name}.http", method=method, url=url.split('?', 1)[0]) as span:
+            response = self.call(
+                requests.request, method, url,
+                is_failure=lambda response: response.status_code >= 500,
+                **kwargs
+            )
+            span.set_attribute('status_code', response.status_code)
+            return response
+
+    def snapshot(self) -> Dict[str, Any]:
+        """상태 조회"""
+        return {
+            'circuit': self.breaker.snapshot(),
+            'bulkhead': self.bulkhead.snapshot()
+        }
+
+class CircuitBreakerManager:
+    """ 제공자별 ProviderGuard 레지스트리 """
+
+    def __init__(self):
+        self.guards: Dict[str, ProviderGuard] = {}
+        self.lock = threading.Lock()
+
+    def get(self, name: str) -> ProviderGuard:
+        """제공자 가드를 가져오거나 생성"""
+        guard = self.guards.get(name)
+        if guard is not None:
+            return guard
+
+        with self.lock:
+            if name not in self.guards:
+                breaker = CircuitBreaker(
+                    name,
+                    failure_rate_threshold=getattr(settings, 'PROVIDER_CIRCUIT_FAILURE_RATE', 0.5),
+                    slow_call_seconds=getattr(settings, 'PROVIDER_CIRCUIT_SLOW_CALL_SECONDS', 3.0),
+                    slow_call_rate_threshold=getattr(settings, 'PROVIDER_CIRCUIT_SLOW_CALL_RATE', 0.8),
+                    window_size=getattr(settings, 'PROVIDER_CIRCUIT_WINDOW_SIZE', 20),
+                    min_calls=getattr(settings, 'PROVIDER_CIRCUIT_MIN_CALLS', 10),
+                    open_seconds=getattr(settings, 'PROVIDER_CIRCUIT_OPEN_SECONDS', 30),
+                    half_open_max_calls=getattr(settings, 'PROVIDER_CIRCUIT_HALF_OPEN_CALLS', 1)
+                )
+                bulkhead = Bulkhead(
+                    name,
+                    max_concurrent=getattr(settings, 'PROVIDER_BULKHEAD_MAX_CONCURRENT', 8),
+                    max_wait_seconds=getattr(settings, 'PROVIDER_BULKHEAD_MAX_WAIT_SECONDS', 0.5)
+                )
+                self.guards[name] = ProviderGuard(
+                    name, breaker, bulkhead,
+                    timeout=getattr(settings, 'PROVIDER_HTTP_TIMEOUT', 5)
+                )
+            return self.guards[name]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """전체 제공자 상태 조회"""
+        with self.lock:
+            guards = list(self.guards.items())
+        return {name: guard.snapshot() for name, guard in guards}
+
+# 전역 서킷 브레이커 매니저
+circuit_breaker_manager = CircuitBreakerManager()
+
+runtime_registry.register('provider_guards', circuit_breaker_manager.snapshot)
@@ -0,0 +1,216 @@
+import contextvars
+import itertools
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+from flask import Flask
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event, text
+import settings
+from .health_checker import HEALTH_DEGRADED, HEALTH_FAIL, HEALTH_OK, HEALTH_SKIPPED, health_checker
+from .metrics_manager import metrics_registry
+from .runtime_registry import runtime_registry
+
+REPLICA_BIND_PREFIX = 'replica_'
+
+def is_replica_bind(bind_key: Optional[str]) -> bool:
+    """읽기 전용 복제본 바인드 여부"""
+    return bind_key is not None and bind_key.startswith(REPLICA_BIND_PREFIX)
+
+class ReplicaRouter:
+    """ 읽기 전용 함수의 쿼리를 정상 상태인 복제본으로 분산 (장애 시 기본 DB 로 전환) """
+
+    def __init__(self):
+        self.enabled = getattr(settings, 'DB_READ_REPLICA_ENABLED', True)
+        self.retry_seconds = getattr(settings, 'DB_READ_REPLICA_RETRY_SECONDS', 30)
+        self.replica_keys: List[str] = []
+        # 복제본 -> 다시 사용할 수 있는 시각 (monotonic)
+        self.down_until: Dict[str, float] = {}
+        self.last_errors: Dict[str, str] = {}
+        self.db = None
+        # 현재 컨텍스트에서 읽기에 사용할 복제본 바인드 키
+        self.current_replica: contextvars.ContextVar = contextvars.ContextVar('db_read_replica', default=None)
+        self._cursor = itertools.count()
+        self._lock = threading.Lock()
+        self._logger = None
+
+        metrics_registry.register_counter('db_replica_reads_total', '복제본으로 보낸 읽기 쿼리 수')
+        metrics_registry.register_counter('db_replica_failovers_total', '복제본 장애로 기본 DB 에서 재실행한 수')
+
+    @property
+    def logger(self):
+        """로거 lazy loading"""
+        if self._logger is None:
+            try:
+                from extensions import database_logger
+                self._logger = database_logger
+            except ImportError:
+                pass
+            if self._logger is None:
+                # extensions가 아직 초기화되지 않은 경우 기본 로거 사용
+                import logging
+                logger = logging.getLogger('db_router')
+                if not logger.handlers:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter(
+                        '[%(asctime)s] %(levelname)s: %(module)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.INFO)
+                self._logger = logger
+        return self._logger
+
+    def init_app(self, app: Flask, db) -> None:
+        """복제본 바인드 등록 및 연결 오류 감지"""
+        self.db = db
+        with app.app_context():
+            engines = db.engines
+            self.replica_keys = sorted(key for key in engines if is_replica_bind(key))
+            for key in self.replica_keys:
+                self._watch_engine(key, engines[key])
+
+    def _watch_engine(self, key: str, engine) -> None:
+        @event.listens_for(engine, 'handle_error')
+        def mark_replica_down(context):
+            # 연결 실패 / 끊김만 장애로 판단 (SQL 오류는 제외)
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(key, context.original_exception)
+
+    def mark_down(self, key: str, error: Any) -> None:
+        """복제본을 일정 시간 라우팅 대상에서 제외"""
+        with self._lock:
+            already_down = self.down_until.get(key, 0.0) > time.monotonic()
+            self.down_until[key] = time.monotonic() + self.retry_seconds
+            self.last_errors[key] = str(error)[:300]
+        if not already_down:
+            self.logger.warning(f"DB 복제본 장애로 라우팅 제외: {key} ({self.retry_seconds}초) - {str(error)[:300]}")
+
+    def mark_up(self, key: str) -> None:
+        """복제본을 라우팅 대상으로 복귀"""
+        with self._lock:
+            was_down = self.down_until.pop(key, None) is not None
+        if was_down:
+            self.logger.info(f"DB 복제본 라우팅 복귀: {key}")
+
+    def is_down(self, key: str) -> bool:
+        return self.down_until.get(key, 0.0) > time.monotonic()
+
+    def choose(self) -> Optional[str]:
+        """정상 복제본 중 하나 선택 (라운드 로빈, 없으면 None)"""
+        healthy = [key for key in self.replica_keys if not self.is_down(key)]
+        if not healthy:
+            return None
+        return healthy[next(self._cursor) % len(healthy)]
+
+    def read_only(self, func: Callable) -> Callable:
+        """읽기 전용 서비스 함수 표시 - 함수 안의 읽기 쿼리를 복제본으로 보냄
+
+        함수 실행 중 복제본이 장애로 판단되면 기본 DB 로 한 번 재실행
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            # 비활성화 / 복제본 없음 / 바깥 함수에서 이미 선택된 경우
+            if not self.enabled or not self.replica_keys or self.current_replica.get() is not None:
+                return func(*args, **kwargs)
+            key = self.choose()
+            if key is None:
+                return func(*args, **kwargs)
+
+            token = self.current_replica.set(key)
+            try:
+                return func(*args, **kwargs)
+            except Exception:
+                if not self.is_down(key):
+                    raise
+            finally:
+                self.current_replica.reset(token)
+
+            metrics_registry.inc('db_replica_failovers_total', (('bind', key),))
+            self.logger.warning(f"DB 복제본 장애로 기본 DB 에서 재실행: {func.__qualname__} ({key})")
+            self.db.session.rollback()
+            return func(*args, **kwargs)
+        return wrapper
+
+    def check_replicas(self):
+        """복제본 상태 점검 (상태 점검 스레드에서 주기적으로 실행)"""
+        if not self.replica_keys or self.db is None:
+            return HEALTH_SKIPPED, {'reason': '복제본 미설정'}
+        replicas = {}
+        with health_checker.app.app_context():
+            engines = self.db.engines
+            for key in self.replica_keys:
+                try:
+                    with engines[key].connect() as connection:
+                        connection.execute(text('SELECT 1'))
+                    self.mark_up(key)
+                    replicas[key] = 'up'
+                except Exception as e:
+                    self.mark_down(key, e)
+                    replicas[key] = 'down'
+        up = sum(1 for state in replicas.values() if state == 'up')
+        if up == len(replicas):
+            return HEALTH_OK, {'replicas': replicas}
+        # 복제본이 모두 죽어도 읽기는 기본 DB 로 처리됨
+        return (HEALTH_DEGRADED if up else HEALTH_FAIL), {'replicas': replicas}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """복제본 라우팅 상태 조회"""
+        now = time.monotonic()
+        return {
+            'enabled': self.enabled,
+            'replicas': {
+                key: {
+                    'healthy': not self.is_down(key),
+                    'retry_in_seconds': round(max(0.0, self.down_until.get(key, 0.0) - now), 1),
+                    'last_error': self.last_errors.get(key)
+                }
+                for key in self.replica_keys
+            }
+        }
+
+# 전역 복제본 라우터
+replica_router = ReplicaRouter()
+
+class RoutingSession(Session):
+    """ 읽기 전용 함수 안의 읽기 쿼리만 복제본으로 보내는 세션
+
+    쓰기(flush / DML / FOR UPDATE)가 한 번이라도 발생하면 요청이 끝날 때까지 기본 DB 사용 (read-after-write)
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        replica_key = replica_router.current_replica.get()
+        if replica_key is None or bind is not None:
+            return engine
+
+        engines = self._db.engines
+        # 다른 바인드(__bind_key__)로 지정된 모델은 그대로 사용
+        if engine is not engines.get(None) or replica_key not in engines:
+            return engine
+        if not self._can_use_replica(clause):
+            return engine
+
+        metrics_registry.inc('db_replica_reads_total', (('bind', replica_key),))
+        return engines[replica_key]
+
+    def _can_use_replica(self, clause) -> bool:
+        if self._flushing or self.info.get('primary_pinned'):
+            return False
+        if self.new or self.dirty or self.deleted:
+            return False
+        if clause is not None and (getattr(clause, 'is_dml', False)
+                                   or getattr(clause, '_for_update_arg', None) is not None):
+            self.info['primary_pinned'] = True
+            return False
+        return True
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _pin_primary_after_flush(session, flush_context):
+    # 이후 읽기는 복제 지연이 없는 기본 DB 에서 수행
+    session.info['primary_pinned'] = True
+
+health_checker.register('replicas', replica_router.check_replicas, critical=False)
+runtime_registry.register('db_replicas', replica_router.snapshot)
@@ -1,9 +1,6 @@
 import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
 import settings
+from .tracing import tracer
 
 class EmailManager:
     def __init__(self):
@@ -41,6 +38,12 @@ class EmailManager:
                     body_type: str = 'plain',
                     attachments=None):
         """이메일 전송"""
+        # smtplib / MIME 모듈은 실제 전송 시점에만 로드 (import 비용 절감)
+        import smtplib
+        from email.mime.text import MIMEText
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.application import MIMEApplication
+        
         try:
             # 설정 검증
             if not self.user or not self.app_password or not self.smtp_server:
@@ -68,15 +71,16 @@ class EmailManager:
             
             self.logger.info(f"이메일 전송 시도: {to_email}, SMTP: {self.smtp_server}:{self.smtp_port}")
             
-            if self.use_ssl:
-                with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as smtp:
-                    smtp.login(self.user, self.app_password)
-                    smtp.sendmail(self.user, to_email, msg.as_string())
-            else:
-                with smtplib.SMTP(self.smtp_server, self.smtp_port) as smtp:
-                    smtp.starttls()
-                    smtp.login(self.user, self.app_password)
-                    smtp.sendmail(self.user, to_email, msg.as_string())
+            with tracer.span('email.send', smtp_server=self.smtp_server, use_ssl=self.use_ssl):
+                if self.use_ssl:
+                    with smtplib.SMTP_SSL(self.smtp_server, self.smtp_port) as smtp:
+                        smtp.login(self.user, self.app_password)
+                        smtp.sendmail(self.user, to_email, msg.as_string())
+                else:
+                    with smtplib.SMTP(self.smtp_server, self.smtp_port) as smtp:
+                        smtp.starttls()
+                        smtp.login(self.user, self.app_password)
+                        smtp.sendmail(self.user, to_email, msg.as_string())
         
             self.logger.info(f"이메일 전송 완료: {to_email}")
             return True
@@ -39,11 +39,12 @@ def handle_database_operation(func, *args, **kwargs):
 
 def create_user_login_log(user_id, user_ip_id, user_agent_id):
     from models.user_model.user_login_log import UserLoginLog
+    from service.query_logic.cached_queries import find_login_log
     from extensions import db
     from datetime import datetime
     import time
     """사용자 로그인 로그 생성 또는 업데이트"""
-    existing_log = UserLoginLog.query.filter_by(user_id=user_id).first()
+    existing_log = find_login_log(user_id)
     
     if existing_log:
         existing_log.event_at = datetime.now()
@@ -61,12 +62,13 @@ def create_user_login_log(user_id, user_ip_id, user_agent_id):
 def get_user_ip(request, db):
     
     from models.user_model.user_ip import UserIp
+    from service.query_logic.cached_queries import find_user_ip
     
     # 사용자 IP와 User-Agent 정보 추출
     user_ip_str = request.remote_addr
 
     # IP 정보 저장 또는 조회
-    user_ip_record = UserIp.query.filter_by(ip_str=user_ip_str).first()
+    user_ip_record = find_user_ip(user_ip_str)
     if not user_ip_record:
         user_ip_record = UserIp(ip_str=user_ip_str)
         db.session.add(user_ip_record)
@@ -77,11 +79,12 @@ def get_user_ip(request, db):
 def get_user_agent(request, db):
     
     from models.user_model.user_agent import UserAgent
+    from service.query_logic.cached_queries import find_user_agent
     
     user_agent_str = request.headers.get('User-Agent', '')
     
     # User-Agent 정보 저장 또는 조회
-    user_agent_record = UserAgent.query.filter_by(user_agent_str=user_agent_str).first()
+    user_agent_record = find_user_agent(user_agent_str)
     if not user_agent_record:
         user_agent_record = UserAgent(user_agent_str=user_agent_str)
         db.session.add(user_agent_record)
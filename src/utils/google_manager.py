@@ -1,8 +1,10 @@
-import requests
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Optional, Tuple
 import settings
 
+from .oauth_state_manager import oauth_state_manager
+from .circuit_breaker import circuit_breaker_manager
+
 class GoogleManager:
     """ 구글 API 관리 클래스 """
 
@@ -11,6 +13,7 @@ class GoogleManager:
         self.client_secret = getattr(settings, 'GOOGLE_CLIENT_SECRET')
         self.redirect_uri = getattr(settings, 'GOOGLE_REDIRECT_URI')
         self._logger = None
+        self.guard = circuit_breaker_manager.get('google')
 
     @property
     def logger(self):
@@ -35,11 +38,14 @@ class GoogleManager:
                 self._logger = logger
         return self._logger
     
-    def get_auth_url(self, scope: str = "email profile", prompt: str = "consent select_account"):
-        """ 구글 인증 URL 생성 """
+    def get_auth_url(self, scope: str = "email profile", prompt: str = "consent select_account") -> Tuple[str, str]:
+        """ 구글 인증 URL 생성 (state, PKCE 포함) """
         if not self.client_id:
             raise ValueError("GOOGLE_CLIENT_ID 설정이 되지 않았습니다.")
         
+        # 서버에 저장한 state 와 함께 PKCE verifier 보관 (콜백에서 state 로 verifier 조회)
+        issued = oauth_state_manager.issue('google', use_pkce=True)
+        
         auth_url = (
             f"https://accounts.google.com/o/oauth2/v2/auth?"
             f"client_id={self.client_id}&"
@@ -47,11 +53,14 @@ class GoogleManager:
             f"response_type=code&"
             f"scope={scope}&"
             f"prompt={prompt}&"
-            f"access_type=offline"
+            f"access_type=offline&"
+            f"state={issued['state']}&"
+            f"code_challenge={issued['code_challenge']}&"
+            f"code_challenge_method=S256"
         )
-        return auth_url
+        return auth_url, issued['state']
     
-    def exchange_code_for_token(self, code: str) -> Dict:
+    def exchange_code_for_token(self, code: str, code_verifier: Optional[str] = None) -> Dict:
         """ 인증 코드를 액세스 토큰으로 교환 """
         if not self.client_id or not self.client_secret:
             raise ValueError("GOOGLE_CLIENT_ID 또는 GOOGLE_CLIENT_SECRET 설정이 되지 않았습니다.")
@@ -64,8 +73,10 @@ class GoogleManager:
             "redirect_uri": self.redirect_uri,
             "code": code
         }
+        if code_verifier:
+            data["code_verifier"] = code_verifier
 
-        response = requests.post(token_url, data=data)
+        response = self.guard.request('POST', token_url, data=data)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -87,7 +98,7 @@ class GoogleManager:
             "refresh_token": refresh_token
         }
 
-        response = requests.post(refresh_url, data=data)
+        response = self.guard.request('POST', refresh_url, data=data)
 
         if response.status_code != 200:
             error_data = response.json()
@@ -99,7 +110,7 @@ class GoogleManager:
     def get_token_info(self, access_token: str) -> Dict:
         """ 액세스 토큰 정보 조회 """
         token_info_url = "https://www.googleapis.com/token_info?access_token={access_token}"
-        response = requests.get(token_info_url)
+        response = self.guard.request('GET', token_info_url)
 
         if response.status_code != 200:
             error_data = response.json()
@@ -111,7 +122,7 @@ class GoogleManager:
     def get_user_info(self, access_token: str) -> Dict:
         """ 구글 사용자 기본  정보 조회 """
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get("https://www.googleapis.com/oauth2/v2/userinfo", headers=headers)
+        response = self.guard.request('GET', "https://www.googleapis.com/oauth2/v2/userinfo", headers=headers)
 
         if response.status_code != 200:
             error_data = response.json()
@@ -0,0 +1,287 @@
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from flask import Flask
+from sqlalchemy import text
+import settings
+from .runtime_registry import runtime_registry
+
+HEALTH_OK = 'ok'
+HEALTH_DEGRADED = 'degraded'
+HEALTH_FAIL = 'fail'
+HEALTH_SKIPPED = 'skipped'
+
+# (상태, 상세 정보)
+CheckResult = Tuple[str, Dict[str, Any]]
+
+# 인증 없는 준비 상태 응답에 포함하는 항목별 필드 (예외 메시지 / 접속 정보는 관리자 런타임 조회에서만)
+PUBLIC_CHECK_FIELDS = ('status', 'reason')
+
+class HealthChecker:
+    """ 준비 상태(readiness) 점검 - 백그라운드 프로브만 점검하고 요청에는 마지막 결과를 제공 """
+
+    def __init__(self):
+        self.probe_interval_seconds = getattr(settings, 'HEALTH_PROBE_INTERVAL_SECONDS', 5)
+        # 프로브가 멈춰 결과가 갱신되지 않으면 이 시간 이후 준비 불가로 표시
+        self.stale_after_seconds = getattr(settings, 'HEALTH_STALE_AFTER_SECONDS', None) or self.probe_interval_seconds * 3
+        self.check_timeout_seconds = getattr(settings, 'HEALTH_CHECK_TIMEOUT_SECONDS', 2)
+        self.pool_saturation_threshold = getattr(settings, 'HEALTH_POOL_SATURATION_THRESHOLD', 0.9)
+        self.app: Optional[Flask] = None
+        # 이름 -> (점검 함수, 실패 시 준비 불가 여부)
+        self.checks: Dict[str, Tuple[Callable[[], CheckResult], bool]] = {}
+        self.started_at = time.time()
+        self._report: Optional[Dict[str, Any]] = None
+        self._report_at = 0.0
+        self._database_probe: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_pid: Optional[int] = None
+        self._logger = None
+
+        self.register('database', self._check_database, critical=True)
+        self.register('pool', self._check_pool, critical=True)
+        self.register('tunnel', self._check_tunnel, critical=True)
+        self.register('email', self._check_email, critical=False)
+        self.register('providers', self._check_providers, critical=False)
+
+    @property
+    def logger(self):
+        """로거 lazy loading"""
+        if self._logger is None:
+            try:
+                from extensions import app_logger
+                self._logger = app_logger
+            except ImportError:
+                pass
+            if self._logger is None:
+                # extensions가 아직 초기화되지 않은 경우 기본 로거 사용
+                import logging
+                logger = logging.getLogger('health_checker')
+                if not logger.handlers:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter(
+                        '[%(asctime)s] %(levelname)s: %(module)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.INFO)
+                self._logger = logger
+        return self._logger
+
+    def init_app(self, app: Flask) -> None:
+        """점검에 사용할 Flask 앱 등록"""
+        self.app = app
+
+    def register(self, name: str, check: Callable[[], CheckResult], critical: bool = False) -> None:
+        """점검 항목 등록 (critical=True 이면 실패 시 준비 불가)"""
+        self.checks[name] = (check, critical)
+
+    def _engine(self):
+        from extensions import db
+        with self.app.app_context():
+            return db.engine
+
+    def _ping_database(self, connection) -> None:
+        """SELECT 1 (DB별 문장 실행 시간 제한 적용)"""
+        timeout_ms = int(self.check_timeout_seconds * 1000)
+        dialect = connection.dialect
+        if dialect.name == 'postgresql':
+            # 점검 트랜잭션에만 적용 (연결 반환 시 롤백되어 원래 값으로 복구)
+            connection.execute(text(f"SET LOCAL statement_timeout = {timeout_ms}"))
+            connection.execute(text('SELECT 1'))
+        elif getattr(dialect, 'is_mariadb', False):
+            connection.execute(text(f"SET STATEMENT max_statement_time = {timeout_ms / 1000} FOR SELECT 1"))
+        elif dialect.name == 'mysql':
+            connection.execute(text(f"SELECT /*+ MAX_EXECUTION_TIME({timeout_ms}) */ 1"))
+        else:
+            connection.execute(text('SELECT 1'))
+
+    def _check_database(self) -> CheckResult:
+        if self.app is None:
+            return HEALTH_SKIPPED, {'reason': '앱이 초기화되지 않았습니다.'}
+        # 이전 점검이 멈춰 있으면 점검 스레드를 더 만들지 않음
+        if self._database_probe is not None and self._database_probe.is_alive():
+            return HEALTH_FAIL, {'reason': '이전 DB 점검이 아직 끝나지 않았습니다.'}
+
+        engine = self._engine()
+        result: Dict[str, str] = {}
+
+        def ping():
+            try:
+                with engine.connect() as connection:
+                    self._ping_database(connection)
+            except Exception as e:
+                result['error'] = str(e)[:300]
+
+        # 풀 대기 / 접속 / 쿼리 전체를 check_timeout_seconds 로 제한
+        self._database_probe = threading.Thread(target=ping, name='health-db-check', daemon=True)
+        self._database_probe.start()
+        self._database_probe.join(self.check_timeout_seconds)
+        if self._database_probe.is_alive():
+            return HEALTH_FAIL, {'reason': f"DB 점검 시간 초과 ({self.check_timeout_seconds}초)"}
+        if 'error' in result:
+            return HEALTH_FAIL, {'error': result['error']}
+        return HEALTH_OK, {}
+
+    def _check_pool(self) -> CheckResult:
+        if self.app is None:
+            return HEALTH_SKIPPED, {'reason': '앱이 초기화되지 않았습니다.'}
+        pool = self._engine().pool
+        if not hasattr(pool, 'checkedout'):
+            return HEALTH_SKIPPED, {'pool': type(pool).__name__}
+
+        checked_out = pool.checkedout()
+        capacity = pool.size() + max(getattr(pool, '_max_overflow', 0), 0)
+        saturation = checked_out / capacity if capacity > 0 else 0.0
+        details = {
+            'checked_out': checked_out,
+            'capacity': capacity,
+            'overflow': pool.overflow(),
+            'saturation': round(saturation, 3)
+        }
+        return (HEALTH_FAIL if saturation >= self.pool_saturation_threshold else HEALTH_OK), details
+
+    def _check_tunnel(self) -> CheckResult:
+        import config
+        from .tunnel_manager import tunnel_manager
+
+        if not config.Config.should_use_tunnel():
+            return HEALTH_SKIPPED, {'reason': 'SSH 터널링 미사용'}
+        tunnels = {key: tunnel.is_active() for key, tunnel in list(tunnel_manager.tunnels.items())}
+        if not tunnels or not any(tunnels.values()):
+            return HEALTH_FAIL, {'tunnels': tunnels}
+        if not all(tunnels.values()):
+            # 터널 풀 일부만 죽은 경우 나머지 터널로 연결이 분산됨
+            return HEALTH_DEGRADED, {'tunnels': tunnels}
+        return HEALTH_OK, {'tunnels': tunnels}
+
+    def _check_email(self) -> CheckResult:
+        host = getattr(settings, 'EMAIL_SMTP_SERVER', '')
+        port = getattr(settings, 'EMAIL_SMTP_PORT', 0)
+        if not host or not port:
+            return HEALTH_SKIPPED, {'reason': '이메일 설정 없음'}
+        # 로그인 없이 TCP 연결만 확인
+        with socket.create_connection((host, int(port)), timeout=self.check_timeout_seconds):
+            pass
+        return HEALTH_OK, {'smtp': f"{host}:{port}"}
+
+    def _check_providers(self) -> CheckResult:
+        # 실제 트래픽으로 갱신되는 서킷 상태를 사용 (점검용 외부 호출 없음)
+        from .circuit_breaker import CircuitBreaker, circuit_breaker_manager
+
+        states = {
+            provider: snapshot['circuit']['state']
+            for provider, snapshot in circuit_breaker_manager.snapshot().items()
+        }
+        if any(state != CircuitBreaker.CLOSED for state in states.values()):
+            return HEALTH_DEGRADED, {'circuits': states}
+        return HEALTH_OK, {'circuits': states}
+
+    def run_checks(self) -> Dict[str, Any]:
+        """모든 점검 수행 후 결과 캐시"""
+        results: Dict[str, Dict[str, Any]] = {}
+        ready = True
+        degraded = False
+
+        for name, (check, critical) in list(self.checks.items()):
+            started = time.perf_counter()
+            try:
+                status, details = check()
+            except Exception as e:
+                status, details = HEALTH_FAIL, {'error': str(e)[:300]}
+            results[name] = {
+                'status': status,
+                'critical': critical,
+                'latency_ms': round((time.perf_counter() - started) * 1000, 2),
+                **details
+            }
+            if status == HEALTH_FAIL:
+                if critical:
+                    ready = False
+                else:
+                    degraded = True
+            elif status == HEALTH_DEGRADED:
+                degraded = True
+
+        report = {
+            'status': 'unhealthy' if not ready else ('degraded' if degraded else 'healthy'),
+            'ready': ready,
+            'stale': False,
+            'checked_at': time.time(),
+            'checks': results
+        }
+
+        previous = self._report
+        self._report = report
+        self._report_at = time.monotonic()
+        for name, result in results.items():
+            # 같은 오류는 상태가 바뀔 때만 기록 (점검 주기마다 반복하지 않음)
+            if 'error' in result and (previous or {}).get('checks', {}).get(name, {}).get('error') != result['error']:
+                self.logger.warning(f"상태 점검 실패: {name} - {result['error']}")
+        if previous is not None and previous['status'] != report['status']:
+            self.logger.warning(f"준비 상태 변경: {previous['status']} -> {report['status']}")
+        return report
+
+    def _ensure_probe(self) -> None:
+        # fork 이후 자식 프로세스에는 스레드가 없으므로 PID 기준으로 재시작
+        pid = os.getpid()
+        if self._thread is not None and self._thread_pid == pid and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is not None and self._thread_pid == pid and self._thread.is_alive():
+                return
+            self._thread_pid = pid
+            self._thread = threading.Thread(target=self._probe_loop, name='health-probe', daemon=True)
+            self._thread.start()
+
+    def _probe_loop(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                self.run_checks()
+            except Exception as e:
+                self.logger.error(f"상태 점검 중 오류: {str(e)}")
+            # 점검 소요 시간을 빼서 점검 시작 간격을 일정하게 유지
+            time.sleep(max(0.0, self.probe_interval_seconds - (time.monotonic() - started)))
+
+    def get_report(self) -> Dict[str, Any]:
+        """백그라운드 프로브의 마지막 점검 결과 반환 (요청 경로에서는 점검하지 않음)"""
+        self._ensure_probe()
+        report = self._report
+        if report is None:
+            # 첫 점검이 끝나기 전 (기동 직후)
+            return {'status': 'unhealthy', 'ready': False, 'stale': True, 'checked_at': None, 'checks': {}}
+
+        age = time.monotonic() - self._report_at
+        if age < self.stale_after_seconds:
+            return report
+        # 프로브가 멈췄거나 점검이 계속 지연되는 경우 마지막 결과를 믿지 않음
+        return {**report, 'status': 'unhealthy', 'ready': False, 'stale': True, 'age_seconds': round(age, 1)}
+
+    def get_public_report(self) -> Dict[str, Any]:
+        """인증 없는 준비 상태 응답용 결과 (항목별 상태와 고정 사유만 포함)"""
+        report = self.get_report()
+        return {
+            **{key: value for key, value in report.items() if key != 'checks'},
+            'checks': {
+                name: {key: value for key, value in result.items() if key in PUBLIC_CHECK_FIELDS}
+                for name, result in report['checks'].items()
+            }
+        }
+
+    def liveness(self) -> Dict[str, Any]:
+        """프로세스 생존 여부 (외부 의존성 점검 없음)"""
+        return {
+            'status': 'alive',
+            'pid': os.getpid(),
+            'uptime_seconds': round(time.time() - self.started_at, 1)
+        }
+
+# 전역 상태 점검기
+health_checker = HealthChecker()
+
+# 항목별 상세 결과 (오류 메시지 포함)는 관리자 전용 런타임 조회에서만 제공
+runtime_registry.register('health', lambda: health_checker._report)
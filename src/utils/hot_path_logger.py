@@ -0,0 +1,86 @@
+import logging
+import random
+import threading
+from typing import Any, Dict, Optional
+import settings
+
+class HotPathLogger:
+    """ 요청마다 호출되는 지점(hot path)의 샘플링 / 레벨 게이트 로깅 """
+
+    def __init__(self):
+        self.default_rate = self._clamp(getattr(settings, 'HOT_PATH_LOG_DEFAULT_RATE', 0.01))
+        self.rates: Dict[str, float] = {
+            site: self._clamp(rate)
+            for site, rate in getattr(settings, 'HOT_PATH_LOG_SAMPLE_RATES', {}).items()
+        }
+        # 호출 지점별 [호출 수, 기록 수] - 통계용이므로 락 없이 근사값으로 집계
+        self._counters: Dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _clamp(rate: Any) -> float:
+        return min(1.0, max(0.0, float(rate)))
+
+    def get_rate(self, site: str) -> float:
+        """호출 지점의 샘플링 비율"""
+        return self.rates.get(site, self.default_rate)
+
+    def set_rate(self, site: str, rate: float) -> None:
+        """호출 지점의 샘플링 비율 변경 (0.0 ~ 1.0)"""
+        with self._lock:
+            self.rates[site] = self._clamp(rate)
+
+    def reset_rate(self, site: str) -> None:
+        """호출 지점의 샘플링 비율을 기본값으로 되돌림"""
+        with self._lock:
+            self.rates.pop(site, None)
+
+    def set_default_rate(self, rate: float) -> None:
+        """기본 샘플링 비율 변경"""
+        self.default_rate = self._clamp(rate)
+
+    def _sampled(self, site: str) -> bool:
+        counter = self._counters.get(site)
+        if counter is None:
+            counter = self._counters.setdefault(site, [0, 0])
+        counter[0] += 1
+
+        rate = self.rates.get(site, self.default_rate)
+        if rate >= 1.0 or (rate > 0.0 and random.random() < rate):
+            counter[1] += 1
+            return True
+        return False
+
+    def log(self, logger: Optional[logging.Logger], level: int, site: str, msg: str, *args) -> None:
+        """레벨이 활성화되어 있고 샘플링된 경우에만 기록 (메시지는 %-포맷으로 지연 생성)"""
+        if logger is None or not logger.isEnabledFor(level):
+            return
+        if self._sampled(site):
+            logger.log(level, msg, *args)
+
+    def debug(self, logger: Optional[logging.Logger], site: str, msg: str, *args) -> None:
+        self.log(logger, logging.DEBUG, site, msg, *args)
+
+    def info(self, logger: Optional[logging.Logger], site: str, msg: str, *args) -> None:
+        self.log(logger, logging.INFO, site, msg, *args)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """샘플링 설정 및 호출 지점별 통계 조회"""
+        with self._lock:
+            rates = dict(self.rates)
+        sites = {}
+        for site, (calls, logged) in list(self._counters.items()):
+            sites[site] = {
+                'rate': rates.get(site, self.default_rate),
+                'calls': calls,
+                'logged': logged
+            }
+        for site, rate in rates.items():
+            sites.setdefault(site, {'rate': rate, 'calls': 0, 'logged': 0})
+        return {
+            'default_rate': self.default_rate,
+            'sites': sites
+        }
+
+# 전역 hot path 로거
+hot_path_logger = HotPathLogger()
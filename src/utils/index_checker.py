@@ -0,0 +1,141 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from flask import Flask
+from sqlalchemy import inspect, text
+import settings
+from .health_checker import HEALTH_DEGRADED, HEALTH_OK, HEALTH_SKIPPED, health_checker
+from .runtime_registry import runtime_registry
+
+# (인덱스 이름, 테이블, 컬럼) - migrations/versions/3f1c9a7d2b10_add_lookup_indexes.py 와 동일하게 유지
+EXPECTED_INDEXES: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ('ix_users_user_setting_id', 'users', ('user_setting_id',)),
+    ('ix_user_login_log_user_id', 'user_login_log', ('user_id',)),
+    ('ix_user_ip_ip_str', 'user_ip', ('ip_str',)),
+    ('ix_user_agent_user_agent_str', 'user_agent', ('user_agent_str',)),
+    ('ix_user_certification_recipient_created_at', 'user_certification', ('recipient', 'created_at')),
+    ('ix_user_event_log_user_uuid', 'user_event_log', ('user_uuid',)),
+)
+
+class IndexChecker:
+    """ 운영 DB 인덱스와 기대 인덱스 비교 (기동 시 1회 점검, 결과는 상태 점검에서 재사용) """
+
+    def __init__(self):
+        self.enabled = getattr(settings, 'DB_INDEX_CHECK_ON_STARTUP', True)
+        # True 이면 누락 인덱스가 있을 때 기동 실패
+        self.strict = getattr(settings, 'DB_INDEX_CHECK_STRICT', False)
+        self.report: Optional[Dict[str, Any]] = None
+        self._logger = None
+
+    @property
+    def logger(self):
+        """로거 lazy loading"""
+        if self._logger is None:
+            try:
+                from extensions import database_logger
+                self._logger = database_logger
+            except ImportError:
+                pass
+            if self._logger is None:
+                # extensions가 아직 초기화되지 않은 경우 기본 로거 사용
+                import logging
+                logger = logging.getLogger('index_checker')
+                if not logger.handlers:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter(
+                        '[%(asctime)s] %(levelname)s: %(module)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.INFO)
+                self._logger = logger
+        return self._logger
+
+    def _invalid_postgresql_indexes(self, connection) -> List[str]:
+        # CONCURRENTLY 생성이 중단되면 인덱스가 INVALID 로 남아 조회에 사용되지 않음
+        rows = connection.execute(text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid"
+        ))
+        return [row[0] for row in rows]
+
+    def inspect_engine(self, engine) -> Dict[str, Any]:
+        """기대 인덱스 중 누락 / INVALID 인덱스 조회 (이름이 달라도 컬럼 구성이 같으면 인정)"""
+        missing: List[str] = []
+        invalid: List[str] = []
+        skipped_tables: List[str] = []
+
+        with engine.connect() as connection:
+            inspector = inspect(connection)
+            tables = set(inspector.get_table_names())
+            invalid_names = set()
+            if engine.dialect.name == 'postgresql':
+                invalid_names = set(self._invalid_postgresql_indexes(connection))
+
+            indexes_by_table: Dict[str, List[Dict[str, Any]]] = {}
+            for name, table, columns in EXPECTED_INDEXES:
+                if table not in tables:
+                    skipped_tables.append(table)
+                    continue
+                if table not in indexes_by_table:
+                    indexes_by_table[table] = inspector.get_indexes(table)
+                matches = [
+                    index['name'] for index in indexes_by_table[table]
+                    if tuple(index['column_names'][:len(columns)]) == columns
+                ]
+                if not matches:
+                    missing.append(name)
+                elif all(match in invalid_names for match in matches):
+                    invalid.append(name)
+
+        return {
+            'checked_at': time.time(),
+            'dialect': engine.dialect.name,
+            'expected': len(EXPECTED_INDEXES),
+            'missing': missing,
+            'invalid': invalid,
+            'skipped_tables': sorted(set(skipped_tables))
+        }
+
+    def check(self, app: Flask) -> Optional[Dict[str, Any]]:
+        """기본 DB 인덱스 점검 (누락 시 경고, strict 설정이면 예외)"""
+        if not self.enabled:
+            return None
+        from extensions import db
+
+        with app.app_context():
+            try:
+                report = self.inspect_engine(db.engine)
+            except Exception as e:
+                self.logger.warning(f"DB 인덱스 점검 실패: {str(e)}")
+                return None
+
+        self.report = report
+        problems = report['missing'] + report['invalid']
+        if not problems:
+            self.logger.info(f"DB 인덱스 점검 완료: 기대 인덱스 {report['expected']}개 확인")
+            return report
+
+        message = (
+            f"DB 인덱스 누락: {', '.join(report['missing']) or '-'} / "
+            f"INVALID: {', '.join(report['invalid']) or '-'} - `flask db upgrade` 실행 필요"
+        )
+        if self.strict:
+            raise RuntimeError(message)
+        self.logger.warning(message)
+        return report
+
+    def health_check(self):
+        """기동 시 점검 결과 (DB 를 다시 조회하지 않음)"""
+        if self.report is None:
+            return HEALTH_SKIPPED, {'reason': '인덱스 점검 결과 없음'}
+        details = {'missing': self.report['missing'], 'invalid': self.report['invalid']}
+        if self.report['missing'] or self.report['invalid']:
+            return HEALTH_DEGRADED, details
+        return HEALTH_OK, details
+
+# 전역 인덱스 점검기
+index_checker = IndexChecker()
+
+health_checker.register('indexes', index_checker.health_check, critical=False)
+runtime_registry.register('db_indexes', lambda: index_checker.report)
@@ -3,6 +3,9 @@ from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 from flask import request
 import settings
+from .hot_path_logger import hot_path_logger
+from .tracing import tracer
+from .runtime_registry import runtime_registry
 
 class JWTManager:
     """ JWT 토큰 관리 클래스 """
@@ -37,6 +40,7 @@ class JWTManager:
                 self._logger = logger
         return self._logger
     
+    @tracer.trace('jwt.create_access_token')
     def create_access_token(self, data: Dict[str, Any]) -> str:
         """ 액세스 토큰 생성 """
         try:
@@ -50,6 +54,7 @@ class JWTManager:
             self.logger.error(f"액세스 토큰 생성 실패: {str(e)}")
             raise e
     
+    @tracer.trace('jwt.create_refresh_token')
     def create_refresh_token(self, data: Dict[str, Any]) -> str:
         """ 리프레시 토큰 생성 """
         try:
@@ -63,6 +68,7 @@ class JWTManager:
             self.logger.error(f"리프레시 토큰 생성 실패: {str(e)}")
             raise e
     
+    @tracer.trace('jwt.verify_token')
     def verify_token(self, token: str) -> Optional[Dict[str, Any]]:
         """ 토큰 검증 """
         try:
@@ -71,7 +77,7 @@ class JWTManager:
                 self.logger.warning("토큰 검증 실패: 블랙리스트된 토큰")
                 return None
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            self.logger.info(f"토큰 검증 성공: {payload.get('user_id', 'unknown')}")
+            hot_path_logger.info(self.logger, 'jwt.verify_token', "토큰 검증 성공: %s", payload.get('user_id', 'unknown'))
             return payload
         except jwt.ExpiredSignatureError:
             self.logger.warning("토큰 만료됨")
@@ -83,6 +89,7 @@ class JWTManager:
             self.logger.error(f"토큰 검증 중 오류: {str(e)}")
             return None
     
+    @tracer.trace('jwt.decode_token')
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """ 토큰 디코딩 """
         try:
@@ -121,7 +128,7 @@ class JWTManager:
                 self.logger.warning("사용자 정보 추출 실패: 토큰에 이메일 정보 없음")
                 return None
             
-            self.logger.info(f"사용자 정보 추출 성공: {user_info['email']}")
+            hot_path_logger.info(self.logger, 'jwt.extract_user_info', "사용자 정보 추출 성공: %s", user_info['email'])
             return user_info
             
         except Exception as e:
@@ -151,7 +158,7 @@ class JWTManager:
                 self.logger.warning("Request 검증 실패: 사용자 정보 추출 실패")
                 return None
             
-            self.logger.info(f"Request 검증 성공: {user_info['email']}")
+            hot_path_logger.info(self.logger, 'jwt.validate_request', "Request 검증 성공: %s", user_info['email'])
             return user_info
             
         except Exception as e:
@@ -191,4 +198,12 @@ class JWTManager:
             self.logger.error(f"Request 토큰 무효화 중 오류: {str(e)}")
             return False
 
-jwt_manager = JWTManager()
\ No newline at end of file
+    def get_stats(self) -> Dict[str, Any]:
+        """토큰 무효화 저장소 상태 조회"""
+        return {
+            'revoked_tokens': len(self._blacklisted_tokens)
+        }
+
+jwt_manager = JWTManager()
+
+runtime_registry.register('jwt', jwt_manager.get_stats)
\ No newline at end of file
@@ -1,18 +1,109 @@
 import os
 import json
-import requests
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 import settings
 
+from .oauth_state_manager import oauth_state_manager
+from .circuit_breaker import circuit_breaker_manager
+from .runtime_registry import runtime_registry
+
+class RateLimiter:
+    """ 초당 요청 수 제한 (프로세스 내 공유) """
+    
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """다음 요청 슬롯까지 대기"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+class FriendUuidCache:
+    """ 사용자별 친구 UUID 캐시 (TTL + 최대 보관 시간 + LRU) """
+    
+    def __init__(self, ttl_seconds: int, max_entries: int, max_age_seconds: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # 재검증(touch)으로도 연장되지 않는 보관 시간 - 첫 페이지 밖의 변경도 주기적으로 반영
+        self.max_age_seconds = max_age_seconds or ttl_seconds * 6
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시 항목 조회 (TTL 만료 항목도 재검증용으로 반환, 최대 보관 시간이 지난 항목은 삭제)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry['hard_expires_at'] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+    
+    def put(self, key: str, uuids: List[str], fingerprint: str, etag: Optional[str]) -> None:
+        """캐시 저장"""
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = {
+                'uuids': uuids,
+                'fingerprint': fingerprint,
+                'etag': etag,
+                'expires_at': now + self.ttl_seconds,
+                'hard_expires_at': now + self.max_age_seconds
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def touch(self, key: str) -> None:
+        """변경 없음이 확인된 항목의 TTL 연장 (최대 보관 시간은 넘지 않음)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry['expires_at'] = min(time.monotonic() + self.ttl_seconds, entry['hard_expires_at'])
+    
+    def size(self) -> int:
+        """저장된 항목 수"""
+        with self._lock:
+            return len(self._entries)
+
 class KaKaoManager:
     """카카오 API 관리 클래스"""
     
+    # 친구 메시지 전송 속도 제한 (모든 인스턴스 공유)
+    _rate_limiter = RateLimiter(getattr(settings, 'KAKAO_MESSAGE_RATE_PER_SECOND', 10))
+    # 사용자별 친구 UUID 캐시 (모든 인스턴스 공유)
+    _friend_cache = FriendUuidCache(
+        getattr(settings, 'KAKAO_FRIEND_CACHE_TTL_SECONDS', 300),
+        getattr(settings, 'KAKAO_FRIEND_CACHE_MAX_ENTRIES', 1000),
+        getattr(settings, 'KAKAO_FRIEND_CACHE_MAX_AGE_SECONDS', None)
+    )
+    
     def __init__(self):
         self.rest_api_key = getattr(settings, 'KAKAO_REST_API_KEY')
         self.redirect_uri = getattr(settings, 'KAKAO_REDIRECT_URI')
         self.client_secret = getattr(settings, 'KAKAO_CLIENT_SECRET')
         self._logger = None
+        self.guard = circuit_breaker_manager.get('kakao')
+        self.friend_message_max_receivers = getattr(settings, 'KAKAO_FRIEND_MESSAGE_MAX_RECEIVERS', 5)
+        self.message_max_concurrency = getattr(settings, 'KAKAO_MESSAGE_MAX_CONCURRENCY', 4)
+        self.friend_page_size = getattr(settings, 'KAKAO_FRIEND_PAGE_SIZE', 100)
     
     @property
     def logger(self):
@@ -38,22 +129,28 @@ class KaKaoManager:
         return self._logger
 
     # 카카오 인증 URL 생성 ( account_email,profile_nickname,friends,talk_message )
-    def get_auth_url(self, scope: str = "account_email,profile_nickname", prompt: str = "consent,login") -> str:
-        """ 카카오 인증 URL 생성 """
+    def get_auth_url(self, scope: str = "account_email,profile_nickname", prompt: str = "consent,login") -> Tuple[str, str]:
+        """ 카카오 인증 URL 생성 (state, PKCE 포함) """
         if not self.rest_api_key:
             raise ValueError("KAKAO_REST_API_KEY 설정이 되지 않았습니다.")
         
+        # 서버에 저장한 state 와 함께 PKCE verifier 보관 (콜백에서 state 로 verifier 조회)
+        issued = oauth_state_manager.issue('kakao', use_pkce=True)
+        
         auth_url = (
             f"https://kauth.kakao.com/oauth/authorize?"
             f"client_id={self.rest_api_key}&"
             f"redirect_uri={self.redirect_uri}&"
             f"response_type=code&"
             f"scope={scope}&"
-            f"prompt={prompt}"
+            f"prompt={prompt}&"
+            f"state={issued['state']}&"
+            f"code_challenge={issued['code_challenge']}&"
+            f"code_challenge_method=S256"
         )
-        return auth_url
+        return auth_url, issued['state']
     
-    def exchange_code_for_token(self, code: str) -> Dict:
+    def exchange_code_for_token(self, code: str, code_verifier: Optional[str] = None) -> Dict:
         """ 인증 코드를 액세스 토큰으로 교환 """
         if not self.rest_api_key or not self.client_secret:
             raise ValueError("KAKAO_REST_API_KEY 또는 KAKAO_CLIENT_SECRET 설정이 되지 않았습니다.")
@@ -66,8 +163,10 @@ class KaKaoManager:
             "redirect_uri": self.redirect_uri,
             "code": code
         }
+        if code_verifier:
+            data["code_verifier"] = code_verifier
         
-        response = requests.post(token_url, data=data)
+        response = self.guard.request('POST', token_url, data=data)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -89,7 +188,7 @@ class KaKaoManager:
             "refresh_token": refresh_token
         }
         
-        response = requests.post(refresh_url, data=data)
+        response = self.guard.request('POST', refresh_url, data=data)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -100,7 +199,7 @@ class KaKaoManager:
     def get_token_info(self, access_token: str) -> Dict:
         """ 엑세스 토큰 정보 조회 """
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get("https://kapi.kakao.com/v1/user/access_token_info", headers=headers)
+        response = self.guard.request('GET', "https://kapi.kakao.com/v1/user/access_token_info", headers=headers)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -112,7 +211,7 @@ class KaKaoManager:
     def get_user_scope(self, access_token: str) -> Dict:
         """ 사용자 동의 항목 조회 """
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get("https://kapi.kakao.com/v2/user/scopes", headers=headers)
+        response = self.guard.request('GET', "https://kapi.kakao.com/v2/user/scopes", headers=headers)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -124,7 +223,7 @@ class KaKaoManager:
     def get_user_info(self, access_token: str) -> Dict:
         """ 카카오 사용자 기본 정보 조회 """
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get("https://kapi.kakao.com/v2/user/me", headers=headers)
+        response = self.guard.request('GET', "https://kapi.kakao.com/v2/user/me", headers=headers)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -133,25 +232,116 @@ class KaKaoManager:
         
         return response.json()
     
-    def get_friend_info(self, access_token: str) -> Dict:
-        """ 친구 목록 조회 """
+    def get_friend_info(self, access_token: str, limit: Optional[int] = None) -> Dict:
+        """ 친구 목록 조회 (첫 페이지) """
+        response = self._request_friend_page(access_token, limit=limit)
+        return response.json()
+    
+    def _request_friend_page(self, access_token: str, url: Optional[str] = None, offset: Optional[int] = None,
+                             limit: Optional[int] = None, etag: Optional[str] = None):
+        """ 친구 목록 한 페이지 요청 (url이 있으면 after_url을 그대로 사용) """
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get("https://kapi.kakao.com/v1/api/talk/friends", headers=headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        params = None
+        if not url:
+            url = "https://kapi.kakao.com/v1/api/talk/friends"
+            params = {key: value for key, value in (("offset", offset), ("limit", limit)) if value}
         
-        if response.status_code != 200:
+        response = self.guard.request('GET', url, headers=headers, params=params)
+        
+        if response.status_code not in (200, 304):
             error_data = response.json()
             error_msg = error_data.get('error_description', error_data.get('error', '알 수 없는 오류'))
             raise Exception(f"친구 목록 조회 실패: {error_msg}")
         
-        return response.json()
+        return response
     
-    def send_message_to_self(self, access_token: str, message: str, link_url: str = None) -> bool:
-        """ 나에게 메시지 전송 """
-        headers = {
-            "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/x-www-form-urlencoded"
+    def get_friend_page(self, access_token: str, offset: int = 0, limit: Optional[int] = None) -> Dict:
+        """ 친구 목록 한 페이지 조회 (다음 페이지 offset 포함) """
+        page = self._request_friend_page(access_token, offset=offset, limit=limit or self.friend_page_size).json()
+        
+        next_offset = None
+        after_url = page.get('after_url')
+        if after_url:
+            query = parse_qs(urlparse(after_url).query)
+            if query.get('offset'):
+                next_offset = int(query['offset'][0])
+        
+        return {
+            'elements': page.get('elements', []),
+            'total_count': page.get('total_count'),
+            'next_offset': next_offset
         }
+    
+    def iter_friend_pages(self, access_token: str, page_size: Optional[int] = None,
+                          first_page: Optional[Dict] = None) -> Iterator[Dict]:
+        """ 친구 목록 페이지 단위 순회 (after_url을 따라 필요할 때만 다음 페이지 요청) """
+        page = first_page
+        if page is None:
+            page = self._request_friend_page(access_token, limit=page_size or self.friend_page_size).json()
+        
+        while True:
+            yield page
+            after_url = page.get('after_url')
+            if not after_url or not page.get('elements'):
+                return
+            page = self._request_friend_page(access_token, url=after_url).json()
+    
+    def iter_friends(self, access_token: str, page_size: Optional[int] = None) -> Iterator[Dict]:
+        """ 친구 목록 전체를 한 명씩 순회 (전체를 메모리에 올리지 않음) """
+        for page in self.iter_friend_pages(access_token, page_size):
+            yield from page.get('elements', [])
+    
+    @staticmethod
+    def _friend_page_fingerprint(page: Dict) -> str:
+        """ 첫 페이지 기준 친구 목록 지문 (ETag 미제공 시 재검증용) """
+        digest = hashlib.sha256(str(page.get('total_count')).encode('utf-8'))
+        for friend in page.get('elements', []):
+            digest.update(str(friend.get('uuid')).encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get_friend_uuids(self, access_token: str, user_id: Optional[int] = None,
+                         force_refresh: bool = False) -> List[str]:
+        """ 친구 UUID 목록 조회 (카카오 회원번호별 TTL 캐시 + 첫 페이지 재검증) """
+        # 토큰 갱신 후에도 같은 항목을 쓰도록 토큰이 아닌 회원번호 기준으로 저장
+        if user_id is None:
+            user_id = self.get_token_info(access_token)['id']
+        cache_key = f"kakao:{user_id}"
+        cached = None if force_refresh else self._friend_cache.get(cache_key)
         
+        if cached and cached['expires_at'] > time.monotonic():
+            return cached['uuids']
+        
+        # 캐시가 만료된 경우 첫 페이지만 받아 변경 여부 확인
+        response = self._request_friend_page(
+            access_token,
+            limit=self.friend_page_size,
+            etag=cached['etag'] if cached else None
+        )
+        if cached and response.status_code == 304:
+            self._friend_cache.touch(cache_key)
+            return cached['uuids']
+        
+        first_page = response.json()
+        etag = response.headers.get('ETag')
+        fingerprint = self._friend_page_fingerprint(first_page)
+        if cached and cached['fingerprint'] == fingerprint and (not etag or etag == cached['etag']):
+            self._friend_cache.touch(cache_key)
+            return cached['uuids']
+        
+        uuids = [
+            friend['uuid']
+            for page in self.iter_friend_pages(access_token, first_page=first_page)
+            for friend in page.get('elements', [])
+            if friend.get('uuid')
+        ]
+        self._friend_cache.put(cache_key, uuids, fingerprint, etag)
+        return uuids
+    
+    @staticmethod
+    def build_text_template(message: str, link_url: str = None) -> str:
+        """ 텍스트 메시지 템플릿 직렬화 (여러 요청에서 재사용) """
         template = {
             "object_type": "text",
             "text": message,
@@ -161,10 +351,19 @@ class KaKaoManager:
             },
             "button_title": "확인"
         }
+        return json.dumps(template)
+    
+    def send_message_to_self(self, access_token: str, message: str, link_url: str = None) -> bool:
+        """ 나에게 메시지 전송 """
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/x-www-form-urlencoded"
+        }
         
-        data = {"template_object": json.dumps(template)}
+        data = {"template_object": self.build_text_template(message, link_url)}
         
-        response = requests.post(
+        response = self.guard.request(
+            'POST',
             "https://kapi.kakao.com/v2/api/talk/memo/default/send",
             headers=headers,
             data=data
@@ -176,39 +375,72 @@ class KaKaoManager:
         
         return True
 
-    def send_message_to_friend(self, access_token: str, friend_uuid: str, message: str, link_url: str = None) -> bool:
-        """ 친구에게 메시지 전송 """
+    def _send_friend_message_chunk(self, headers: Dict, template_object: str, receiver_uuids: List[str]) -> Dict[str, Optional[str]]:
+        """ 친구 메시지 1회 전송 (최대 KAKAO_FRIEND_MESSAGE_MAX_RECEIVERS명) - 수신자별 실패 사유 반환 """
+        self._rate_limiter.acquire()
+        try:
+            response = self.guard.request(
+                'POST',
+                "https://kapi.kakao.com/v1/api/talk/friends/message/default/send",
+                headers=headers,
+                data={
+                    "template_object": template_object,
+                    "receiver_uuids": json.dumps(receiver_uuids)
+                }
+            )
+        except Exception as e:
+            return {uuid: str(e) for uuid in receiver_uuids}
+        
+        if response.status_code != 200:
+            self.logger.error(f"친구에게 메시지 전송 실패: {response.status_code} - {response.text}")
+            return {uuid: f"HTTP {response.status_code}" for uuid in receiver_uuids}
+        
+        result_data = response.json()
+        results: Dict[str, Optional[str]] = {uuid: None for uuid in result_data.get('successful_receiver_uuids', [])}
+        for failure in result_data.get('failure_info', []):
+            for uuid in failure.get('receiver_uuids', []):
+                results[uuid] = failure.get('msg', '전송 실패')
+        
+        # 응답에 포함되지 않은 수신자는 실패로 처리
+        for uuid in receiver_uuids:
+            results.setdefault(uuid, '응답에 결과가 없습니다.')
+        return results
+
+    def send_message_to_friends(self, access_token: str, friend_uuids: List[str], message: str, link_url: str = None) -> Dict:
+        """ 여러 친구에게 메시지 일괄 전송 (요청당 최대 5명, 동시 전송 수 제한) """
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/x-www-form-urlencoded"
         }
+        template_object = self.build_text_template(message, link_url)
         
-        template = {
-            "object_type": "text",
-            "text": message,
-            "link": {
-                "web_url": link_url or "https://kakao.com",
-                "mobile_web_url": link_url or "https://kakao.com"
-            },
-            "button_title": "확인"
-        }
-        
-        data = {
-            "template_object": json.dumps(template),
-            "receiver_uuids": [friend_uuid]
-        }
+        receivers = list(dict.fromkeys(uuid for uuid in friend_uuids if uuid))
+        chunk_size = self.friend_message_max_receivers
+        chunks = [receivers[i:i + chunk_size] for i in range(0, len(receivers), chunk_size)]
         
-        response = requests.post(
-            "https://kapi.kakao.com/v2/api/talk/memo/default/send",
-            headers=headers,
-            data=data
-        )
+        results: Dict[str, Optional[str]] = {}
+        if len(chunks) == 1:
+            results.update(self._send_friend_message_chunk(headers, template_object, chunks[0]))
+        elif chunks:
+            with ThreadPoolExecutor(max_workers=min(self.message_max_concurrency, len(chunks))) as executor:
+                for chunk_result in executor.map(
+                    lambda chunk: self._send_friend_message_chunk(headers, template_object, chunk), chunks
+                ):
+                    results.update(chunk_result)
         
-        if response.status_code != 200:
-            self.logger.error(f"친구에게 메시지 전송 실패: {response.status_code} - {response.text}")
-            return False
+        successful = [uuid for uuid in receivers if results.get(uuid) is None]
+        failed = {uuid: reason for uuid, reason in results.items() if reason is not None}
         
-        return True
+        return {
+            "successful_receiver_uuids": successful,
+            "failed_receivers": failed,
+            "request_count": len(chunks)
+        }
+
+    def send_message_to_friend(self, access_token: str, friend_uuid: str, message: str, link_url: str = None) -> bool:
+        """ 친구에게 메시지 전송 """
+        result = self.send_message_to_friends(access_token, [friend_uuid], message, link_url)
+        return friend_uuid in result["successful_receiver_uuids"]
     
     def send_alert_message(self, access_token: str, status: str, message: str, link_url: str = None) -> Tuple[bool, str]:
         """ 알림 메시지 전송 """
@@ -218,7 +450,7 @@ class KaKaoManager:
             if self.send_message_to_self(access_token, alert_message, link_url):
                 return True, "나에게 메시지 전송 성공"
         
-            friend_info = self.get_friend_info(access_token)
+            friend_info = self.get_friend_info(access_token, limit=1)
             friends = friend_info.get('elements', [])
             
             if not friends:
@@ -301,4 +533,9 @@ class KaKaoManager:
             except Exception as e:
                 debug_info["token_info"]["error"] = str(e)
         
-        return debug_info
\ No newline at end of file
+        return debug_info
+
+runtime_registry.register('kakao_friend_cache', lambda: {
+    'entries': KaKaoManager._friend_cache.size(),
+    'max_entries': KaKaoManager._friend_cache.max_entries
+})
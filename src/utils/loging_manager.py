@@ -1,11 +1,203 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+import threading
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from flask import Flask, request, g
 import json
 import settings
+from .metrics_manager import metrics_registry
+from .query_tracker import query_tracker
+from .runtime_registry import runtime_registry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 접근 로그 고정 필드 스키마 (순서 고정, 값이 없으면 null)
+ACCESS_LOG_FIELDS = (
+    'timestamp',
+    'level',
+    'request_id',
+    'method',
+    'url',
+    'path',
+    'status_code',
+    'response_time',
+    'ip',
+    'user_agent',
+    'db_query_count',
+    'db_time_ms',
+    'db_slowest_ms',
+    'db_slowest_statement',
+    'db_repeated_statements',
+    'error_message',
+    'error_status'
+)
+
+if orjson is not None:
+    def _dump_log_json(data: Dict[str, Any]) -> str:
+        """로그 JSON 직렬화 (orjson)"""
+        return orjson.dumps(data, default=str).decode('utf-8')
+else:
+    def _dump_log_json(data: Dict[str, Any]) -> str:
+        """로그 JSON 직렬화 (표준 json)"""
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """크기 제한 큐에 로그 레코드를 넣는 핸들러 (요청 스레드에서는 I/O 없음)"""
+
+    def __init__(self, log_queue: queue.Queue, route: str, dispatcher: 'LogDispatcher'):
+        super().__init__(log_queue)
+        self.route = route
+        self.dispatcher = dispatcher
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.dispatcher.put(record)
+
+class LogDispatcher(logging.handlers.QueueListener):
+    """큐를 비우면서 로거별 실제 핸들러(파일/콘솔)로 전달하는 리스너 스레드"""
+
+    OVERFLOW_POLICIES = ('drop_new', 'drop_oldest', 'block')
+
+    def __init__(self, maxsize: int = 10000, overflow_policy: str = 'drop_new', block_timeout: float = 0.05):
+        super().__init__(queue.Queue(maxsize=maxsize), respect_handler_level=True)
+        if overflow_policy not in self.OVERFLOW_POLICIES:
+            overflow_policy = 'drop_new'
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+        self.routes: Dict[str, List[logging.Handler]] = {}
+        self.dropped = 0
+        self.enqueued = 0
+        self._lock = threading.Lock()
+        self._started = False
+
+    def put(self, record: logging.LogRecord) -> None:
+        """오버플로 정책에 따라 레코드 적재"""
+        try:
+            if self.overflow_policy == 'block':
+                self.queue.put(record, timeout=self.block_timeout)
+            elif self.overflow_policy == 'drop_oldest':
+                while True:
+                    try:
+                        self.queue.put_nowait(record)
+                        break
+                    except queue.Full:
+                        try:
+                            self.queue.get_nowait()
+                            self._count_drop()
+                        except queue.Empty:
+                            pass
+            else:
+                self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self._count_drop()
+
+    def _count_drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def add_route(self, route: str, handlers: List[logging.Handler]) -> None:
+        """로거별 핸들러 등록"""
+        self.routes[route] = handlers
+
+    def handle(self, record: logging.LogRecord) -> None:
+        for handler in self.routes.get(getattr(record, 'log_route', record.name), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def enqueue_sentinel(self) -> None:
+        # 큐가 가득 찬 경우에도 종료 신호는 반드시 전달
+        self.queue.put(self._sentinel)
+
+    def start(self) -> None:
+        if not self._started:
+            super().start()
+            self._started = True
+
+    def stop(self) -> None:
+        """남은 로그를 모두 기록하고 종료"""
+        if self._started:
+            super().stop()
+            self._started = False
+        for handlers in self.routes.values():
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    pass
+
+    def reset_after_fork(self) -> None:
+        """fork 이후 자식 프로세스에서 새 큐 / 리스너 스레드로 재시작"""
+        # 부모의 리스너 스레드는 자식에 없고, 큐 내부 락은 잠긴 상태로 복사되었을 수 있음
+        was_started = self._started
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self._thread = None
+        self._started = False
+        self._lock = threading.Lock()
+        self.enqueued = 0
+        self.dropped = 0
+        if was_started:
+            self.start()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 상태 조회"""
+        return {
+            'queue_size': self.queue.qsize(),
+            'queue_maxsize': self.queue.maxsize,
+            'overflow_policy': self.overflow_policy,
+            'enqueued': self.enqueued,
+            'dropped': self.dropped,
+            'running': self._started
+        }
+
+class AccessLogFormatter(logging.Formatter):
+    """접근 로그 JSON 포맷터 - 레코드 하나당 JSON 객체 한 줄"""
+
+    def __init__(self):
+        super().__init__()
+        # (초, 초 단위까지 포맷된 문자열) - 같은 초 안의 레코드는 strftime 재사용
+        self._second_cache = (None, '')
+
+    def _format_timestamp(self, created: float) -> str:
+        """레코드 생성 시각(record.created)으로 타임스탬프를 한 번만 계산"""
+        second = int(created)
+        cached = self._second_cache
+        if cached[0] != second:
+            cached = (second, datetime.fromtimestamp(second).strftime('%Y-%m-%dT%H:%M:%S'))
+            self._second_cache = cached
+        return f"{cached[1]}.{int((created - second) * 1000):03d}"
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = self._format_timestamp(record.created)
+        access = getattr(record, 'access', None)
+
+        if access is None:
+            # 접근 로그가 아닌 레코드도 JSON 한 줄로 기록
+            data: Dict[str, Any] = {
+                'timestamp': timestamp,
+                'level': record.levelname,
+                'message': record.getMessage()
+            }
+            if record.exc_info:
+                data['exception'] = self.formatException(record.exc_info)
+            return _dump_log_json(data)
+
+        data = {field: access.get(field) for field in ACCESS_LOG_FIELDS}
+        data['timestamp'] = timestamp
+        data['level'] = record.levelname
+        return _dump_log_json(data)
 
 class LoggingManager:
 
@@ -16,6 +208,14 @@ class LoggingManager:
         self.log_level = getattr(settings, 'LOG_LEVEL', 'INFO')
         self.max_log_size = getattr(settings, 'MAX_LOG_SIZE', 10 * 1024 * 1024)
         self.backup_count = getattr(settings, 'LOG_BACKUP_COUNT', 5)
+        self.async_enabled = getattr(settings, 'LOG_ASYNC_ENABLED', True)
+        self.dispatcher: Optional[LogDispatcher] = None
+        if self.async_enabled:
+            self.dispatcher = LogDispatcher(
+                maxsize=getattr(settings, 'LOG_QUEUE_SIZE', 10000),
+                overflow_policy=getattr(settings, 'LOG_QUEUE_OVERFLOW', 'drop_new'),
+                block_timeout=getattr(settings, 'LOG_QUEUE_BLOCK_TIMEOUT', 0.05)
+            )
         self._ensure_log_dir()
 
     def _ensure_log_dir(self):
@@ -33,6 +233,15 @@ class LoggingManager:
         }
         return formats.get(log_type, formats['default'])
     
+    def _create_formatter(self, log_type: str = 'default') -> logging.Formatter:
+        """로그 포맷터 생성"""
+        if log_type == 'access_json':
+            return AccessLogFormatter()
+        return logging.Formatter(
+            self._get_log_format(log_type),
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+    
     def create_logger(self, name: str, log_file: Optional[str] = None, 
                     log_format: str = 'default', console_output: bool = True) -> logging.Logger:
         """로거 생성"""
@@ -44,6 +253,7 @@ class LoggingManager:
 
         # 기존 핸들러 제거 (중복제거)
         logger.handlers.clear()
+        handlers: List[logging.Handler] = []
 
         # 파일 핸들러 설정
         if log_file:
@@ -54,26 +264,45 @@ class LoggingManager:
                 backupCount=self.backup_count,
                 encoding='utf-8'
             )
-            file_formatter = logging.Formatter(
-                self._get_log_format(log_format),
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+            file_handler.setFormatter(self._create_formatter(log_format))
+            handlers.append(file_handler)
 
         # 콘솔 핸들러 설정
         if console_output:
             console_handler = logging.StreamHandler()
-            console_formatter = logging.Formatter(
-                self._get_log_format(log_format),
-                datefmt='%Y-%m-%d %H:%M:%S'
-            )
-            console_handler.setFormatter(console_formatter)
-            logger.addHandler(console_handler)
+            console_handler.setFormatter(self._create_formatter(log_format))
+            handlers.append(console_handler)
+
+        if self.dispatcher is not None:
+            # 비동기 모드: 로거에는 큐 핸들러만 연결하고 실제 기록은 리스너 스레드에서 처리
+            self.dispatcher.add_route(name, handlers)
+            logger.addHandler(BoundedQueueHandler(self.dispatcher.queue, name, self.dispatcher))
+            self.dispatcher.start()
+        else:
+            for handler in handlers:
+                logger.addHandler(handler)
 
         self.loggers[name] = logger
         return logger
     
+    def get_queue_stats(self) -> Optional[Dict[str, Any]]:
+        """비동기 로깅 큐 상태 반환 (동기 모드이면 None)"""
+        return self.dispatcher.get_stats() if self.dispatcher is not None else None
+    
+    def shutdown(self) -> None:
+        """남은 로그를 모두 기록하고 리스너 종료"""
+        if self.dispatcher is not None:
+            self.dispatcher.stop()
+
+    def reset_after_fork(self) -> None:
+        """fork 이후 자식 프로세스에서 비동기 로깅 재시작"""
+        if self.dispatcher is not None:
+            self.dispatcher.reset_after_fork()
+            for logger in self.loggers.values():
+                for handler in logger.handlers:
+                    if isinstance(handler, BoundedQueueHandler):
+                        handler.queue = self.dispatcher.queue
+    
 
     def get_logger(self, name: str) -> Optional[logging.Logger]:
         """기존 로거 반환"""
@@ -99,7 +328,7 @@ class LoggingManager:
         return self.create_logger(
             'cloakbox_api',
             'api.log',
-            'api',
+            'access_json',
             console_output=True
         )
 
@@ -123,25 +352,26 @@ class LoggingManager:
     
     def log_request(self, logger: logging.Logger, status_code: int,
                     response_time: float, additional_info: Optional[Dict[str, Any]] = None) -> None:
-        """API 요청 로깅"""
+        """API 요청 로깅 (AccessLogFormatter가 JSON 한 줄로 기록)"""
+        level = logging.ERROR if status_code >= 400 else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
         try:
-            log_data: Dict[str, Any] = {
+            access: Dict[str, Any] = {
+                'request_id': g.get('request_id'),
                 'method': request.method,
                 'url': request.url,
+                'path': request.path,
                 'status_code': status_code,
                 'response_time': round(response_time, 2),
                 'ip': request.remote_addr,
-                'user_agent': request.headers.get('User-Agent', ''),
-                'timestamp': datetime.now().isoformat()
+                'user_agent': request.headers.get('User-Agent', '')
             }
 
             if additional_info:
-                log_data.update(additional_info)
+                access.update(additional_info)
 
-            if status_code >= 400:
-                logger.error(f"API 요청 오류: {json.dumps(log_data, ensure_ascii=False)}")
-            else:
-                logger.info(f"API 요청: {json.dumps(log_data, ensure_ascii=False)}")
+            logger.log(level, 'access', extra={'access': access})
         except Exception as e:
             logger.error(f"로깅 오류: {str(e)}")
     
@@ -173,6 +403,22 @@ class LoggingManager:
 
 logger_manager = LoggingManager()
 
+# 프로세스 종료 시 큐에 남은 로그 기록
+atexit.register(logger_manager.shutdown)
+
+def _collect_log_queue_metrics():
+    """비동기 로깅 큐 상태 수집"""
+    stats = logger_manager.get_queue_stats()
+    if stats is None:
+        return []
+    return [
+        ('log_queue_size', 'gauge', '비동기 로깅 큐에 쌓인 레코드 수', [((), stats['queue_size'])]),
+        ('log_queue_dropped_total', 'counter', '큐 포화로 버려진 로그 레코드 수', [((), stats['dropped'])])
+    ]
+
+metrics_registry.register_collector('log_queue', _collect_log_queue_metrics)
+runtime_registry.register('log_queue', logger_manager.get_queue_stats)
+
 def setup_logging(app: Flask) -> None:
     """Flask 앱에 로깅 설정"""
     logger_manager.setup_app_logger(app)
@@ -180,19 +426,29 @@ def setup_logging(app: Flask) -> None:
     # 요청 처리 시간 측정을 위한 미들웨어 설정
     @app.before_request
     def before_request():
-        g.start_time = datetime.now()
+        g.start_ns = time.perf_counter_ns()
 
     @app.after_request
     def after_request(response):
         # API 로깅
-        if hasattr(g, 'start_time'):
-            response_time = (datetime.now() - g.start_time).total_seconds() * 1000
+        if hasattr(g, 'start_ns'):
+            duration_ns = time.perf_counter_ns() - g.start_ns
+            response_time = duration_ns / 1_000_000
+
+            # 라벨 수 폭증을 막기 위해 실제 경로 대신 라우트 규칙 사용
+            endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+
+            # 요청 중 실행된 SQL 통계 (쿼리 수 / DB 시간 / 가장 느린 쿼리 / N+1 의심)
+            additional_info = query_tracker.finish_request(endpoint)
+            query_tracker.enforce()
+
+            metrics_registry.observe_request(endpoint, request.method, response.status_code, duration_ns)
+
             api_logger = logger_manager.get_logger('cloakbox_api')
             if not api_logger:
                 api_logger = logger_manager.setup_api_logger()
 
             # 에러 응답의 경우 응답 본문도 로깅
-            additional_info = {}
             if response.status_code >= 400:
                 try:
                     # 응답 본문에서 에러 메시지 추출
@@ -234,7 +490,7 @@ def get_api_logger() -> logging.Logger:
     """API 로거 반환"""
     logger = logger_manager.get_logger('cloakbox_api')
     if not logger:
-        logger = logger_manager.create_logger('cloakbox_api', 'api.log', 'api')
+        logger = logger_manager.create_logger('cloakbox_api', 'api.log', 'access_json')
     return logger
 
 def get_error_logger() -> logging.Logger:
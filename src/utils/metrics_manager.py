@@ -0,0 +1,227 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import settings
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# (메트릭 이름, 타입, 설명, [(라벨, 값), ...])
+CollectedMetric = Tuple[str, str, str, List[Tuple[Labels, float]]]
+
+METRIC_PREFIX = 'cloakbox_'
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels)
+    if extra is not None:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label_value(value)}"' for key, value in pairs) + '}'
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+class HistogramSpec:
+    """ 고정 버킷 히스토그램 정의 """
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float], scale: float = 1.0):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        # 기록 단위 -> 출력 단위 변환 비율 (예: ns -> s 는 1e-9)
+        self.scale = scale
+
+class _MetricShard:
+    """ 스레드별 메트릭 저장소 (소유 스레드만 기록하므로 락 불필요) """
+
+    __slots__ = ('thread', 'counters', 'histograms')
+
+    def __init__(self, thread: Optional[threading.Thread]):
+        self.thread = thread
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        # (이름, 라벨) -> [버킷별 카운트 리스트, 합계, 개수]
+        self.histograms: Dict[Tuple[str, Labels], list] = {}
+
+class MetricsRegistry:
+    """ 프로세스 내부 메트릭 레지스트리 (카운터 / 고정 버킷 히스토그램) """
+
+    def __init__(self):
+        self.enabled = getattr(settings, 'METRICS_ENABLED', True)
+        self.counter_help: Dict[str, str] = {}
+        self.histogram_specs: Dict[str, HistogramSpec] = {}
+        self._local = threading.local()
+        self._shards: List[_MetricShard] = []
+        # 종료된 스레드의 값을 합쳐 두는 저장소
+        self._retired = _MetricShard(None)
+        self._collectors: Dict[str, Callable[[], Iterable[CollectedMetric]]] = {}
+        self._lock = threading.Lock()
+
+        buckets_ms = getattr(
+            settings, 'METRICS_LATENCY_BUCKETS_MS',
+            (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+        )
+        self.register_histogram(
+            'http_request_duration_seconds',
+            'HTTP 요청 처리 시간',
+            [int(bucket * 1_000_000) for bucket in buckets_ms],
+            scale=1e-9
+        )
+
+    def register_counter(self, name: str, help_text: str) -> None:
+        """카운터 등록"""
+        self.counter_help[name] = help_text
+
+    def register_histogram(self, name: str, help_text: str, buckets: Iterable[float], scale: float = 1.0) -> None:
+        """히스토그램 등록"""
+        self.histogram_specs[name] = HistogramSpec(name, help_text, buckets, scale)
+
+    def register_collector(self, name: str, collector: Callable[[], Iterable[CollectedMetric]]) -> None:
+        """조회 시점에 값을 수집하는 콜렉터 등록 (게이지 등)"""
+        self._collectors[name] = collector
+
+    def _shard(self) -> _MetricShard:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = _MetricShard(threading.current_thread())
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def inc(self, name: str, labels: Labels = (), value: float = 1) -> None:
+        """카운터 증가"""
+        if not self.enabled:
+            return
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        """히스토그램 관측값 기록"""
+        if not self.enabled:
+            return
+        spec = self.histogram_specs[name]
+        histograms = self._shard().histograms
+        key = (name, labels)
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = [[0] * (len(spec.buckets) + 1), 0, 0]
+        histogram[0][bisect_left(spec.buckets, value)] += 1
+        histogram[1] += value
+        histogram[2] += 1
+
+    def observe_request(self, endpoint: str, method: str, status: int, duration_ns: int) -> None:
+        """HTTP 요청 처리 시간 기록"""
+        self.observe(
+            'http_request_duration_seconds',
+            (('endpoint', endpoint), ('method', method), ('status', str(status))),
+            duration_ns
+        )
+
+    @staticmethod
+    def _merge_into(target: _MetricShard, source: _MetricShard) -> None:
+        # dict 복사는 GIL 하에서 원자적으로 수행되므로 기록 중인 스레드와 충돌하지 않음
+        for key, value in list(source.counters.items()):
+            target.counters[key] = target.counters.get(key, 0) + value
+        for key, (counts, total, count) in list(source.histograms.items()):
+            merged = target.histograms.get(key)
+            if merged is None:
+                target.histograms[key] = [list(counts), total, count]
+            else:
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+                merged[2] += count
+
+    def _collect_shards(self) -> _MetricShard:
+        """스레드별 값을 합산 (종료된 스레드는 retired 저장소로 이동)"""
+        merged = _MetricShard(None)
+        with self._lock:
+            alive = []
+            for shard in self._shards:
+                if shard.thread is not None and shard.thread.is_alive():
+                    alive.append(shard)
+                else:
+                    self._merge_into(self._retired, shard)
+            self._shards = alive
+            self._merge_into(merged, self._retired)
+            for shard in alive:
+                self._merge_into(merged, shard)
+        return merged
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식으로 변환"""
+        merged = self._collect_shards()
+        lines: List[str] = []
+
+        counters: Dict[str, List[Tuple[Labels, float]]] = {}
+        for (name, labels), value in merged.counters.items():
+            counters.setdefault(name, []).append((labels, value))
+        for name in sorted(counters):
+            metric = METRIC_PREFIX + name
+            lines.append(f'# HELP {metric} {self.counter_help.get(name, name)}')
+            lines.append(f'# TYPE {metric} counter')
+            for labels, value in sorted(counters[name]):
+                lines.append(f'{metric}{_format_labels(labels)} {_format_value(value)}')
+
+        histograms: Dict[str, List[Tuple[Labels, list]]] = {}
+        for (name, labels), histogram in merged.histograms.items():
+            histograms.setdefault(name, []).append((labels, histogram))
+        for name in sorted(histograms):
+            spec = self.histogram_specs[name]
+            metric = METRIC_PREFIX + name
+            lines.append(f'# HELP {metric} {spec.help_text}')
+            lines.append(f'# TYPE {metric} histogram')
+            for labels, (counts, total, count) in sorted(histograms[name], key=lambda item: item[0]):
+                cumulative = 0
+                for bucket, bucket_count in zip(spec.buckets, counts):
+                    cumulative += bucket_count
+                    le = _format_value(round(bucket * spec.scale, 9))
+                    lines.append(f'{metric}_bucket{_format_labels(labels, ("le", le))} {cumulative}')
+                lines.append(f'{metric}_bucket{_format_labels(labels, ("le", "+Inf"))} {count}')
+                lines.append(f'{metric}_sum{_format_labels(labels)} {_format_value(round(total * spec.scale, 9))}')
+                lines.append(f'{metric}_count{_format_labels(labels)} {count}')
+
+        for collector_name, collector in list(self._collectors.items()):
+            try:
+                collected = list(collector())
+            except Exception:
+                continue
+            for name, metric_type, help_text, samples in collected:
+                metric = METRIC_PREFIX + name
+                lines.append(f'# HELP {metric} {help_text}')
+                lines.append(f'# TYPE {metric} {metric_type}')
+                for labels, value in samples:
+                    lines.append(f'{metric}{_format_labels(labels)} {_format_value(value)}')
+
+        return '\n'.join(lines) + '\n'
+
+def _collect_provider_circuits() -> List[CollectedMetric]:
+    """외부 제공자 서킷 브레이커 상태 수집"""
+    from .circuit_breaker import CircuitBreaker, circuit_breaker_manager
+
+    states = (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN)
+    state_samples = []
+    rejected_samples = []
+    in_flight_samples = []
+    for provider, snapshot in circuit_breaker_manager.snapshot().items():
+        circuit = snapshot['circuit']
+        for state in states:
+            state_samples.append(((('provider', provider), ('state', state)), int(circuit['state'] == state)))
+        rejected_samples.append(((('provider', provider), ('reason', 'circuit_open')), circuit['rejected_calls']))
+        rejected_samples.append(((('provider', provider), ('reason', 'bulkhead_full')), snapshot['bulkhead']['rejected_calls']))
+        in_flight_samples.append(((('provider', provider),), snapshot['bulkhead']['in_flight']))
+
+    return [
+        ('provider_circuit_state', 'gauge', '외부 제공자 서킷 상태 (현재 상태만 1)', state_samples),
+        ('provider_rejected_calls_total', 'counter', '외부 제공자 호출 거부 수', rejected_samples),
+        ('provider_in_flight_calls', 'gauge', '외부 제공자 동시 호출 수', in_flight_samples)
+    ]
+
+# 전역 메트릭 레지스트리
+metrics_registry = MetricsRegistry()
+metrics_registry.register_collector('provider_circuits', _collect_provider_circuits)
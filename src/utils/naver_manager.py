@@ -1,11 +1,13 @@
 import os
 import json
-import requests
 import secrets
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 import settings
 
+from .oauth_state_manager import oauth_state_manager
+from .circuit_breaker import circuit_breaker_manager
+
 class NaverManager:
     """네이버 API 관리 클래스"""
     
@@ -14,6 +16,7 @@ class NaverManager:
         self.client_secret = getattr(settings, 'NAVER_CLIENT_SECRET')
         self.redirect_uri = getattr(settings, 'NAVER_REDIRECT_URI')
         self._logger = None
+        self.guard = circuit_breaker_manager.get('naver')
     
     @property
     def logger(self):
@@ -42,14 +45,16 @@ class NaverManager:
         """네이버 인증용 상태값 생성"""
         return secrets.token_urlsafe(32)
     
-    def get_auth_url(self, state: str = None, scope: str = "profile,email") -> str:
-        """네이버 인증 URL 생성"""
+    def get_auth_url(self, state: str = None, scope: str = "profile,email") -> Tuple[str, str]:
+        """네이버 인증 URL 생성 (state는 서버에 저장되어 콜백에서 1회 검증)"""
         if not self.client_id:
             raise ValueError("NAVER_CLIENT_ID 설정이 되지 않았습니다.")
         
         if not state:
             state = self.generate_state()
         
+        oauth_state_manager.issue('naver', state=state)
+        
         auth_url = (
             f"https://nid.naver.com/oauth2.0/authorize?"
             f"response_type=code&"
@@ -75,7 +80,7 @@ class NaverManager:
             "state": state
         }
         
-        response = requests.post(token_url, data=data)
+        response = self.guard.request('POST', token_url, data=data)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -97,7 +102,7 @@ class NaverManager:
             "refresh_token": refresh_token
         }
         
-        response = requests.post(refresh_url, data=data)
+        response = self.guard.request('POST', refresh_url, data=data)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -109,7 +114,7 @@ class NaverManager:
     def get_user_info(self, access_token: str) -> Dict:
         """네이버 사용자 정보 조회"""
         headers = {"Authorization": f"Bearer {access_token}"}
-        response = requests.get("https://openapi.naver.com/v1/nid/me", headers=headers)
+        response = self.guard.request('GET', "https://openapi.naver.com/v1/nid/me", headers=headers)
         
         if response.status_code != 200:
             error_data = response.json()
@@ -0,0 +1,205 @@
+import base64
+import hashlib
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import settings
+from .runtime_registry import runtime_registry
+
+class MemoryStateBackend:
+    """ 프로세스 내부 state 저장소 (단일 워커용) """
+
+    def __init__(self, ttl_seconds: int, max_entries: int = 10000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # TTL이 고정이므로 삽입 순서 = 만료 순서
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _purge_expired(self, now: float) -> None:
+        """만료된 항목을 앞에서부터 제거"""
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if expires_at > now and len(self._entries) < self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+    def put(self, key: str, value: Dict[str, Any]) -> bool:
+        """값 저장 (이미 존재하는 키는 저장하지 않음)"""
+        now = time.monotonic()
+        with self._lock:
+            self._purge_expired(now)
+            if key in self._entries:
+                return False
+            self._entries[key] = (now + self.ttl_seconds, value)
+            return True
+
+    def consume(self, key: str) -> Optional[Dict[str, Any]]:
+        """값을 꺼내고 삭제 (1회용)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            self._purge_expired(now)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            return None
+        return value
+
+    def size(self) -> int:
+        """저장된 항목 수"""
+        with self._lock:
+            return len(self._entries)
+
+class RedisStateBackend:
+    """ Redis 기반 state 저장소 (멀티 워커용) """
+
+    def __init__(self, ttl_seconds: int):
+        import redis
+
+        self.ttl_seconds = ttl_seconds
+        self.client = redis.Redis(
+            host=getattr(settings, 'RD_HOST', 'localhost'),
+            port=int(getattr(settings, 'RD_PORT', 6379)),
+            db=int(getattr(settings, 'RD_PART', 0)),
+            password=getattr(settings, 'RD_PASS', None) or None,
+            socket_timeout=1.0,
+            decode_responses=True
+        )
+
+    def put(self, key: str, value: Dict[str, Any]) -> bool:
+        """값 저장 (TTL 만료는 Redis가 처리)"""
+        return bool(self.client.set(key, json.dumps(value), ex=self.ttl_seconds, nx=True))
+
+    def consume(self, key: str) -> Optional[Dict[str, Any]]:
+        """값을 꺼내고 삭제 (GETDEL로 원자적 1회 사용)"""
+        raw = self.client.getdel(key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    def size(self) -> int:
+        """저장된 항목 수"""
+        return sum(1 for _ in self.client.scan_iter(match='oauth_state:*', count=500))
+
+class OAuthStateManager:
+    """ OAuth state / PKCE verifier 관리 클래스 """
+
+    def __init__(self):
+        self.ttl_seconds = getattr(settings, 'OAUTH_STATE_TTL_SECONDS', 600)
+        self.backend_type = getattr(settings, 'OAUTH_STATE_BACKEND', 'memory').lower()
+        self.strict = getattr(settings, 'OAUTH_STATE_STRICT', False)
+        self._backend = None
+        self._lock = threading.Lock()
+        self._logger = None
+
+    @property
+    def logger(self):
+        """로거 lazy loading"""
+        if self._logger is None:
+            try:
+                from extensions import app_logger
+                self._logger = app_logger
+            except ImportError:
+                pass
+            if self._logger is None:
+                # extensions가 아직 초기화되지 않은 경우 기본 로거 사용
+                import logging
+                logger = logging.getLogger('oauth_state_manager')
+                if not logger.handlers:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter(
+                        '[%(asctime)s] %(levelname)s: %(module)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.INFO)
+                self._logger = logger
+        return self._logger
+
+    @property
+    def backend(self):
+        """저장소 lazy loading"""
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    if self.backend_type == 'redis':
+                        self._backend = RedisStateBackend(self.ttl_seconds)
+                    else:
+                        self._backend = MemoryStateBackend(
+                            self.ttl_seconds,
+                            getattr(settings, 'OAUTH_STATE_MAX_ENTRIES', 10000)
+                        )
+        return self._backend
+
+    @staticmethod
+    def _key(provider: str, state: str) -> str:
+        return f"oauth_state:{provider}:{state}"
+
+    @staticmethod
+    def generate_pkce_pair() -> Tuple[str, str]:
+        """PKCE code_verifier, code_challenge(S256) 생성"""
+        code_verifier = secrets.token_urlsafe(64)
+        digest = hashlib.sha256(code_verifier.encode('ascii')).digest()
+        code_challenge = base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+        return code_verifier, code_challenge
+
+    def issue(self, provider: str, state: Optional[str] = None, use_pkce: bool = False) -> Dict[str, str]:
+        """state 발급 및 저장 (PKCE 사용 시 verifier도 함께 저장)"""
+        state = state or secrets.token_urlsafe(32)
+        value: Dict[str, Any] = {'issued_at': int(time.time())}
+        issued = {'state': state}
+
+        if use_pkce:
+            code_verifier, code_challenge = self.generate_pkce_pair()
+            value['code_verifier'] = code_verifier
+            issued['code_challenge'] = code_challenge
+
+        if not self.backend.put(self._key(provider, state), value):
+            raise ValueError("이미 사용 중인 state 값입니다.")
+        return issued
+
+    def consume(self, provider: str, state: str) -> Optional[Dict[str, Any]]:
+        """state 검증 후 삭제 (1회용)"""
+        if not state:
+            return None
+        try:
+            return self.backend.consume(self._key(provider, state))
+        except Exception as e:
+            self.logger.error(f"OAuth state 조회 실패: {str(e)}")
+            return None
+
+    def validate_callback(self, provider: str, state: Optional[str], required: bool = False) -> Dict[str, Any]:
+        """콜백 state 검증 - 실패 시 ValueError"""
+        if not state:
+            if required or self.strict:
+                raise ValueError("state 값이 필요합니다.")
+            # PKCE verifier 를 찾을 수 없으므로 제공자 토큰 교환이 실패할 수 있음
+            self.logger.warning(f"OAuth 콜백 state 누락: {provider} (code_verifier 없이 토큰 교환)")
+            return {}
+
+        state_data = self.consume(provider, state)
+        if state_data is None:
+            self.logger.warning(f"OAuth state 검증 실패: {provider}")
+            raise ValueError("유효하지 않거나 만료된 state 값입니다.")
+        return state_data
+
+    def size(self) -> int:
+        """저장된 state 수"""
+        return self.backend.size()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """state 저장소 상태 조회 (Redis는 키 스캔 비용 때문에 크기 생략)"""
+        return {
+            'backend': self.backend_type,
+            'size': self._backend.size() if isinstance(self._backend, MemoryStateBackend) else None
+        }
+
+oauth_state_manager = OAuthStateManager()
+
+runtime_registry.register('oauth_state', oauth_state_manager.get_stats)
@@ -0,0 +1,208 @@
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from flask import g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import settings
+from .metrics_manager import metrics_registry
+from .slow_query_logger import normalize_sql, slow_query_logger
+from .tracing import tracer
+
+class NPlusOneDetected(Exception):
+    """같은 형태의 쿼리가 한 요청에서 임계값 이상 반복됨 (엄격 모드)"""
+
+class RequestQueryStats:
+    """ 요청 단위 SQL 실행 통계 """
+
+    __slots__ = ('count', 'total_ns', 'slowest_ns', 'slowest_statement', 'shapes')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.slowest_ns = 0
+        self.slowest_statement: Optional[str] = None
+        # SQL 문자열 -> 실행 횟수 (SQLAlchemy 컴파일 캐시로 같은 쿼리는 같은 문자열)
+        self.shapes: Dict[str, int] = {}
+
+    def record(self, statement: str, duration_ns: int) -> None:
+        self.count += 1
+        self.total_ns += duration_ns
+        self.shapes[statement] = self.shapes.get(statement, 0) + 1
+        if duration_ns > self.slowest_ns:
+            self.slowest_ns = duration_ns
+            self.slowest_statement = statement
+
+    def repeated_shapes(self, threshold: int) -> List[Dict[str, Any]]:
+        """임계값 이상 반복된 쿼리 형태 (정규화 후 합산)"""
+        merged: Dict[str, int] = {}
+        for statement, count in self.shapes.items():
+            shape = normalize_sql(statement)
+            merged[shape] = merged.get(shape, 0) + count
+        return [
+            {'statement': shape, 'count': count}
+            for shape, count in sorted(merged.items(), key=lambda item: -item[1])
+            if count >= threshold
+        ]
+
+class QueryTracker:
+    """ SQLAlchemy 이벤트 기반 요청별 쿼리 카운터 / N+1 감지기 """
+
+    def __init__(self):
+        self.enabled = getattr(settings, 'SQL_QUERY_TRACKING_ENABLED', True)
+        self.n_plus_one_threshold = getattr(settings, 'SQL_N_PLUS_ONE_THRESHOLD', 5)
+        self.strict = getattr(settings, 'SQL_N_PLUS_ONE_STRICT', False)
+        self._installed = False
+        self._reported: set = set()
+        self._lock = threading.Lock()
+        self._logger = None
+
+        metrics_registry.register_histogram(
+            'http_request_db_queries',
+            '요청당 SQL 실행 수',
+            getattr(settings, 'SQL_QUERY_COUNT_BUCKETS', (1, 2, 3, 5, 8, 13, 21, 34, 55))
+        )
+        metrics_registry.register_histogram(
+            'http_request_db_duration_seconds',
+            '요청당 SQL 실행 시간 합계',
+            [int(bucket * 1_000_000) for bucket in (1, 5, 10, 25, 50, 100, 250, 500, 1000)],
+            scale=1e-9
+        )
+        metrics_registry.register_counter('db_n_plus_one_detected_total', 'N+1 의심 쿼리 감지 수')
+
+    @property
+    def logger(self):
+        """로거 lazy loading"""
+        if self._logger is None:
+            try:
+                from extensions import database_logger
+                self._logger = database_logger
+            except ImportError:
+                pass
+            if self._logger is None:
+                # extensions가 아직 초기화되지 않은 경우 기본 로거 사용
+                import logging
+                logger = logging.getLogger('query_tracker')
+                if not logger.handlers:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter(
+                        '[%(asctime)s] %(levelname)s: %(module)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.INFO)
+                self._logger = logger
+        return self._logger
+
+    def install(self) -> None:
+        """모든 엔진에 실행 이벤트 등록 - 요청별 통계 / 느린 쿼리 기록 공용 (중복 등록 방지)"""
+        if not self.enabled and not slow_query_logger.enabled and not tracer.enabled:
+            return
+        with self._lock:
+            if self._installed:
+                return
+            event.listen(Engine, 'before_cursor_execute', self._before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', self._after_cursor_execute)
+            event.listen(Engine, 'handle_error', self._handle_error)
+            self._installed = True
+
+    @staticmethod
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_start_ns = time.perf_counter_ns()
+            if tracer.enabled:
+                context._trace_span = tracer.start_span('db.query', statement=statement[:500])
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, '_query_start_ns', None)
+        if started is None:
+            return
+        duration_ns = time.perf_counter_ns() - started
+        tracer.end_span(getattr(context, '_trace_span', None))
+
+        if slow_query_logger.enabled and duration_ns >= slow_query_logger.threshold_ns:
+            slow_query_logger.record(conn, statement, parameters, executemany, duration_ns)
+
+        if not self.enabled or not has_request_context():
+            return
+        stats = g.get('db_stats')
+        if stats is None:
+            stats = g.db_stats = RequestQueryStats()
+        stats.record(statement, duration_ns)
+
+    @staticmethod
+    def _handle_error(exception_context):
+        context = exception_context.execution_context
+        span = getattr(context, '_trace_span', None) if context is not None else None
+        if span is not None:
+            span.record_error(exception_context.original_exception)
+            tracer.end_span(span)
+
+    def get_request_stats(self) -> Optional[RequestQueryStats]:
+        """현재 요청의 쿼리 통계"""
+        if not has_request_context():
+            return None
+        return g.get('db_stats')
+
+    def finish_request(self, endpoint: str) -> Dict[str, Any]:
+        """요청 종료 시 통계 기록 및 N+1 감지 - 접근 로그 필드 반환"""
+        # 엄격 모드 예외로 after_request가 다시 실행되는 경우 중복 집계 방지
+        finished = g.get('db_request_fields') if has_request_context() else None
+        if finished is not None:
+            return dict(finished)
+
+        stats = self.get_request_stats()
+        count = stats.count if stats is not None else 0
+        total_ns = stats.total_ns if stats is not None else 0
+
+        labels = (('endpoint', endpoint),)
+        metrics_registry.observe('http_request_db_queries', labels, count)
+        metrics_registry.observe('http_request_db_duration_seconds', labels, total_ns)
+
+        fields: Dict[str, Any] = {
+            'db_query_count': count,
+            'db_time_ms': round(total_ns / 1_000_000, 2)
+        }
+        if stats is None:
+            return fields
+
+        g.db_request_fields = fields
+        fields['db_slowest_ms'] = round(stats.slowest_ns / 1_000_000, 2)
+        fields['db_slowest_statement'] = (stats.slowest_statement or '')[:200]
+
+        if self.n_plus_one_threshold and count >= self.n_plus_one_threshold:
+            repeated = stats.repeated_shapes(self.n_plus_one_threshold)
+            if repeated:
+                fields['db_repeated_statements'] = len(repeated)
+                self._report_n_plus_one(endpoint, repeated)
+        return fields
+
+    def _report_n_plus_one(self, endpoint: str, repeated: List[Dict[str, Any]]) -> None:
+        metrics_registry.inc('db_n_plus_one_detected_total', (('endpoint', endpoint),))
+
+        # 같은 엔드포인트/쿼리 형태는 프로세스당 한 번만 경고
+        key = (endpoint, repeated[0]['statement'])
+        if key not in self._reported:
+            self._reported.add(key)
+            self.logger.warning(
+                f"N+1 의심 쿼리 감지: {endpoint} - "
+                f"{repeated[0]['count']}회 반복 (임계값 {self.n_plus_one_threshold}) - "
+                f"{repeated[0]['statement'][:300]}"
+            )
+
+        if self.strict:
+            g.db_n_plus_one = (endpoint, repeated[0])
+
+    def enforce(self) -> None:
+        """엄격 모드(CI)에서 N+1 감지 시 예외 발생 (500 응답으로 전환)"""
+        detected = g.pop('db_n_plus_one', None) if has_request_context() else None
+        if detected is not None:
+            endpoint, repeated = detected
+            raise NPlusOneDetected(
+                f"{endpoint} 에서 같은 형태의 쿼리가 {repeated['count']}회 반복되었습니다: "
+                f"{repeated['statement'][:300]}"
+            )
+
+# 전역 쿼리 추적기
+query_tracker = QueryTracker()
@@ -0,0 +1,203 @@
+import hashlib
+import hmac
+import os
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+from flask import Flask, g, request
+import settings
+
+_FILENAME_SAFE_RE = re.compile(r'[^A-Za-z0-9_.-]+')
+
+class StackSampler:
+    """ 등록된 스레드의 호출 스택을 주기적으로 수집하는 통계적 프로파일러 """
+
+    def __init__(self, interval_seconds: float = 0.005, max_depth: int = 128):
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        # 스레드 ID -> {collapsed stack: 샘플 수}
+        self._targets: Dict[int, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, thread_id: int) -> None:
+        """스레드 샘플링 시작"""
+        with self._lock:
+            self._targets[thread_id] = {}
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def stop(self, thread_id: int) -> Dict[str, int]:
+        """스레드 샘플링 종료 후 수집된 스택 반환"""
+        with self._lock:
+            return self._targets.pop(thread_id, {})
+
+    def _collapse(self, frame) -> str:
+        names = []
+        depth = 0
+        while frame is not None and depth < self.max_depth:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+            depth += 1
+        names.reverse()
+        return ';'.join(names)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                idle = not self._targets
+                if idle:
+                    self._wakeup.clear()
+            if idle:
+                self._wakeup.wait()
+                continue
+
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, stacks in self._targets.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        stack = self._collapse(frame)
+                        stacks[stack] = stacks.get(stack, 0) + 1
+            del frames
+            time.sleep(self.interval_seconds)
+
+class RequestProfiler:
+    """ 요청 단위 on-demand 프로파일러 (엔드포인트 / 샘플링 비율 / 서명 헤더) """
+
+    HEADER_NAME = 'X-Profile-Request'
+
+    def __init__(self):
+        self.endpoints = set(getattr(settings, 'PROFILING_ENDPOINTS', ()))
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 0.0)
+        self.secret = getattr(settings, 'PROFILING_SECRET', '')
+        self.signature_ttl_seconds = getattr(settings, 'PROFILING_SIGNATURE_TTL_SECONDS', 300)
+        self.output_dir = os.path.join(getattr(settings, 'LOG_DIR', 'logs'), 'profiles')
+        self.sampler = StackSampler(getattr(settings, 'PROFILING_INTERVAL_MS', 5) / 1000)
+        self._logger = None
+        self._refresh_enabled()
+
+    def _refresh_enabled(self) -> None:
+        # 비활성화 시 요청당 비용은 이 플래그 확인 한 번
+        self.enabled = bool(self.endpoints or self.sample_rate > 0 or self.secret)
+
+    @property
+    def logger(self):
+        """로거 lazy loading"""
+        if self._logger is None:
+            try:
+                from extensions import app_logger
+                self._logger = app_logger
+            except ImportError:
+                pass
+            if self._logger is None:
+                # extensions가 아직 초기화되지 않은 경우 기본 로거 사용
+                import logging
+                logger = logging.getLogger('request_profiler')
+                if not logger.handlers:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter(
+                        '[%(asctime)s] %(levelname)s: %(module)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.INFO)
+                self._logger = logger
+        return self._logger
+
+    def configure(self, endpoints=None, sample_rate: Optional[float] = None) -> None:
+        """프로파일링 대상 변경 (런타임)"""
+        if endpoints is not None:
+            self.endpoints = set(endpoints)
+        if sample_rate is not None:
+            self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self._refresh_enabled()
+
+    def sign(self, timestamp: Optional[int] = None) -> str:
+        """프로파일링 요청 헤더 값 생성 (timestamp.signature)"""
+        timestamp = int(timestamp if timestamp is not None else time.time())
+        signature = hmac.new(self.secret.encode('utf-8'), str(timestamp).encode('ascii'), hashlib.sha256).hexdigest()
+        return f"{timestamp}.{signature}"
+
+    def _verify_header(self, value: str) -> bool:
+        if not self.secret or not value:
+            return False
+        timestamp, _, signature = value.partition('.')
+        if not timestamp.isdigit() or abs(time.time() - int(timestamp)) > self.signature_ttl_seconds:
+            return False
+        return hmac.compare_digest(self.sign(int(timestamp)), value)
+
+    def _should_profile(self) -> Optional[str]:
+        """프로파일링 사유 반환 (대상이 아니면 None)"""
+        header = request.headers.get(self.HEADER_NAME)
+        if header is not None:
+            return 'header' if self._verify_header(header) else None
+        if request.url_rule is not None and request.url_rule.rule in self.endpoints:
+            return 'endpoint'
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return 'sample'
+        return None
+
+    def begin(self) -> None:
+        """요청 시작 시 프로파일링 여부 결정 후 샘플링 시작"""
+        reason = self._should_profile()
+        if reason is None:
+            return
+        g.profile_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.urandom(4).hex()}"
+        g.profile_reason = reason
+        g.profile_thread_id = threading.get_ident()
+        g.profile_started = time.perf_counter()
+        self.sampler.start(g.profile_thread_id)
+
+    def end(self) -> None:
+        """요청 종료 시 샘플링 종료 후 collapsed stack 파일 저장"""
+        thread_id = g.pop('profile_thread_id', None)
+        if thread_id is None:
+            return
+        stacks = self.sampler.stop(thread_id)
+        elapsed = time.perf_counter() - g.profile_started
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            rule = request.url_rule.rule if request.url_rule is not None else request.path
+            endpoint = _FILENAME_SAFE_RE.sub('_', f"{request.method}{rule}").strip('_')
+            file_path = os.path.join(self.output_dir, f"{g.profile_id}_{endpoint}.folded")
+            with open(file_path, 'w', encoding='utf-8') as profile_file:
+                for stack, count in sorted(stacks.items(), key=lambda item: -item[1]):
+                    profile_file.write(f"{stack} {count}\n")
+            self.logger.info(
+                f"요청 프로파일 저장: {file_path} "
+                f"(사유: {g.profile_reason}, 샘플: {sum(stacks.values())}, 소요: {elapsed * 1000:.1f}ms)"
+            )
+        except Exception as e:
+            self.logger.error(f"요청 프로파일 저장 실패: {str(e)}")
+
+# 전역 요청 프로파일러
+request_profiler = RequestProfiler()
+
+def setup_profiling(app: Flask) -> None:
+    """Flask 앱에 요청 프로파일링 훅 등록"""
+
+    @app.before_request
+    def start_request_profile():
+        if request_profiler.enabled:
+            request_profiler.begin()
+
+    @app.after_request
+    def add_profile_header(response):
+        if 'profile_id' in g:
+            response.headers['X-Profile-Id'] = g.profile_id
+        return response
+
+    @app.teardown_request
+    def finish_request_profile(exception=None):
+        if 'profile_thread_id' in g:
+            request_profiler.end()
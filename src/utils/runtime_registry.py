@@ -0,0 +1,77 @@
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict
+
+class RuntimeRegistry:
+    """ 서브시스템별 런타임 상태 제공자 레지스트리 (메모리 내 값만 조회, DB 접근 없음) """
+
+    def __init__(self):
+        self.providers: Dict[str, Callable[[], Any]] = {}
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+        self.register('process', self._process_stats)
+        self.register('threads', self._thread_stats)
+
+    def register(self, name: str, provider: Callable[[], Any]) -> None:
+        """상태 제공자 등록 (같은 이름은 덮어씀)"""
+        with self._lock:
+            self.providers[name] = provider
+
+    def unregister(self, name: str) -> None:
+        """상태 제공자 해제"""
+        with self._lock:
+            self.providers.pop(name, None)
+
+    @staticmethod
+    def _rss_bytes() -> int:
+        # Linux는 /proc 에서 현재 RSS, 그 외에는 최대 RSS 로 대체
+        try:
+            with open('/proc/self/statm', 'r') as statm:
+                return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            pass
+        try:
+            import resource
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return peak if sys.platform == 'darwin' else peak * 1024
+        except Exception:
+            return 0
+
+    def _process_stats(self) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'rss_bytes': self._rss_bytes()
+        }
+
+    @staticmethod
+    def _thread_stats() -> Dict[str, Any]:
+        threads = threading.enumerate()
+        by_name: Dict[str, int] = {}
+        for thread in threads:
+            # 'ThreadPoolExecutor-0_3' 같은 이름은 접두사 기준으로 묶음
+            prefix = thread.name.rstrip('0123456789').rstrip('_-') or thread.name
+            by_name[prefix] = by_name.get(prefix, 0) + 1
+        return {
+            'active': len(threads),
+            'daemon': sum(1 for thread in threads if thread.daemon),
+            'by_name': by_name
+        }
+
+    def collect(self) -> Dict[str, Any]:
+        """등록된 모든 제공자의 상태 수집"""
+        with self._lock:
+            providers = list(self.providers.items())
+        report: Dict[str, Any] = {}
+        for name, provider in providers:
+            try:
+                report[name] = provider()
+            except Exception as e:
+                report[name] = {'error': str(e)[:300]}
+        return report
+
+# 전역 런타임 레지스트리
+runtime_registry = RuntimeRegistry()
@@ -0,0 +1,194 @@
+import hashlib
+import json
+import queue
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+from flask import has_request_context, request
+import settings
+from .metrics_manager import metrics_registry
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_IN_LIST_RE = re.compile(r'\bIN\s*\((?:\s*(?:%\(\w+\)s|%s|\?|:\w+)\s*,?)+\)', re.IGNORECASE)
+_VALUES_LIST_RE = re.compile(r'\bVALUES\s*(\([^()]*\))(?:\s*,\s*\([^()]*\))+', re.IGNORECASE)
+_EXPLAINABLE_RE = re.compile(r'^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b', re.IGNORECASE)
+
+def normalize_sql(statement: str) -> str:
+    """SQL 문 형태 정규화 (공백 정리, IN / VALUES 목록 축약)"""
+    normalized = _WHITESPACE_RE.sub(' ', statement).strip()
+    normalized = _IN_LIST_RE.sub('IN (...)', normalized)
+    normalized = _VALUES_LIST_RE.sub(r'VALUES \1, ...', normalized)
+    return normalized
+
+def sql_fingerprint(normalized: str) -> str:
+    """정규화된 SQL 문의 지문"""
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()[:16]
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    """파라미터 값 대신 타입만 기록 (개인정보 노출 방지)"""
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {
+            'executemany': len(parameters),
+            'row': parameter_shape(parameters[0]) if parameters else None
+        }
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__ if parameters is not None else None
+
+class SlowQueryLogger:
+    """ 느린 쿼리 기록 및 PostgreSQL 실행 계획(EXPLAIN) 수집 """
+
+    def __init__(self):
+        self.enabled = getattr(settings, 'SQL_SLOW_QUERY_ENABLED', True)
+        self.threshold_ns = int(getattr(settings, 'SQL_SLOW_QUERY_THRESHOLD_MS', 200) * 1_000_000)
+        self.explain_enabled = getattr(settings, 'SQL_SLOW_QUERY_EXPLAIN', False)
+        self.max_fingerprints = getattr(settings, 'SQL_SLOW_QUERY_MAX_FINGERPRINTS', 1000)
+        # 지문 -> {statement, count, max_ms, last_seen, plan}
+        self.fingerprints: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._explain_queue: queue.Queue = queue.Queue(maxsize=100)
+        self._explain_thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._logger = None
+
+        metrics_registry.register_counter('db_slow_queries_total', '느린 쿼리 수')
+
+    @property
+    def logger(self):
+        """로거 lazy loading"""
+        if self._logger is None:
+            try:
+                from extensions import database_logger
+                self._logger = database_logger
+            except ImportError:
+                pass
+            if self._logger is None:
+                # extensions가 아직 초기화되지 않은 경우 기본 로거 사용
+                import logging
+                logger = logging.getLogger('slow_query_logger')
+                if not logger.handlers:
+                    handler = logging.StreamHandler()
+                    formatter = logging.Formatter(
+                        '[%(asctime)s] %(levelname)s: %(module)s - %(message)s',
+                        datefmt='%Y-%m-%d %H:%M:%S'
+                    )
+                    handler.setFormatter(formatter)
+                    logger.addHandler(handler)
+                    logger.setLevel(logging.INFO)
+                self._logger = logger
+        return self._logger
+
+    def record(self, conn, statement: str, parameters: Any, executemany: bool, duration_ns: int) -> None:
+        """느린 쿼리 기록 (임계값 비교는 호출 측에서 수행)"""
+        try:
+            normalized = normalize_sql(statement)
+            fingerprint = sql_fingerprint(normalized)
+            duration_ms = round(duration_ns / 1_000_000, 2)
+
+            with self._lock:
+                entry = self.fingerprints.get(fingerprint)
+                first_seen = entry is None
+                if first_seen:
+                    entry = {'statement': normalized, 'count': 0, 'max_ms': 0.0, 'plan': None}
+                    self.fingerprints[fingerprint] = entry
+                    while len(self.fingerprints) > self.max_fingerprints:
+                        self.fingerprints.popitem(last=False)
+                else:
+                    self.fingerprints.move_to_end(fingerprint)
+                entry['count'] += 1
+                entry['max_ms'] = max(entry['max_ms'], duration_ms)
+                entry['last_seen'] = datetime.now().isoformat()
+
+            metrics_registry.inc('db_slow_queries_total')
+
+            log_data: Dict[str, Any] = {
+                'fingerprint': fingerprint,
+                'duration_ms': duration_ms,
+                'statement': normalized[:2000],
+                'parameters': parameter_shape(parameters, executemany),
+                'occurrence': entry['count']
+            }
+            if has_request_context():
+                log_data['endpoint'] = request.url_rule.rule if request.url_rule is not None else request.path
+                log_data['method'] = request.method
+            self.logger.warning(f"느린 쿼리: {json.dumps(log_data, ensure_ascii=False)}")
+
+            if first_seen and self.explain_enabled and conn.dialect.name == 'postgresql' \
+                    and _EXPLAINABLE_RE.match(statement):
+                self._schedule_explain(conn.engine, fingerprint, statement, parameters, executemany)
+        except Exception as e:
+            self.logger.error(f"느린 쿼리 기록 실패: {str(e)}")
+
+    def _schedule_explain(self, engine, fingerprint: str, statement: str,
+                          parameters: Any, executemany: bool) -> None:
+        """EXPLAIN은 요청 트랜잭션에 영향이 없도록 별도 연결/스레드에서 실행"""
+        if executemany and isinstance(parameters, (list, tuple)):
+            parameters = parameters[0] if parameters else None
+        try:
+            self._explain_queue.put_nowait((engine, fingerprint, statement, parameters))
+        except queue.Full:
+            return
+
+        if self._explain_thread is None or not self._explain_thread.is_alive():
+            with self._lock:
+                if self._explain_thread is None or not self._explain_thread.is_alive():
+                    self._explain_thread = threading.Thread(
+                        target=self._explain_worker, name='slow-query-explain', daemon=True
+                    )
+                    self._explain_thread.start()
+
+    def _explain_worker(self) -> None:
+        while True:
+            engine, fingerprint, statement, parameters = self._explain_queue.get()
+            raw_connection = None
+            try:
+                # 드라이버 파라미터 형식을 그대로 사용하기 위해 DBAPI 연결에서 실행
+                raw_connection = engine.raw_connection()
+                cursor = raw_connection.cursor()
+                try:
+                    cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                    plan = cursor.fetchone()[0]
+                finally:
+                    cursor.close()
+                    raw_connection.rollback()
+
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                with self._lock:
+                    entry = self.fingerprints.get(fingerprint)
+                    if entry is not None:
+                        entry['plan'] = plan
+
+                self.logger.warning(
+                    f"느린 쿼리 실행 계획: {json.dumps({'fingerprint': fingerprint, 'plan': plan}, ensure_ascii=False)}"
+                )
+            except Exception as e:
+                self.logger.error(f"느린 쿼리 실행 계획 수집 실패: {fingerprint} - {str(e)}")
+            finally:
+                if raw_connection is not None:
+                    try:
+                        raw_connection.close()
+                    except Exception:
+                        pass
+
+    def get_plan(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """지문별 느린 쿼리 정보 / 실행 계획 조회"""
+        with self._lock:
+            entry = self.fingerprints.get(fingerprint)
+            return dict(entry) if entry is not None else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """느린 쿼리 요약 조회 (실행 계획 제외)"""
+        summary = {}
+        with self._lock:
+            for fingerprint, entry in self.fingerprints.items():
+                item = {key: value for key, value in entry.items() if key != 'plan'}
+                item['has_plan'] = entry['plan'] is not None
+                summary[fingerprint] = item
+        return summary
+
+# 전역 느린 쿼리 로거
+slow_query_logger = SlowQueryLogger()
@@ -0,0 +1,300 @@
+import atexit
+import contextvars
+import json
+import os
+import queue
+import re
+import threading
+import time
+import uuid
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+from flask import Flask, g, request
+import settings
+from .runtime_registry import runtime_registry
+
+_REQUEST_ID_RE = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+class Span:
+    """ 추적 구간 """
+
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'start_ns',
+                 'start_time', 'duration_ns', 'attributes', 'status', 'error')
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], name: str, attributes: Dict[str, Any]):
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
+        self.duration_ns: Optional[int] = None
+        self.attributes = attributes
+        self.status = 'ok'
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: Any) -> None:
+        self.status = 'error'
+        self.error = str(error)[:500]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'start_time': round(self.start_time, 6),
+            'duration_ms': round((self.duration_ns or 0) / 1_000_000, 3),
+            'status': self.status,
+            'error': self.error,
+            'attributes': self.attributes
+        }
+
+class _NoopSpan:
+    """ 추적 비활성 / 요청 밖에서 사용하는 빈 구간 """
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, error: Any) -> None:
+        pass
+
+_NOOP_SPAN = _NoopSpan()
+
+class _SpanContext:
+    """ with 문용 구간 컨텍스트 """
+
+    __slots__ = ('tracer', 'name', 'attributes', 'span', 'token')
+
+    def __init__(self, tracer: 'Tracer', name: str, attributes: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.span = None
+        self.token = None
+
+    def __enter__(self):
+        self.span = self.tracer.start_span(self.name, **self.attributes)
+        if self.span is None:
+            return _NOOP_SPAN
+        self.token = self.tracer.current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.span is None:
+            return False
+        if exc_value is not None:
+            self.span.record_error(exc_value)
+        self.tracer.current_span.reset(self.token)
+        self.tracer.end_span(self.span)
+        return False
+
+class BatchSpanExporter:
+    """ 구간을 모아 백그라운드 스레드에서 JSONL 파일 / 수집기로 일괄 전송 """
+
+    def __init__(self, file_path: Optional[str], collector_url: Optional[str] = None,
+                 batch_size: int = 256, interval_seconds: float = 2.0,
+                 max_queue_size: int = 10000, max_file_bytes: int = 50 * 1024 * 1024):
+        self.file_path = file_path
+        self.collector_url = collector_url
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.max_file_bytes = max_file_bytes
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self.exported = 0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """구간 적재 (큐가 가득 차면 버림)"""
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self._thread is None:
+            self._start()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='span-exporter', daemon=True)
+                self._thread.start()
+
+    def _drain(self) -> List[Span]:
+        batch = []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._stop.wait(self.interval_seconds)
+            self.flush()
+
+    def flush(self) -> None:
+        """큐에 쌓인 구간 모두 전송"""
+        while True:
+            batch = self._drain()
+            if not batch:
+                return
+            try:
+                self._write(batch)
+                self.exported += len(batch)
+            except Exception:
+                self.dropped += len(batch)
+
+    def _write(self, batch: List[Span]) -> None:
+        payload = [span.to_dict() for span in batch]
+        if self.collector_url:
+            import requests
+            requests.post(self.collector_url, json=payload, timeout=2)
+        if self.file_path:
+            if os.path.exists(self.file_path) and os.path.getsize(self.file_path) >= self.max_file_bytes:
+                os.replace(self.file_path, f"{self.file_path}.1")
+            with open(self.file_path, 'a', encoding='utf-8') as trace_file:
+                trace_file.write(''.join(
+                    json.dumps(item, ensure_ascii=False, separators=(',', ':'), default=str) + '\n'
+                    for item in payload
+                ))
+
+    def shutdown(self) -> None:
+        """남은 구간 전송 후 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def reset_after_fork(self) -> None:
+        """fork 이후 자식 프로세스에서 새 큐로 초기화 (전송 스레드는 첫 구간 적재 시 시작)"""
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self.exported = 0
+        self.dropped = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전송 상태 조회"""
+        return {
+            'queue_size': self.queue.qsize(),
+            'exported': self.exported,
+            'dropped': self.dropped
+        }
+
+class Tracer:
+    """ 요청 단위 경량 트레이서 (요청 밖에서는 구간을 만들지 않음) """
+
+    def __init__(self):
+        self.enabled = getattr(settings, 'TRACING_ENABLED', False)
+        self.current_span: contextvars.ContextVar = contextvars.ContextVar('current_span', default=None)
+        log_dir = getattr(settings, 'LOG_DIR', 'logs')
+        self.exporter = BatchSpanExporter(
+            file_path=os.path.join(log_dir, getattr(settings, 'TRACING_FILE', 'traces.jsonl')),
+            collector_url=getattr(settings, 'TRACING_COLLECTOR_URL', None),
+            batch_size=getattr(settings, 'TRACING_EXPORT_BATCH_SIZE', 256),
+            interval_seconds=getattr(settings, 'TRACING_EXPORT_INTERVAL_SECONDS', 2.0),
+            max_queue_size=getattr(settings, 'TRACING_QUEUE_SIZE', 10000)
+        )
+
+    def start_span(self, name: str, **attributes) -> Optional[Span]:
+        """현재 구간의 하위 구간 시작 (진행 중인 추적이 없으면 None)"""
+        if not self.enabled:
+            return None
+        parent = self.current_span.get()
+        if parent is None:
+            return None
+        return Span(parent.trace_id, parent.span_id, name, attributes)
+
+    def start_trace(self, name: str, trace_id: str, **attributes) -> Optional[Span]:
+        """최상위 구간 시작"""
+        if not self.enabled:
+            return None
+        return Span(trace_id, None, name, attributes)
+
+    def end_span(self, span: Optional[Span]) -> None:
+        """구간 종료 후 전송 큐에 적재"""
+        if span is None or span.duration_ns is not None:
+            return
+        span.duration_ns = time.perf_counter_ns() - span.start_ns
+        self.exporter.export(span)
+
+    def span(self, name: str, **attributes) -> _SpanContext:
+        """with 문으로 구간 생성"""
+        return _SpanContext(self, name, attributes)
+
+    def trace(self, name: Optional[str] = None) -> Callable:
+        """함수 호출을 구간으로 감싸는 데코레이터"""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled or self.current_span.get() is None:
+                    return func(*args, **kwargs)
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+# 전역 트레이서
+tracer = Tracer()
+
+# 프로세스 종료 시 남은 구간 전송
+atexit.register(tracer.exporter.shutdown)
+
+runtime_registry.register('span_exporter', tracer.exporter.get_stats)
+
+def setup_tracing(app: Flask) -> None:
+    """요청 ID 발급 및 요청 최상위 구간 훅 등록"""
+
+    @app.before_request
+    def start_request_trace():
+        # 업스트림(프록시 / 게이트웨이)에서 전달된 요청 ID는 형식이 맞을 때만 사용
+        incoming = request.headers.get('X-Request-Id', '')
+        g.request_id = incoming if _REQUEST_ID_RE.match(incoming) else uuid.uuid4().hex
+        if tracer.enabled:
+            span = tracer.start_trace(
+                'http.request', g.request_id,
+                method=request.method,
+                path=request.path,
+                route=request.url_rule.rule if request.url_rule is not None else None
+            )
+            g.trace_span = span
+            g.trace_token = tracer.current_span.set(span)
+
+    @app.after_request
+    def add_request_id_header(response):
+        response.headers['X-Request-Id'] = g.get('request_id', '')
+        span = g.get('trace_span')
+        if span is not None:
+            span.set_attribute('status_code', response.status_code)
+            if response.status_code >= 500:
+                span.status = 'error'
+        return response
+
+    @app.teardown_request
+    def finish_request_trace(exception=None):
+        span = g.pop('trace_span', None)
+        if span is None:
+            return
+        if exception is not None:
+            span.record_error(exception)
+        try:
+            tracer.current_span.reset(g.pop('trace_token'))
+        except ValueError:
+            # 다른 컨텍스트에서 생성된 토큰이면 직접 초기화
+            tracer.current_span.set(None)
+        tracer.end_span(span)
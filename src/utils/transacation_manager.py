@@ -1,6 +1,7 @@
 from functools import wraps
 from flask import g
 from typing import Callable, Any
+from .hot_path_logger import hot_path_logger
 
 def get_transaction_logger():
     """트랜잭션 전용 로거 생성"""
@@ -47,7 +48,7 @@ def safe_commit(db_session):
     logger = get_transaction_logger()
     try:
         db_session.commit()
-        logger.info("커밋 성공")
+        hot_path_logger.info(logger, 'db.safe_commit', "커밋 성공")
         return True
     except Exception as e:
         db_session.rollback()
@@ -1,39 +1,63 @@
+import os
+import socket
 import threading
-from typing import Dict, Optional
+import weakref
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 import atexit
 import time
 import signal
 import sys
-from sshtunnel import SSHTunnelForwarder
-import sys
 import settings
 
 from .loging_manager import get_app_logger
+from .metrics_manager import metrics_registry
+from .runtime_registry import runtime_registry
+
+if TYPE_CHECKING:
+    from sshtunnel import SSHTunnelForwarder
 
 class SSHTunnel:
     """SSH 터널링 클래스"""
-    def __init__(self):
-        self.tunnel: Optional[SSHTunnelForwarder] = None
+    def __init__(self, ssh_config: Optional[Dict[str, Any]] = None):
+        # 점프 호스트별 접속 정보 (없는 항목은 기본 SSH 설정 사용)
+        ssh_config = ssh_config or {}
+        self.ssh_host = ssh_config.get('host', settings.SSH_HOST)
+        self.ssh_port = ssh_config.get('port', settings.SSH_PORT)
+        self.ssh_user = ssh_config.get('user', settings.SSH_USER)
+        self.ssh_password = ssh_config.get('password', settings.SSH_PASSWORD)
+        self.tunnel: Optional['SSHTunnelForwarder'] = None
         self.local_port: Optional[int] = None
-        self._lock = threading.Lock()
+        # 생성 실패 시 같은 락 안에서 정리하므로 재진입 가능해야 함
+        self._lock = threading.RLock()
         self._is_active = False
         self.logger = get_app_logger()
+        # 자동 복구 상태
+        self.preferred_port = 0
+        self.generation = 0
+        self.reconnects = 0
+        self.failures = 0
+        self.next_retry_at = 0.0
+        self.last_error: Optional[str] = None
+        self.recover_lock = threading.Lock()
     
-    def create_tunnel(self) -> bool:
-        """SSH 터널링 생성"""
+    def create_tunnel(self, local_port: int = 0) -> bool:
+        """SSH 터널링 생성 (local_port=0 이면 임의 포트)"""
         with self._lock:
             if self._is_active:
                 self.logger.info("SSH 터널이 이미 활성화되어 있습니다.")
                 return True
                 
             try:
+                # sshtunnel(paramiko)은 터널을 실제로 열 때만 로드 (import 비용 절감)
+                from sshtunnel import SSHTunnelForwarder
+                
                 # SSH 터널 설정
                 self.tunnel = SSHTunnelForwarder(
-                    (settings.SSH_HOST, settings.SSH_PORT),
-                    ssh_username=settings.SSH_USER,
-                    ssh_password=settings.SSH_PASSWORD,
+                    (self.ssh_host, self.ssh_port),
+                    ssh_username=self.ssh_user,
+                    ssh_password=self.ssh_password,
                     remote_bind_address=(settings.REMOTE_DB_HOST, settings.REMOTE_DB_PORT),
-                    local_bind_address=('localhost', 0),
+                    local_bind_address=('localhost', local_port),
                     allow_agent=False,
                     set_keepalive=60.0
                 )
@@ -43,22 +67,30 @@ class SSHTunnel:
                 
                 # 로컬 포트 가져오기
                 self.local_port = self.tunnel.local_bind_port
+                self.preferred_port = self.local_port
+                self.generation += 1
                 self._is_active = True
                 
-                self.logger.info(f"SSH 터널링 생성 완료: localhost:{self.local_port} -> {settings.SSH_HOST}:{settings.SSH_PORT} -> {settings.REMOTE_DB_HOST}:{settings.REMOTE_DB_PORT}")
+                self.logger.info(f"SSH 터널링 생성 완료: localhost:{self.local_port} -> {self.ssh_host}:{self.ssh_port} -> {settings.REMOTE_DB_HOST}:{settings.REMOTE_DB_PORT}")
                 return True
                 
             except Exception as e:
                 self.logger.error(f"SSH 터널링 생성 실패: {str(e)}")
-                self.close_tunnel()
+                # 시작에 실패한 포워더의 리스너 / 스레드 정리
+                if self.tunnel is not None:
+                    try:
+                        self.tunnel.stop(force=True)
+                    except Exception:
+                        pass
+                    self.tunnel = None
                 raise e
 
-    def close_tunnel(self) -> None:
-        """SSH 터널링 종료"""
+    def close_tunnel(self, force: bool = False) -> None:
+        """SSH 터널링 종료 (force=True 이면 진행 중인 연결을 기다리지 않음)"""
         with self._lock:
             if self.tunnel and self._is_active:
                 try:
-                    self.tunnel.stop()
+                    self.tunnel.stop(force=force)
                     self.tunnel = None
                     self.local_port = None
                     self._is_active = False
@@ -79,11 +111,114 @@ class SSHTunnel:
         """로컬 포트 반환"""
         return self.local_port if self._is_active else None
 
+    def probe(self, timeout: float = 3.0) -> bool:
+        """SSH 전송 계층과 로컬 포트 -> 원격 DB 경로 점검"""
+        if not self.is_active() or self.local_port is None:
+            return False
+        try:
+            with socket.create_connection(('localhost', self.local_port), timeout=timeout) as probe_socket:
+                # 원격 연결(채널) 생성에 실패하면 포워더가 바로 소켓을 닫음
+                # PostgreSQL 은 클라이언트 메시지를 기다리므로 timeout, MariaDB 는 인사 패킷을 보냄
+                probe_socket.settimeout(timeout)
+                try:
+                    return probe_socket.recv(1) != b''
+                except socket.timeout:
+                    return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _is_port_free(port: int) -> bool:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as bind_socket:
+            # 포워더와 같이 SO_REUSEADDR 사용 (TIME_WAIT 상태 연결은 무시)
+            bind_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                bind_socket.bind(('localhost', port))
+                return True
+            except OSError:
+                return False
+
+    def reconnect(self) -> bool:
+        """포워더 재생성 (가능하면 기존 로컬 포트 유지)"""
+        port = self.preferred_port
+        with self._lock:
+            # 죽은 포워더는 진행 중인 연결을 기다리지 않고 정리
+            if self.tunnel is not None:
+                try:
+                    self.tunnel.stop(force=True)
+                except Exception:
+                    pass
+                self.tunnel = None
+            self.local_port = None
+            self._is_active = False
+        if port and not self._is_port_free(port):
+            self.logger.warning(f"SSH 터널 로컬 포트 {port} 를 다시 사용할 수 없어 새 포트를 사용합니다.")
+            port = 0
+        return self.create_tunnel(port)
+
+class TunnelPool:
+    """ 여러 SSH 터널(점프 호스트 x 호스트당 개수)에 DB 연결을 분산하는 풀 """
+
+    def __init__(self, manager: 'TunnelManager', name: str, member_keys: List[str]):
+        self.manager = manager
+        self.name = name
+        self.members = member_keys
+        self._lock = threading.Lock()
+        self._cursor = 0
+
+    def _candidates(self) -> List[str]:
+        # 연결 수가 적은 터널 우선, 같으면 라운드 로빈 순서
+        with self._lock:
+            start = self._cursor
+            self._cursor = (self._cursor + 1) % len(self.members)
+        ordered = self.members[start:] + self.members[:start]
+        now = time.monotonic()
+        healthy = []
+        for order, key in enumerate(ordered):
+            tunnel = self.manager.tunnels.get(key)
+            if tunnel is not None and not tunnel.is_active() and now < tunnel.next_retry_at:
+                # 생성 / 재연결 실패 후 백오프 대기 중인 터널은 제외
+                continue
+            # 아직 열지 않은 터널은 연결 수 0 으로 취급 (부하가 생기면 그때 생성)
+            healthy.append((self.manager.connection_count(key), order, key))
+        return [key for _, _, key in sorted(healthy)]
+
+    def select(self) -> Optional[Tuple[str, SSHTunnel]]:
+        """연결할 터널 (키, 터널) 선택 (사용 가능한 터널이 없으면 None)"""
+        for key in self._candidates():
+            tunnel = self.manager.tunnels.get(key)
+            if tunnel is None or tunnel.generation == 0:
+                # 아직 한 번도 열리지 않은 터널 (이전 생성 실패 포함)
+                tunnel = self.manager.get_or_create_tunnel(key)
+            elif not tunnel.is_active():
+                # 감시 스레드보다 먼저 발견한 경우 바로 복구 시도
+                self.manager.recover_tunnel(key, tunnel)
+            if tunnel is not None and tunnel.get_local_port() is not None:
+                return key, tunnel
+        return None
+
 class TunnelManager:
     def __init__(self):
         self.tunnels: Dict[str, SSHTunnel] = {}
         self.lock = threading.Lock()
         self.logger = get_app_logger()
+        self.probe_interval_seconds = getattr(settings, 'SSH_TUNNEL_PROBE_INTERVAL_SECONDS', 10)
+        self.probe_timeout_seconds = getattr(settings, 'SSH_TUNNEL_PROBE_TIMEOUT_SECONDS', 3)
+        self.backoff_seconds = getattr(settings, 'SSH_TUNNEL_RECONNECT_BACKOFF_SECONDS', 1)
+        self.max_backoff_seconds = getattr(settings, 'SSH_TUNNEL_RECONNECT_MAX_BACKOFF_SECONDS', 60)
+        self.pool_size = max(1, getattr(settings, 'SSH_TUNNEL_POOL_SIZE', 1))
+        # 터널 키 -> 점프 호스트 접속 정보 / 풀 이름 -> 풀
+        self.tunnel_configs: Dict[str, Dict[str, Any]] = {}
+        self.pools: Dict[str, TunnelPool] = {}
+        # 터널 키 -> 해당 터널로 맺어진 DB 연결 (재연결 시 무효화 대상)
+        self.connection_records: Dict[str, 'weakref.WeakSet'] = {}
+        self._supervisor: Optional[threading.Thread] = None
+        self._supervisor_pid: Optional[int] = None
+        self._supervisor_lock = threading.Lock()
+        self._supervisor_stop = threading.Event()
+
+        metrics_registry.register_counter('ssh_tunnel_reconnects_total', 'SSH 터널 재연결 성공 수')
+        metrics_registry.register_counter('ssh_tunnel_failures_total', 'SSH 터널 점검 / 재연결 실패 수')
     
     def get_or_create_tunnel(self, tunnel_key: str = "default") -> Optional[SSHTunnel]:
         """터널을 가져오거나 생성"""
@@ -92,19 +227,145 @@ class TunnelManager:
             return None
         
         with self.lock:
-            if tunnel_key not in self.tunnels:
+            tunnel = self.tunnels.get(tunnel_key)
+            if tunnel is None:
+                # 생성에 실패해도 백오프 상태가 남도록 먼저 등록 (SSH 접속은 매니저 락 밖에서 수행)
+                tunnel = SSHTunnel(self.tunnel_configs.get(tunnel_key))
+                self.tunnels[tunnel_key] = tunnel
+        
+        # 실패한 터널도 감시 스레드가 백오프에 따라 다시 시도
+        self._ensure_supervisor()
+        if not tunnel.is_active() and not self._open_tunnel(tunnel_key, tunnel):
+            return None
+        return tunnel
+
+    def _open_tunnel(self, tunnel_key: str, tunnel: SSHTunnel) -> bool:
+        """등록된 터널 최초 생성 (실패 시 재연결과 같은 지수 백오프)"""
+        with tunnel.recover_lock:
+            # 대기하는 동안 다른 스레드가 이미 생성한 경우
+            if tunnel.is_active():
+                return True
+            now = time.monotonic()
+            if now < tunnel.next_retry_at:
+                return False
+            try:
+                tunnel.create_tunnel()
+            except Exception as e:
+                self._record_failure(tunnel_key, tunnel, e, now, "SSH 터널 생성 실패")
+                return False
+            tunnel.failures = 0
+            tunnel.next_retry_at = 0.0
+        
+        self.logger.info(f"새로운 SSH 터널 생성: {tunnel_key} -> localhost:{tunnel.local_port}")
+        return True
+
+    def _record_failure(self, tunnel_key: str, tunnel: SSHTunnel, error: Exception, now: float, action: str) -> None:
+        """생성 / 재연결 실패 기록 후 다음 시도 시각 설정"""
+        tunnel.failures += 1
+        tunnel.last_error = str(error)[:300]
+        delay = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (tunnel.failures - 1))
+        tunnel.next_retry_at = now + delay
+        metrics_registry.inc('ssh_tunnel_failures_total')
+        self.logger.error(f"{action}: {tunnel_key} - {str(error)} ({delay}초 후 재시도)")
+
+    def _ensure_supervisor(self) -> None:
+        # fork 이후 자식 프로세스에는 스레드가 없으므로 PID 기준으로 재시작
+        pid = os.getpid()
+        if self._supervisor is not None and self._supervisor_pid == pid and self._supervisor.is_alive():
+            return
+        with self._supervisor_lock:
+            if self._supervisor is not None and self._supervisor_pid == pid and self._supervisor.is_alive():
+                return
+            self._supervisor_pid = pid
+            self._supervisor_stop = threading.Event()
+            self._supervisor = threading.Thread(
+                target=self._supervise, args=(self._supervisor_stop,), name='ssh-tunnel-supervisor', daemon=True
+            )
+            self._supervisor.start()
+
+    def _stop_supervisor(self) -> None:
+        """감시 스레드 종료 (다음 터널 생성 시 다시 시작)"""
+        with self._supervisor_lock:
+            self._supervisor_stop.set()
+            supervisor, self._supervisor = self._supervisor, None
+        if supervisor is not None and supervisor.is_alive() and supervisor is not threading.current_thread():
+            supervisor.join(self.probe_timeout_seconds + 1)
+
+    def _supervise(self, stop: threading.Event) -> None:
+        while not stop.wait(self.probe_interval_seconds):
+            for tunnel_key, tunnel in list(self.tunnels.items()):
+                if time.monotonic() < tunnel.next_retry_at:
+                    # 재연결 대기 중
+                    continue
                 try:
-                    tunnel = SSHTunnel()
-                    if tunnel.create_tunnel():
-                        self.tunnels[tunnel_key] = tunnel
-                        self.logger.info(f"새로운 SSH 터널 생성: {tunnel_key} -> localhost:{tunnel.local_port}")
-                    else:
-                        return None
+                    if tunnel.generation == 0:
+                        # 생성에 실패했던 터널은 백오프 이후 백그라운드에서 다시 생성
+                        self._open_tunnel(tunnel_key, tunnel)
+                        continue
+                    if tunnel.probe(self.probe_timeout_seconds):
+                        tunnel.failures = 0
+                        continue
+                    self.logger.warning(f"SSH 터널 점검 실패: {tunnel_key} (localhost:{tunnel.local_port})")
+                    metrics_registry.inc('ssh_tunnel_failures_total')
+                    self.recover_tunnel(tunnel_key, tunnel)
                 except Exception as e:
-                    self.logger.error(f"터널 생성 실패: {str(e)}")
-                    return None
-            
-            return self.tunnels[tunnel_key]
+                    self.logger.error(f"SSH 터널 감시 중 오류: {tunnel_key} - {str(e)}")
+
+    def recover_tunnel(self, tunnel_key: str, tunnel: SSHTunnel) -> bool:
+        """죽은 터널 재생성 (실패 시 지수 백오프)"""
+        generation = tunnel.generation
+        with tunnel.recover_lock:
+            # 대기하는 동안 다른 스레드가 이미 복구한 경우
+            if tunnel.generation != generation and tunnel.is_active():
+                return True
+            now = time.monotonic()
+            if now < tunnel.next_retry_at:
+                return False
+            try:
+                tunnel.reconnect()
+            except Exception as e:
+                self._record_failure(tunnel_key, tunnel, e, now, "SSH 터널 재연결 실패")
+                return False
+            tunnel.failures = 0
+            tunnel.next_retry_at = 0.0
+            tunnel.reconnects += 1
+        
+        metrics_registry.inc('ssh_tunnel_reconnects_total')
+        self.logger.warning(f"SSH 터널 재연결 완료: {tunnel_key} -> localhost:{tunnel.local_port}")
+        
+        # 죽은 터널로 맺어진 연결은 다음 체크아웃 시 새로 연결 (다른 터널의 연결은 유지)
+        for record in list(self.connection_records.get(tunnel_key, ())):
+            try:
+                record.invalidate(soft=True)
+            except Exception as e:
+                self.logger.error(f"커넥션 무효화 실패: {str(e)}")
+        return True
+
+    def connection_count(self, tunnel_key: str) -> int:
+        """터널을 사용 중인 DB 연결 수"""
+        return len(self.connection_records.get(tunnel_key, ()))
+
+    def get_pool(self, name: str = "default") -> TunnelPool:
+        """터널 풀 조회 / 생성 (SSH_TUNNEL_HOSTS x SSH_TUNNEL_POOL_SIZE)"""
+        with self.lock:
+            pool = self.pools.get(name)
+            if pool is not None:
+                return pool
+            hosts = list(getattr(settings, 'SSH_TUNNEL_HOSTS', None) or [{}])
+            if len(hosts) == 1 and self.pool_size == 1:
+                # 단일 터널은 기존 키("default")를 그대로 사용
+                member_keys = [name]
+                self.tunnel_configs[name] = hosts[0]
+            else:
+                member_keys = []
+                for host_index, host_config in enumerate(hosts):
+                    for index in range(self.pool_size):
+                        key = f"{name}-{host_index}-{index}"
+                        self.tunnel_configs[key] = host_config
+                        member_keys.append(key)
+            pool = TunnelPool(self, name, member_keys)
+            self.pools[name] = pool
+            return pool
     
     def close_tunnel(self, tunnel_key: str = "default") -> None:
         """특정 터널 종료"""
@@ -115,13 +376,77 @@ class TunnelManager:
                 self.logger.info(f"터널 종료: {tunnel_key}")
     
     def close_all_tunnels(self) -> None:
-        """모든 터널 종료"""
+        """모든 터널 및 감시 스레드 종료"""
+        self._stop_supervisor()
         with self.lock:
             for key, tunnel in self.tunnels.items():
                 tunnel.close_tunnel()
             self.tunnels.clear()
             self.logger.info("모든 SSH 터널 종료")
 
+    def reset_after_fork(self) -> None:
+        """fork 이후 자식 프로세스에서 부모의 터널을 닫지 않고 버림 (첫 DB 연결 시 새로 생성)"""
+        # 부모와 공유된 SSH 소켓에 종료 신호를 보내지 않도록 stop() 을 호출하지 않음
+        self.lock = threading.Lock()
+        self.tunnels = {}
+        self.connection_records = {}
+        self._supervisor = None
+        self._supervisor_lock = threading.Lock()
+        self._supervisor_stop = threading.Event()
+
+    def attach_to_engine(self, engine, tunnel_key: str = "default") -> None:
+        """엔진의 실제 DB 연결 시점에 풀에서 터널을 골라 접속 주소를 변경 (지연 생성)"""
+        from sqlalchemy import event
+
+        pool = self.get_pool(tunnel_key)
+
+        @event.listens_for(engine, 'do_connect')
+        def connect_through_tunnel(dialect, conn_rec, cargs, cparams):
+            selected = pool.select()
+            if selected is None:
+                # 터널 생성 실패 시 기본 데이터베이스 연결 사용
+                self.logger.warning(f"SSH 터널을 사용할 수 없어 기본 데이터베이스 연결을 사용합니다: {tunnel_key}")
+                conn_rec.info.pop('ssh_tunnel', None)
+                return None
+            key, tunnel = selected
+            conn_rec.info['ssh_tunnel'] = key
+            cparams['host'] = 'localhost'
+            cparams['port'] = tunnel.get_local_port()
+            return None
+
+        @event.listens_for(engine, 'connect')
+        def track_tunnel_connection(dbapi_connection, conn_rec):
+            key = conn_rec.info.get('ssh_tunnel')
+            if key is not None:
+                self.connection_records.setdefault(key, weakref.WeakSet()).add(conn_rec)
+
+        @event.listens_for(engine, 'close')
+        def untrack_tunnel_connection(dbapi_connection, conn_rec):
+            key = conn_rec.info.pop('ssh_tunnel', None)
+            if key is not None:
+                self.connection_records.get(key, weakref.WeakSet()).discard(conn_rec)
+
+        @event.listens_for(engine, 'detach')
+        def untrack_detached_connection(dbapi_connection, conn_rec):
+            untrack_tunnel_connection(dbapi_connection, conn_rec)
+
+    def get_stats(self) -> Dict[str, Dict[str, object]]:
+        """터널별 상태 조회"""
+        with self.lock:
+            tunnels = list(self.tunnels.items())
+        return {
+            key: {
+                'active': tunnel.is_active(),
+                'local_port': tunnel.get_local_port(),
+                'ssh_host': tunnel.ssh_host,
+                'connections': self.connection_count(key),
+                'reconnects': tunnel.reconnects,
+                'consecutive_failures': tunnel.failures,
+                'last_error': tunnel.last_error
+            }
+            for key, tunnel in tunnels
+        }
+
     def run_standalone_tunnel(self):
         """독립 실행용 터널링"""
         def signal_handler(sig, frame):
@@ -159,4 +484,6 @@ class TunnelManager:
 tunnel_manager = TunnelManager()
 
 # 앱 종료 시 자동 정리 등록
-atexit.register(tunnel_manager.close_all_tunnels)
\ No newline at end of file
+atexit.register(tunnel_manager.close_all_tunnels)
+
+runtime_registry.register('ssh_tunnels', tunnel_manager.get_stats)
\ No newline at end of file
@@ -0,0 +1,4 @@
+from app import create_app
+
+# WSGI 서버 진입점 (예: gunicorn wsgi:app)
+app = create_app()